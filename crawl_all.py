@@ -205,8 +205,7 @@ Examples:
     if args.list:
         print("\nAvailable cities:")
         print("-" * 50)
-        for city in list_cities():
-            print(f"  {city['key']:<15} {city['name']}")
+        print("\n".join(f"  {city.key:<15} {city.name}" for city in list_cities()))
         print("-" * 50)
         return
 
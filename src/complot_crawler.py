@@ -14,17 +14,29 @@ Examples:
 
 import argparse
 import asyncio
-import json
+import importlib.util
 import multiprocessing
-import re
+import multiprocessing.pool
+import multiprocessing.util
+import os
+import socket
 import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict
+from functools import partial
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import aiohttp
+import orjson
 from bs4 import BeautifulSoup
+
+try:
+    import uvloop  # Optional: faster event loop on Linux/macOS
+except ImportError:
+    uvloop = None
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn, MofNCompleteColumn
 
@@ -50,10 +62,14 @@ from src.config import CityConfig, get_city_config, list_cities
 from src.config import DEFAULT_SETTINGS
 from src.models import BuildingRecord, BuildingDetail, RequestDetail
 from src.utils.logging import setup_logging, get_logger
-from src.storage import CheckpointManager, DataExporter
-from src.fetchers.street_fetcher import async_discover_range
-from src.fetchers.record_fetcher import async_fetch_records_for_street
-from src.fetchers.building_fetcher import async_fetch_details_batch
+from src.storage import CheckpointManager, DataExporter, HtmlCache, compute_config_hash
+from src.parsers.building_parser import parse_building_detail
+from src.fetchers.base import BaseFetcher, aclose_shared_sessions, backoff_delay
+from src.fetchers.street_fetcher import StreetFetcher, async_discover_range
+from src.fetchers.record_fetcher import RecordFetcher, async_fetch_records_for_street
+from src.fetchers.building_fetcher import (
+    async_fetch_details_batch, error_detail, tik_url_template
+)
 from src.fetchers.request_fetcher import async_fetch_request_detail, async_fetch_requests_batch
 
 # API Configuration (using settings for consistency, will be fully migrated later)
@@ -64,14 +80,66 @@ REQUEST_TIMEOUT = _settings.request_timeout
 MAX_RETRIES = _settings.max_retries
 RETRY_DELAY = _settings.retry_delay
 SAVE_INTERVAL = _settings.save_interval
+CHECKPOINT_INTERVAL = _settings.checkpoint_interval
+CHECKPOINT_COMPACT_MIN = _settings.checkpoint_compact_min
+WORKER_MAX_TASKS = _settings.worker_max_tasks
+KEEPALIVE_TIMEOUT = _settings.keepalive_timeout
+DNS_CACHE_TTL = _settings.dns_cache_ttl
+EMPTY_CACHE_FILE = _settings.empty_cache_file
+RESPONSE_CACHE_FILE = _settings.response_cache_file
+
+# Every request goes to the same host, so the connector's per-host limit is what
+# actually bounds concurrency. Request fetches hold their semaphore slot through
+# retry backoff sleeps, so the semaphore gets some headroom above the connector
+# limit to keep sleeping retries from leaving pooled connections idle.
+FETCH_SEMAPHORE_SIZE = MAX_CONCURRENT + 10
+
+# Request headers shared by all detail fetches (Referer is added per city).
+# Brotli is only advertised when a decoder is installed for aiohttp to use.
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+_HAS_BROTLI = any(importlib.util.find_spec(m) for m in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate"
 
 # Logger setup (using centralized logging from src.utils.logging)
 logger = get_logger()
 
 
+def _create_connector(limit: int = MAX_CONCURRENT) -> aiohttp.TCPConnector:
+    """Create a connector capped per host, reaping connections the server closed uncleanly."""
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        # Connect over IPv4 only: no AAAA lookups or happy-eyeballs racing per connection
+        family=socket.AF_INET,
+        happy_eyeballs_delay=None,
+        enable_cleanup_closed=True,
+    )
+
+
+def _iter_worker_args(config_dict: dict, items: list, chunk_size: int):
+    """Lazily yield (config_dict, chunk, index) worker arguments for pool.imap."""
+    it = iter(items)
+    for i, chunk in enumerate(iter(lambda: list(islice(it, chunk_size)), [])):
+        yield (config_dict, chunk, i)
+
+
+def _chunk_len(total: int, chunk_size: int, index: int) -> int:
+    """Size of chunk `index` when `total` items are split into `chunk_size` pieces."""
+    return min(chunk_size, total - index * chunk_size)
+
+
+def _as_building_detail(detail: BuildingDetail | dict) -> BuildingDetail:
+    """Convert a raw detail dict (from a worker or checkpoint) to a BuildingDetail."""
+    return detail if isinstance(detail, BuildingDetail) else BuildingDetail(**detail)
+
+
 # ============================================================================
 # MULTIPROCESSING WORKER FUNCTIONS
-# These must be at module level to be picklable for multiprocessing.Pool
+# These must be at module level to be picklable for multiprocessing.Pool.
+# Results go back to the parent as one orjson blob: pickling thousands of
+# small dicts is far slower than pickling a single bytes object.
 # ============================================================================
 
 async def _async_discover_range(config_dict: dict, start: int, end: int) -> list[dict]:
@@ -79,11 +147,11 @@ async def _async_discover_range(config_dict: dict, start: int, end: int) -> list
     return await async_discover_range(config_dict, start, end)
 
 
-def _worker_discover_streets(args: tuple) -> list[dict]:
+def _worker_discover_streets(args: tuple) -> bytes:
     """Worker function for street discovery - runs in separate process"""
     config_dict, start, end, worker_id = args
-    result = asyncio.run(_async_discover_range(config_dict, start, end))
-    return result
+    result = _run_in_worker_loop(_async_discover_range(config_dict, start, end))
+    return orjson.dumps(result)
 
 
 async def _async_fetch_records_for_street(session: aiohttp.ClientSession, config_dict: dict, street: dict) -> list[dict]:
@@ -100,8 +168,8 @@ async def _async_fetch_records_batch(config_dict: dict, streets: list[dict]) ->
         async with semaphore:
             return await async_fetch_records_for_street(session, config_dict, street)
 
-    connector = aiohttp.TCPConnector(limit=20)
-    async with aiohttp.ClientSession(connector=connector) as session:
+    connector = _create_connector(20)
+    async with BaseFetcher.create_session(connector, config_dict.get('response_cache_path')) as session:
         for street in streets:
             records = await fetch_with_semaphore(session, street)
             all_records.extend(records)
@@ -109,11 +177,11 @@ async def _async_fetch_records_batch(config_dict: dict, streets: list[dict]) ->
     return all_records
 
 
-def _worker_fetch_records(args: tuple) -> list[dict]:
+def _worker_fetch_records(args: tuple) -> bytes:
     """Worker function for building records - runs in separate process"""
     config_dict, streets, worker_id = args
     result = asyncio.run(_async_fetch_records_batch(config_dict, streets))
-    return result
+    return orjson.dumps(result)
 
 
 async def _async_fetch_single_request(
@@ -131,23 +199,49 @@ async def _async_fetch_requests_batch(config_dict: dict, request_items: list[tup
     return await async_fetch_requests_batch(config_dict, request_items)
 
 
-def _worker_fetch_requests(args: tuple) -> list[dict]:
+def _worker_fetch_requests(args: tuple) -> bytes:
     """Worker function for request details - runs in separate process"""
     config_dict, request_items, worker_id = args
-    result = asyncio.run(_async_fetch_requests_batch(config_dict, request_items))
-    return result
+    result = _run_in_worker_loop(_async_fetch_requests_batch(config_dict, request_items))
+    return orjson.dumps(result)
 
 
-async def _async_fetch_details_batch(config_dict: dict, tik_numbers: list[str]) -> list[dict]:
+async def _async_fetch_details_batch(
+    config_dict: dict, tik_numbers: list[str], html_cache: Optional[HtmlCache] = None
+) -> list[dict]:
     """Async details fetch (delegates to fetchers.building_fetcher)"""
-    return await async_fetch_details_batch(config_dict, tik_numbers)
+    return await async_fetch_details_batch(config_dict, tik_numbers, html_cache=html_cache)
 
 
-def _worker_fetch_details(args: tuple) -> list[dict]:
+# Event loop kept alive for the life of a worker process, so the shared
+# sessions (bound to the loop) are reused across every batch the worker runs
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _close_worker_loop() -> None:
+    """Close the worker's shared sessions and event loop at process exit."""
+    global _worker_loop
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _worker_loop.run_until_complete(aclose_shared_sessions())
+        _worker_loop.close()
+    _worker_loop = None
+
+
+def _run_in_worker_loop(coro):
+    """Run a coroutine on this process's persistent event loop."""
+    global _worker_loop
+    if _worker_loop is None:
+        _worker_loop = asyncio.new_event_loop()
+        # Pool workers leave via os._exit, skipping atexit; Finalize still runs
+        multiprocessing.util.Finalize(None, _close_worker_loop, exitpriority=10)
+    return _worker_loop.run_until_complete(coro)
+
+
+def _worker_fetch_details(args: tuple, html_cache: Optional[HtmlCache] = None) -> bytes:
     """Worker function for building details - runs in separate process"""
     config_dict, tik_numbers, worker_id = args
-    result = asyncio.run(_async_fetch_details_batch(config_dict, tik_numbers))
-    return result
+    result = _run_in_worker_loop(_async_fetch_details_batch(config_dict, tik_numbers, html_cache))
+    return orjson.dumps(result)
 
 
 # ============================================================================
@@ -156,7 +250,14 @@ def _worker_fetch_details(args: tuple) -> list[dict]:
 
 
 class ComplotCrawler:
-    """Unified crawler for Complot building permit systems"""
+    """Unified crawler for Complot building permit systems
+
+    Use as a context manager (or call close()) so the worker and parse
+    pools started by the fetch phases are shut down:
+
+        with ComplotCrawler(config, workers=4) as crawler:
+            asyncio.run(crawler.fetch_building_records(streets))
+    """
 
     def __init__(self, config: CityConfig, output_dir: str = "data", israeli_id: Optional[str] = None, workers: int = 1):
         self.config = config
@@ -166,15 +267,110 @@ class ComplotCrawler:
         self.output_dir = Path(output_dir) / config.name_en
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize storage utilities
-        self.checkpoint = CheckpointManager(self.output_dir, config.name, config.name_en)
-        self.exporter = DataExporter(self.output_dir, config.name, config.name_en)
+        # Initialize storage utilities. The config hash lets them reject data
+        # saved under a different configuration instead of resuming from it.
+        self.config_hash = compute_config_hash(config)
+        self.checkpoint = CheckpointManager(self.output_dir, config.name, config.name_en, self.config_hash)
+        self.exporter = DataExporter(self.output_dir, config.name, config.name_en, self.config_hash)
+        self._last_save_time = 0.0
+        self._pool: Optional[multiprocessing.pool.Pool] = None
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._headers = {
+            "Referer": config.base_url,
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        self._tik_url_template = tik_url_template(config.site_id)
+        # Single-process discovery and record scans use the same fetchers as the workers
+        self._street_fetcher = StreetFetcher(config)
+        self._record_fetcher = RecordFetcher(config)
+        # Raw detail pages, so reruns within a week parse them offline
+        self.html_cache = HtmlCache(self.output_dir / "html_cache")
 
         # File paths for reading cached data
         self.streets_file = self.output_dir / "streets.json"
         self.records_file = self.output_dir / "building_records.json"
         self.details_file = self.output_dir / "building_details.json"
 
+    def _get_pool(self) -> multiprocessing.pool.Pool:
+        """Return the worker pool, creating it on first use.
+
+        The pool is shared by all phases of a crawl so worker processes are
+        only spawned once; it is shut down by close().
+        """
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers, maxtasksperchild=WORKER_MAX_TASKS)
+        return self._pool
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the HTML parse pool, creating it on first use.
+
+        Single-process detail fetching hands parsing to this pool so the
+        event loop keeps the semaphore full while pages are parsed on other
+        cores; it is shut down by close().
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._parse_pool
+
+    def close(self) -> None:
+        """Shut down the worker and parse pools, if they were started."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+        self.checkpoint.close()
+
+    def __enter__(self) -> "ComplotCrawler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _worker_config(self, force: bool = False) -> dict:
+        """City config as a dict for worker functions, plus per-run settings.
+
+        Besides the CityConfig fields it carries the 'force' flag and the
+        paths of the known-empty address cache and the response cache in
+        this city's output dir; a forced run gets no response cache.
+        """
+        return {
+            **asdict(self.config),
+            "force": force,
+            "empty_cache_path": str(self.output_dir / EMPTY_CACHE_FILE),
+            "response_cache_path": None if force else str(self.output_dir / RESPONSE_CACHE_FILE),
+        }
+
+    def _checkpoint_due(self) -> bool:
+        """Throttle checkpoint writes to at most one every CHECKPOINT_INTERVAL seconds."""
+        now = time.monotonic()
+        if now - self._last_save_time < CHECKPOINT_INTERVAL:
+            return False
+        self._last_save_time = now
+        return True
+
+    def _checkpoint_details(self, completed: dict, batch: list) -> None:
+        """Append a batch to the details checkpoint log, compacting it when it grows.
+
+        The log is compacted into a snapshot once it holds as many details as
+        the snapshot (and at least CHECKPOINT_COMPACT_MIN), so total checkpoint
+        I/O stays linear in the number of details.
+        """
+        logged = self.checkpoint.append_details(batch)
+        if logged >= max(CHECKPOINT_COMPACT_MIN, len(completed) - logged):
+            logger.debug(f"Compacting details checkpoint with {len(completed)} records")
+            self.checkpoint.save_details(completed.values())
+
+    def _load_cached_records(self) -> Optional[list[BuildingRecord]]:
+        """Load building records from a previous run, or None if unavailable or incompatible"""
+        data = self.checkpoint.load_data_file(self.records_file)
+        if 'records' not in data:
+            return None
+        return [BuildingRecord(**r) for r in data['records']]
+
     def _build_url(self, program: str, **params) -> str:
         """Build API URL with parameters"""
         param_str = "&".join(f"{k}={v}" for k, v in params.items())
@@ -186,74 +382,11 @@ class ComplotCrawler:
         semaphore: asyncio.Semaphore,
         street_code: int
     ) -> Optional[dict]:
-        """Test if a street code is valid"""
+        """Test if a street code is valid (delegates to StreetFetcher)"""
         async with semaphore:
-            house_numbers = [1, 2, 3, 5, 10, 20, 50]
-
-            for h in house_numbers:
-                if self.config.api_type == "tikim":
-                    url = self._build_url(
-                        "GetTikimByAddress",
-                        siteid=self.config.site_id,
-                        c=self.config.city_code,
-                        s=street_code,
-                        h=h,
-                        l="true",
-                        arguments="siteid,c,s,h,l"
-                    )
-                else:  # bakashot
-                    url = self._build_url(
-                        "GetBakashotByAddress",
-                        siteid=self.config.site_id,
-                        grp=0,
-                        t=1,
-                        c=self.config.city_code,
-                        s=street_code,
-                        h=h,
-                        l="true",
-                        arguments="siteId,grp,t,c,s,h,l"
-                    )
+            return await self._street_fetcher.test_street(session, street_code)
 
-                try:
-                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as resp:
-                        if resp.status != 200:
-                            continue
-                        html = await resp.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        text = soup.get_text()
-
-                        # Check for results
-                        if "נמצאו" in text and ("תיקי בניין" in text or "בקשות" in text):
-                            # Extract street name
-                            table = soup.find("table", {"id": "results-table"})
-                            if table:
-                                rows = table.select("tbody tr")
-                                if rows:
-                                    cells = rows[0].find_all("td")
-                                    # For bakashot API, address is in a specific column containing city name
-                                    # For tikim API, it's usually column 2
-                                    addr = None
-                                    for cell in cells:
-                                        cell_text = cell.get_text(strip=True)
-                                        # Address should contain the city name
-                                        if self.config.name in cell_text:
-                                            addr = cell_text
-                                            break
-
-                                    if addr:
-                                        # Extract street name (remove house number and city)
-                                        # Format: "STREET NUM CITY" or "STREET CITY"
-                                        parts = addr.replace(self.config.name, '').strip().rsplit(' ', 1)
-                                        street_name = parts[0].strip() if parts else addr
-                                        # Clean up the street name
-                                        if street_name and len(street_name) > 1:
-                                            return {"code": street_code, "name": street_name}
-                except Exception:
-                    continue
-
-            return None
-
-    async def _run_discovery(self) -> list[dict]:
+    async def _run_discovery(self, force: bool = False) -> list[dict]:
         """Run the actual street discovery process (API calls)"""
         logger.info("=" * 60)
         logger.info(f"DISCOVERING STREETS FOR {self.config.name} ({self.config.name_en})")
@@ -280,7 +413,7 @@ class ComplotCrawler:
                 ranges.append((chunk_start, chunk_end))
 
             # Prepare config dict for workers (must be picklable)
-            config_dict = asdict(self.config)
+            config_dict = self._worker_config(force)
 
             # Prepare worker arguments
             worker_args = [(config_dict, r[0], r[1], i) for i, r in enumerate(ranges)]
@@ -288,13 +421,14 @@ class ComplotCrawler:
             range_sizes = [r[1] - r[0] + 1 for r in ranges]
 
             # Run workers in parallel with progress bar
-            with multiprocessing.Pool(self.workers) as pool:
-                with create_progress() as progress:
-                    task = progress.add_task("[cyan]Discovering streets", total=total_range)
-                    for i, result in enumerate(pool.imap(_worker_discover_streets, worker_args)):
-                        streets.extend(result)
-                        # Update by actual range size (handles uneven chunks)
-                        progress.update(task, advance=range_sizes[i], description=f"[cyan]Discovering streets [found={len(streets)}]")
+            pool = self._get_pool()
+            with create_progress() as progress:
+                task = progress.add_task("[cyan]Discovering streets", total=total_range)
+                for i, blob in enumerate(pool.imap(_worker_discover_streets, worker_args)):
+                    result = orjson.loads(blob)
+                    streets.extend(result)
+                    # Update by actual range size (handles uneven chunks)
+                    progress.update(task, advance=range_sizes[i], description=f"[cyan]Discovering streets [found={len(streets)}]")
 
             elapsed = time.time() - start_time
             logger.info(f"All workers completed in {elapsed:.1f}s. Total streets found: {len(streets)}")
@@ -303,7 +437,7 @@ class ComplotCrawler:
             # Single-process mode: original async implementation
             semaphore = asyncio.Semaphore(MAX_CONCURRENT)
 
-            connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+            connector = _create_connector()
             async with aiohttp.ClientSession(connector=connector) as session:
                 tasks = [
                     self._test_street(session, semaphore, s)
@@ -343,15 +477,14 @@ class ComplotCrawler:
         # Load baseline for comparison (if exists and not forcing)
         if self.streets_file.exists() and not force:
             logger.info(f"Loading baseline streets from {self.streets_file} for incremental detection")
-            with open(self.streets_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                baseline_streets = data.get('streets', [])
-                baseline_codes = {s['code'] for s in baseline_streets}
-                previous_total = len(baseline_streets)
-                logger.info(f"Baseline has {previous_total} streets")
+            data = orjson.loads(self.streets_file.read_bytes())
+            baseline_streets = data.get('streets', [])
+            baseline_codes = {s['code'] for s in baseline_streets}
+            previous_total = len(baseline_streets)
+            logger.info(f"Baseline has {previous_total} streets")
 
         # Run fresh discovery
-        fresh_streets = await self._run_discovery()
+        fresh_streets = await self._run_discovery(force)
         fresh_codes = {s['code'] for s in fresh_streets}
 
         # Compute diff
@@ -383,147 +516,20 @@ class ComplotCrawler:
         semaphore: asyncio.Semaphore,
         street: dict
     ) -> list[BuildingRecord]:
-        """Fetch all building records for a street"""
-        records = []
-        street_code = street['code']
-        street_name = street['name']
-        consecutive_empty = 0
-        max_consecutive_empty = 30  # Stop after 30 consecutive empty results
-
+        """Fetch all building records for a street (delegates to RecordFetcher)"""
         async with semaphore:
-            for house_num in range(1, 500):  # Try house numbers 1-499
-                if self.config.api_type == "tikim":
-                    url = self._build_url(
-                        "GetTikimByAddress",
-                        siteid=self.config.site_id,
-                        c=self.config.city_code,
-                        s=street_code,
-                        h=house_num,
-                        l="true",
-                        arguments="siteid,c,s,h,l"
-                    )
-                else:
-                    url = self._build_url(
-                        "GetBakashotByAddress",
-                        siteid=self.config.site_id,
-                        grp=0,
-                        t=1,
-                        c=self.config.city_code,
-                        s=street_code,
-                        h=house_num,
-                        l="true",
-                        arguments="siteId,grp,t,c,s,h,l"
-                    )
-
-                try:
-                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as resp:
-                        if resp.status != 200:
-                            continue
-                        html = await resp.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-
-                        # Check for no results
-                        if "לא אותרו" in soup.get_text() or "לא ניתן" in soup.get_text():
-                            consecutive_empty += 1
-                            if consecutive_empty >= max_consecutive_empty:
-                                break  # Early exit - no more results expected
-                            continue
-
-                        # Parse results table
-                        table = soup.find("table", {"id": "results-table"})
-                        if not table:
-                            consecutive_empty += 1
-                            if consecutive_empty >= max_consecutive_empty:
-                                break
-                            continue
-
-                        rows = table.select("tbody tr")
-                        if not rows:
-                            consecutive_empty += 1
-                            if consecutive_empty >= max_consecutive_empty:
-                                break
-                            continue
-
-                        # Found results - reset counter
-                        consecutive_empty = 0
-                        for row in rows:
-                            cells = row.find_all("td")
-                            if len(cells) < 3:
-                                continue
-
-                            # Extract tik number from link
-                            tik = None
-
-                            # Look for getBuilding link (has tik number)
-                            for link in row.find_all("a", href=True):
-                                href = str(link.get("href", ""))
-                                if "getBuilding" in href:
-                                    match = re.search(r'getBuilding\((\d+)\)', href)
-                                    if match:
-                                        tik = match.group(1)
-                                        break
-
-                            if not tik:
-                                # For tikim API, first link might be the tik
-                                link = row.find("a", href=True)
-                                if link:
-                                    text = link.get_text(strip=True)
-                                    if text.isdigit():
-                                        tik = text
-                                    else:
-                                        match = re.search(r'\d+', text)
-                                        if match:
-                                            tik = match.group()
-
-                            if not tik:
-                                continue
-
-                            # Get address - look for cell containing city name
-                            address = ""
-                            for cell in cells:
-                                text = cell.get_text(strip=True)
-                                if self.config.name in text:
-                                    address = text
-                                    break
-
-                            # Get gush/helka if available (usually in last columns)
-                            gush = ""
-                            helka = ""
-                            # Look for numeric cells at the end that could be gush/helka
-                            numeric_cells = []
-                            for cell in reversed(cells):
-                                text = cell.get_text(strip=True)
-                                if text.isdigit() and len(text) <= 6:
-                                    numeric_cells.append(text)
-                                elif numeric_cells:
-                                    break
-                            if len(numeric_cells) >= 2:
-                                helka = numeric_cells[0]
-                                gush = numeric_cells[1]
-
-                            record = BuildingRecord(
-                                tik_number=tik,
-                                address=address,
-                                gush=gush,
-                                helka=helka,
-                                street_code=street_code,
-                                street_name=street_name,
-                                house_number=house_num
-                            )
-                            records.append(record)
-
-                except Exception:
-                    continue
-
-        return records
+            return [
+                BuildingRecord(**r)
+                async for r in self._record_fetcher.iter_records_for_street(session, street)
+            ]
 
     async def fetch_building_records(self, streets: list[dict], force: bool = False) -> list[BuildingRecord]:
         """Fetch all building records for all streets"""
-        if self.records_file.exists() and not force:
-            logger.info(f"Loading cached records from {self.records_file}")
-            with open(self.records_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [BuildingRecord(**r) for r in data.get('records', [])]
+        if not force:
+            cached = self._load_cached_records()
+            if cached is not None:
+                logger.info(f"Loaded cached records from {self.records_file}")
+                return cached
 
         logger.info("=" * 60)
         logger.info(f"FETCHING BUILDING RECORDS FOR {self.config.name}")
@@ -541,31 +547,27 @@ class ComplotCrawler:
             # Use small fixed chunk size for granular progress updates
             # Each chunk completes quickly, providing frequent progress updates
             chunk_size = 10  # Small chunks for responsive progress bar
-            street_chunks = []
-            for i in range(0, len(streets), chunk_size):
-                chunk = streets[i:i + chunk_size]
-                if chunk:
-                    street_chunks.append(chunk)
 
             # Prepare config dict for workers
-            config_dict = asdict(self.config)
+            config_dict = self._worker_config(force)
 
             # Prepare worker arguments
-            worker_args = [(config_dict, chunk, i) for i, chunk in enumerate(street_chunks)]
+            worker_args = _iter_worker_args(config_dict, streets, chunk_size)
 
             # Run workers in parallel with progress bar
-            with multiprocessing.Pool(self.workers) as pool:
-                with create_progress() as progress:
-                    task = progress.add_task("[green]Fetching records", total=len(streets))
-                    for i, result in enumerate(pool.imap(_worker_fetch_records, worker_args)):
-                        # Merge and deduplicate results
-                        for r in result:
-                            if r['tik_number'] not in seen_tiks:
-                                seen_tiks.add(r['tik_number'])
-                                all_records.append(BuildingRecord(**r))
-                        # Update by actual chunk size (handles uneven last chunk)
-                        actual_chunk_size = len(street_chunks[i])
-                        progress.update(task, advance=actual_chunk_size, description=f"[green]Fetching records [records={len(all_records)}]")
+            pool = self._get_pool()
+            with create_progress() as progress:
+                task = progress.add_task("[green]Fetching records", total=len(streets))
+                for i, blob in enumerate(pool.imap(_worker_fetch_records, worker_args)):
+                    result = orjson.loads(blob)
+                    # Merge and deduplicate results
+                    for r in result:
+                        if r['tik_number'] not in seen_tiks:
+                            seen_tiks.add(r['tik_number'])
+                            all_records.append(BuildingRecord(**r))
+                    # Update by actual chunk size (handles uneven last chunk)
+                    actual_chunk_size = _chunk_len(len(streets), chunk_size, i)
+                    progress.update(task, advance=actual_chunk_size, description=f"[green]Fetching records [records={len(all_records)}]")
 
             elapsed = time.time() - start_time
             logger.info(f"All workers completed in {elapsed:.1f}s. Total records found: {len(all_records)}")
@@ -574,7 +576,7 @@ class ComplotCrawler:
             # Single-process mode: original async implementation
             semaphore = asyncio.Semaphore(5)  # Lower concurrency for full street scans
 
-            connector = aiohttp.TCPConnector(limit=20)
+            connector = _create_connector(20)
             async with aiohttp.ClientSession(connector=connector) as session:
                 with create_progress() as progress:
                     task = progress.add_task("[green]Fetching records", total=len(streets))
@@ -602,98 +604,13 @@ class ComplotCrawler:
         logger.info(f"Fetched {len(all_records)} unique building records. Saved to {self.records_file}")
         return all_records
 
-    def _parse_building_detail(self, html: str, tik_number: str) -> BuildingDetail:
-        """Parse building detail HTML response"""
-        soup = BeautifulSoup(html, 'html.parser')
-        detail = BuildingDetail(tik_number=tik_number)
-        detail.fetched_at = datetime.now().isoformat()
-
-        # Check for error responses
-        text = soup.get_text()
-        if 'לא ניתן להציג את המידע המבוקש' in text or 'לא אותרו תוצאות' in text:
-            detail.fetch_status = "error"
-            detail.fetch_error = "No data available"
-            return detail
+    def _parse_bakasha_detail(self, html: str | bytes, tik_number: str, encoding: Optional[str] = None) -> BuildingDetail:
+        """Parse bakasha (request) detail HTML response
 
-        # Extract address from header
-        header_divs = soup.select('#result-title-div-id .top-navbar-info-desc')
-        for i, div in enumerate(header_divs):
-            if 'כתובת' in div.get_text():
-                if i + 1 < len(header_divs):
-                    detail.address = header_divs[i + 1].get_text(strip=True)
-
-        # Extract neighborhood
-        info_main = soup.select_one('#info-main')
-        if info_main:
-            for row in info_main.select('tr'):
-                cells = row.select('td')
-                if len(cells) >= 2:
-                    label = cells[0].get_text(strip=True)
-                    value = cells[1].get_text(strip=True)
-                    if 'שכונה' in label:
-                        detail.neighborhood = value
-
-        # Extract addresses
-        addresses_div = soup.select_one('#addresses')
-        if addresses_div:
-            for row in addresses_div.select('tbody tr'):
-                addr = row.get_text(strip=True)
-                if addr:
-                    detail.addresses.append(addr)
-
-        # Extract gush/helka
-        gush_table = soup.select_one('#table-gushim-helkot')
-        if gush_table:
-            for row in gush_table.select('tbody tr'):
-                cells = row.select('td')
-                if len(cells) >= 5:
-                    gush_info = {
-                        'gush': cells[1].get_text(strip=True),
-                        'helka': cells[2].get_text(strip=True),
-                        'migrash': cells[3].get_text(strip=True),
-                        'plan_number': cells[4].get_text(strip=True)
-                    }
-                    if gush_info['gush']:
-                        detail.gush_helka.append(gush_info)
-
-        # Extract requests/permits
-        requests_table = soup.select_one('#table-requests')
-        if requests_table:
-            for row in requests_table.select('tbody tr'):
-                cells = row.select('td')
-                if len(cells) >= 7:
-                    request_info = {
-                        'request_number': cells[1].get_text(strip=True),
-                        'submission_date': cells[2].get_text(strip=True),
-                        'last_event': cells[3].get_text(strip=True),
-                        'applicant_name': cells[4].get_text(strip=True),
-                        'permit_number': cells[5].get_text(strip=True),
-                        'permit_date': cells[6].get_text(strip=True)
-                    }
-                    if request_info['request_number']:
-                        detail.requests.append(request_info)
-
-        # Extract plans
-        plans_table = soup.select_one('#table-taba')
-        if plans_table:
-            for row in plans_table.select('tbody tr'):
-                cells = row.select('td')
-                if len(cells) >= 5 and 'לא אותרו' not in row.get_text():
-                    plan_info = {
-                        'plan_number': cells[1].get_text(strip=True),
-                        'plan_name': cells[2].get_text(strip=True),
-                        'status': cells[3].get_text(strip=True),
-                        'status_date': cells[4].get_text(strip=True)
-                    }
-                    if plan_info['plan_number']:
-                        detail.plans.append(plan_info)
-
-        detail.fetch_status = "success"
-        return detail
-
-    def _parse_bakasha_detail(self, html: str, tik_number: str) -> BuildingDetail:
-        """Parse bakasha (request) detail HTML response"""
-        soup = BeautifulSoup(html, 'html.parser')
+        encoding is the charset the response declared, if any; without one
+        BeautifulSoup detects the encoding of raw bytes itself.
+        """
+        soup = BeautifulSoup(html, 'html.parser', from_encoding=encoding if isinstance(html, bytes) else None)
         detail = BuildingDetail(tik_number=tik_number)
         detail.fetched_at = datetime.now().isoformat()
 
@@ -811,39 +728,42 @@ class ComplotCrawler:
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
         request_number: str,
-        israeli_id: str,
-        retry: int = 0
+        israeli_id: str
     ) -> BuildingDetail:
         """Fetch details for a single bakasha (request) with ID authentication"""
-        async with semaphore:
-            url = self._build_url(
-                "GetBakashaFile",
-                siteid=self.config.site_id,
-                ession=request_number,
-                ession2=israeli_id,
-                arguments="siteid,ession,ession2"
-            )
-
-            headers = {
-                "Referer": self.config.base_url,
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
-
+        url = self._build_url(
+            "GetBakashaFile",
+            siteid=self.config.site_id,
+            ession=request_number,
+            ession2=israeli_id,
+            arguments="siteid,ession,ession2"
+        )
+
+        # The semaphore covers only the request itself, so a retry sleeping
+        # through its backoff does not hold a concurrency slot
+        for attempt in range(MAX_RETRIES + 1):
             try:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as resp:
-                    if resp.status == 200:
-                        html = await resp.text()
-                        return self._parse_bakasha_detail(html, request_number)
-                    else:
-                        detail = BuildingDetail(tik_number=request_number)
-                        detail.fetch_status = "error"
-                        detail.fetch_error = f"HTTP {resp.status}"
-                        return detail
+                async with semaphore:
+                    async with session.get(url, headers=self._headers, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as resp:
+                        status = resp.status
+                        # Hand the raw bytes and the HTTP charset to the parser, so the
+                        # Hebrew text is not left to BeautifulSoup's encoding guess
+                        # Decoded with the response's charset, as the worker path
+                        # does; the cache then stores the page as UTF-8
+                        html = await resp.text() if status == 200 else None
+                        charset = resp.charset
+
+                if html is not None:
+                    return self._parse_bakasha_detail(html, request_number, charset)
+                detail = BuildingDetail(tik_number=request_number)
+                detail.fetch_status = "error"
+                detail.fetch_error = f"HTTP {status}"
+                return detail
 
             except asyncio.TimeoutError:
-                if retry < MAX_RETRIES:
-                    await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                    return await self._fetch_single_bakasha_detail(session, semaphore, request_number, israeli_id, retry + 1)
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
                 detail = BuildingDetail(tik_number=request_number)
                 detail.fetch_status = "error"
                 detail.fetch_error = "Timeout"
@@ -860,51 +780,64 @@ class ComplotCrawler:
         session: aiohttp.ClientSession,
         semaphore: asyncio.Semaphore,
         tik_number: str,
-        retry: int = 0
-    ) -> BuildingDetail:
-        """Fetch details for a single building"""
-        async with semaphore:
-            url = self._build_url(
-                "GetTikFile",
-                siteid=self.config.site_id,
-                t=tik_number,
-                arguments="siteid,t"
-            )
-
-            # Add referer header for the request
-            headers = {
-                "Referer": self.config.base_url,
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-            }
+        force: bool = False
+    ) -> dict:
+        """Fetch details for a single building as a plain dict (see parse_building_detail)
 
+        With force (or when retrying an error) the HTML cache is not read, so
+        the page is always downloaded; pages are cached once they parse
+        successfully.
+        """
+        headers = self._headers
+        if not force:
+            # A page fetched on a recent run is parsed from the cache instead
+            html = self.html_cache.get(tik_number)
+            if html is not None:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._get_parse_pool(), parse_building_detail, html, tik_number
+                )
+            # An expired cached page is revalidated instead of re-downloaded
+            headers = {**headers, **self.html_cache.conditional_headers(tik_number)}
+
+        url = self._tik_url_template.format(tik=tik_number)
+
+        # The semaphore covers only the request itself: a retry sleeping through
+        # its backoff, or a page being parsed, does not hold a concurrency slot
+        for attempt in range(MAX_RETRIES + 1):
             try:
-                async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as resp:
-                    if resp.status == 200:
-                        html = await resp.text()
-                        return self._parse_building_detail(html, tik_number)
-                    else:
-                        detail = BuildingDetail(tik_number=tik_number)
-                        detail.fetch_status = "error"
-                        detail.fetch_error = f"HTTP {resp.status}"
-                        return detail
+                async with semaphore:
+                    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)) as resp:
+                        status = resp.status
+                        # Decoded with the response's charset, as the worker path
+                        # does; the cache then stores the page as UTF-8
+                        html = await resp.text() if status == 200 else None
+
+                fresh = html is not None
+                if status == 304 and not force:
+                    html = self.html_cache.refresh(tik_number)
+
+                if html is not None:
+                    # Parse in the pool so the event loop is never blocked
+                    detail = await asyncio.get_running_loop().run_in_executor(
+                        self._get_parse_pool(), parse_building_detail, html, tik_number
+                    )
+                    # Only cache pages worth replaying (not "No data available")
+                    if fresh and detail['fetch_status'] == 'success':
+                        self.html_cache.put(tik_number, html, resp.headers)
+                    return detail
+                return error_detail(tik_number, f"HTTP {status}")
 
             except asyncio.TimeoutError:
-                if retry < MAX_RETRIES:
-                    await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                    return await self._fetch_single_detail(session, semaphore, tik_number, retry + 1)
-                detail = BuildingDetail(tik_number=tik_number)
-                detail.fetch_status = "error"
-                detail.fetch_error = "Timeout"
-                return detail
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                return error_detail(tik_number, "Timeout")
 
             except Exception as e:
-                detail = BuildingDetail(tik_number=tik_number)
-                detail.fetch_status = "error"
-                detail.fetch_error = str(e)
-                return detail
+                return error_detail(tik_number, str(e))
 
-    async def fetch_building_details(self, records: list[BuildingRecord], resume: bool = True) -> list[BuildingDetail]:
-        """Fetch detailed information for all building records"""
+    async def fetch_building_details(self, records: list[BuildingRecord], resume: bool = True, force: bool = False) -> list[BuildingDetail]:
+        """Fetch detailed information for all building records (force: bypass the HTML cache)"""
 
         # For bakashot systems, detailed info requires authentication
         if self.config.api_type == "bakashot":
@@ -912,9 +845,9 @@ class ComplotCrawler:
                 logger.warning("Bakashot API requires ID authentication for permit details")
                 logger.warning("Use --id <israeli_id> to fetch full permit information")
                 logger.info("Using building records data for basic details")
-                details = []
-                for r in records:
-                    detail = BuildingDetail(
+                now_iso = datetime.now().isoformat()
+                return [
+                    BuildingDetail(
                         tik_number=r.tik_number,
                         address=r.address,
                         addresses=[r.address] if r.address else [],
@@ -925,23 +858,26 @@ class ComplotCrawler:
                             'plan_number': ''
                         }] if r.gush else [],
                         fetch_status="from_records",
-                        fetched_at=datetime.now().isoformat()
+                        fetched_at=now_iso
                     )
-                    details.append(detail)
-                return details
+                    for r in records
+                ]
             else:
                 # Use authenticated bakasha API
                 logger.info("Using authenticated bakashot API with provided ID")
                 return await self._fetch_bakasha_details_authenticated(records, resume)
 
-        tik_numbers = list(set(r.tik_number for r in records))
+        # Unique tiks in record order (a tik has one record per address); unlike
+        # set(), this keeps the fetch order stable from run to run
+        tik_numbers = list(dict.fromkeys(r.tik_number for r in records))
 
-        # Load checkpoint if resuming
+        # Load checkpoint if resuming. Entries stay as raw dicts (as do worker
+        # results) and are only turned into BuildingDetail once, at the end.
         completed = {}
         if resume:
             data = self.checkpoint.load_details_checkpoint()
             if 'details' in data:
-                completed = {d['tik_number']: BuildingDetail(**d) for d in data['details']}
+                completed = {d['tik_number']: d for d in data['details']}
 
         remaining = [t for t in tik_numbers if t not in completed]
 
@@ -954,7 +890,7 @@ class ComplotCrawler:
 
         if not remaining:
             logger.info("All details already fetched!")
-            return list(completed.values())
+            return [_as_building_detail(d) for d in completed.values()]
 
         start_time = time.time()
         total_success = 0
@@ -966,75 +902,71 @@ class ComplotCrawler:
 
             # Use small fixed chunk size for granular progress updates
             chunk_size = 20  # Small chunks for responsive progress bar
-            tik_chunks = []
-            for i in range(0, len(remaining), chunk_size):
-                chunk = remaining[i:i + chunk_size]
-                if chunk:
-                    tik_chunks.append(chunk)
 
             # Prepare config dict for workers
-            config_dict = asdict(self.config)
+            config_dict = self._worker_config(force)
 
             # Prepare worker arguments
-            worker_args = [(config_dict, chunk, i) for i, chunk in enumerate(tik_chunks)]
+            worker_args = _iter_worker_args(config_dict, remaining, chunk_size)
 
             # Run workers in parallel with progress bar
-            with multiprocessing.Pool(self.workers) as pool:
-                with create_progress() as progress:
-                    task = progress.add_task("[yellow]Fetching details", total=len(remaining))
-                    for i, result in enumerate(pool.imap(_worker_fetch_details, worker_args)):
-                        # Merge results
-                        for d in result:
-                            detail = BuildingDetail(**d)
-                            completed[d['tik_number']] = detail
-                            if d['fetch_status'] == 'success':
-                                total_success += 1
-                            else:
-                                total_errors += 1
-                        # Update by actual chunk size
-                        progress.update(task, advance=len(tik_chunks[i]), description=f"[yellow]Fetching details [ok={total_success}, err={total_errors}]")
+            pool = self._get_pool()
+            with create_progress() as progress:
+                task = progress.add_task("[yellow]Fetching details", total=len(remaining))
+                for i, blob in enumerate(pool.imap(partial(_worker_fetch_details, html_cache=self.html_cache), worker_args)):
+                    result = orjson.loads(blob)
+                    # Merge results
+                    for d in result:
+                        completed[d['tik_number']] = d
+                        if d['fetch_status'] == 'success':
+                            total_success += 1
+                        else:
+                            total_errors += 1
+                    self._checkpoint_details(completed, result)
+                    # Update by actual chunk size
+                    progress.update(task, advance=_chunk_len(len(remaining), chunk_size, i), description=f"[yellow]Fetching details [ok={total_success}, err={total_errors}]")
 
             elapsed = time.time() - start_time
             logger.info(f"All workers completed in {elapsed:.1f}s. Total details fetched: {len(remaining)}")
 
         else:
             # Single-process mode: original async implementation
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+            semaphore = asyncio.Semaphore(FETCH_SEMAPHORE_SIZE)
 
-            connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+            connector = _create_connector()
             async with aiohttp.ClientSession(connector=connector) as session:
-                batch_size = SAVE_INTERVAL
-
                 with create_progress() as progress:
                     task = progress.add_task("[yellow]Fetching details", total=len(remaining))
-                    for batch_idx in range(0, len(remaining), batch_size):
-                        batch = remaining[batch_idx:batch_idx + batch_size]
 
-                        tasks = [self._fetch_single_detail(session, semaphore, tik) for tik in batch]
-                        results = await asyncio.gather(*tasks)
+                    # Schedule everything up front; the semaphore bounds the number in
+                    # flight, and a new fetch starts as soon as any one finishes.
+                    tasks = [asyncio.create_task(self._fetch_single_detail(session, semaphore, tik, force)) for tik in remaining]
+                    batch = []
+                    for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                        result = await next_result
+                        completed[result['tik_number']] = result
+                        batch.append(result)
 
-                        for result in results:
-                            completed[result.tik_number] = result
-
-                        success = sum(1 for r in results if r.fetch_status == 'success')
-                        errors = sum(1 for r in results if r.fetch_status == 'error')
-                        total_success += success
-                        total_errors += errors
-
-                        # Log any errors in this batch
-                        for r in results:
-                            if r.fetch_status == 'error':
-                                logger.debug(f"Error fetching tik {r.tik_number}: {r.fetch_error}")
+                        if result['fetch_status'] == 'success':
+                            total_success += 1
+                        elif result['fetch_status'] == 'error':
+                            total_errors += 1
+                            logger.debug(f"Error fetching tik {result['tik_number']}: {result['fetch_error']}")
 
-                        progress.update(task, advance=len(batch), description=f"[yellow]Fetching details [ok={total_success}, err={total_errors}]")
+                        progress.update(task, advance=1, description=f"[yellow]Fetching details [ok={total_success}, err={total_errors}]")
 
                         # Save checkpoint
-                        logger.debug(f"Saving checkpoint with {len(completed)} records")
-                        self.checkpoint.save_details(list(completed.values()))
+                        if done % SAVE_INTERVAL == 0:
+                            self._checkpoint_details(completed, batch)
+                            batch = []
 
-        # Save final results
-        all_details = list(completed.values())
-        self.exporter.export_details(all_details)
+                    self._checkpoint_details(completed, batch)
+
+        # Save final results (the exporter accepts raw dicts as well as dataclasses).
+        # Checkpoint and export writers take the live values() view, so no
+        # intermediate list copy of `completed` is made per save.
+        self.exporter.export_details(completed.values())
+        all_details = [_as_building_detail(d) for d in completed.values()]
 
         logger.info(f"Fetched {len(all_details)} building details ({total_success} ok, {total_errors} errors). Saved to {self.details_file}")
         return all_details
@@ -1046,15 +978,16 @@ class ComplotCrawler:
             return []
 
         # Load existing details
-        with open(self.details_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = self.checkpoint.load_data_file(self.details_file)
+        if not data:
+            return []
 
-        all_details = {d['tik_number']: BuildingDetail(**d) for d in data.get('records', [])}
-        failed_tiks = [tik for tik, detail in all_details.items() if detail.fetch_status == 'error']
+        all_details = {d['tik_number']: d for d in data.get('records', [])}
+        failed_tiks = [tik for tik, d in all_details.items() if d['fetch_status'] == 'error']
 
         if not failed_tiks:
             logger.info("No failed records to retry!")
-            return list(all_details.values())
+            return [_as_building_detail(d) for d in all_details.values()]
 
         logger.info("=" * 60)
         logger.info(f"RETRYING FAILED DETAILS FOR {self.config.name}")
@@ -1072,57 +1005,48 @@ class ComplotCrawler:
 
             # Use small fixed chunk size for granular progress updates
             chunk_size = 20  # Small chunks for responsive progress bar
-            tik_chunks = []
-            for i in range(0, len(failed_tiks), chunk_size):
-                chunk = failed_tiks[i:i + chunk_size]
-                if chunk:
-                    tik_chunks.append(chunk)
 
-            config_dict = asdict(self.config)
-            worker_args = [(config_dict, chunk, i) for i, chunk in enumerate(tik_chunks)]
+            # Errors are retried against the server, never the HTML cache
+            config_dict = self._worker_config(force=True)
+            worker_args = _iter_worker_args(config_dict, failed_tiks, chunk_size)
 
-            with multiprocessing.Pool(self.workers) as pool:
-                with create_progress() as progress:
-                    task = progress.add_task("[yellow]Retrying failed", total=len(failed_tiks))
-                    for i, result in enumerate(pool.imap(_worker_fetch_details, worker_args)):
-                        for d in result:
-                            detail = BuildingDetail(**d)
-                            all_details[d['tik_number']] = detail
-                            if d['fetch_status'] == 'success':
-                                total_success += 1
-                            else:
-                                total_errors += 1
-                        # Update by actual chunk size
-                        progress.update(task, advance=len(tik_chunks[i]), description=f"[yellow]Retrying failed [ok={total_success}, err={total_errors}]")
+            pool = self._get_pool()
+            with create_progress() as progress:
+                task = progress.add_task("[yellow]Retrying failed", total=len(failed_tiks))
+                for i, blob in enumerate(pool.imap(partial(_worker_fetch_details, html_cache=self.html_cache), worker_args)):
+                    result = orjson.loads(blob)
+                    for d in result:
+                        all_details[d['tik_number']] = d
+                        if d['fetch_status'] == 'success':
+                            total_success += 1
+                        else:
+                            total_errors += 1
+                    # Update by actual chunk size
+                    progress.update(task, advance=_chunk_len(len(failed_tiks), chunk_size, i), description=f"[yellow]Retrying failed [ok={total_success}, err={total_errors}]")
 
         else:
             # Single-process mode
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-            connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+            semaphore = asyncio.Semaphore(FETCH_SEMAPHORE_SIZE)
+            connector = _create_connector()
 
             async with aiohttp.ClientSession(connector=connector) as session:
-                batch_size = SAVE_INTERVAL
-
                 with create_progress() as progress:
                     task = progress.add_task("[yellow]Retrying failed", total=len(failed_tiks))
-                    for batch_idx in range(0, len(failed_tiks), batch_size):
-                        batch = failed_tiks[batch_idx:batch_idx + batch_size]
 
-                        tasks = [self._fetch_single_detail(session, semaphore, tik) for tik in batch]
-                        results = await asyncio.gather(*tasks)
-
-                        for result in results:
-                            all_details[result.tik_number] = result
-                            if result.fetch_status == 'success':
-                                total_success += 1
-                            else:
-                                total_errors += 1
+                    tasks = [asyncio.create_task(self._fetch_single_detail(session, semaphore, tik, force=True)) for tik in failed_tiks]
+                    for next_result in asyncio.as_completed(tasks):
+                        result = await next_result
+                        all_details[result['tik_number']] = result
+                        if result['fetch_status'] == 'success':
+                            total_success += 1
+                        else:
+                            total_errors += 1
 
-                        progress.update(task, advance=len(batch), description=f"[yellow]Retrying failed [ok={total_success}, err={total_errors}]")
+                        progress.update(task, advance=1, description=f"[yellow]Retrying failed [ok={total_success}, err={total_errors}]")
 
         # Save updated results
-        details_list = list(all_details.values())
-        self.exporter.export_details(details_list)
+        self.exporter.export_details(all_details.values())
+        details_list = [_as_building_detail(d) for d in all_details.values()]
 
         elapsed = time.time() - start_time
         success_count = sum(1 for d in details_list if d.fetch_status == 'success')
@@ -1186,64 +1110,58 @@ class ComplotCrawler:
 
             # Use small fixed chunk size for granular progress updates
             chunk_size = 20  # Small chunks for responsive progress bar
-            request_chunks = []
-            for i in range(0, len(remaining), chunk_size):
-                chunk = remaining[i:i + chunk_size]
-                if chunk:
-                    request_chunks.append(chunk)
 
-            config_dict = asdict(self.config)
-            worker_args = [(config_dict, chunk, i) for i, chunk in enumerate(request_chunks)]
+            config_dict = self._worker_config(force)
+            worker_args = _iter_worker_args(config_dict, remaining, chunk_size)
 
-            with multiprocessing.Pool(self.workers) as pool:
-                with create_progress() as progress:
-                    task = progress.add_task("[magenta]Fetching requests", total=len(remaining))
-                    for i, result in enumerate(pool.imap(_worker_fetch_requests, worker_args)):
-                        for r in result:
-                            detail = RequestDetail(**r)
-                            completed[r['request_number']] = detail
-                            if r['fetch_status'] == 'success':
-                                total_success += 1
-                            else:
-                                total_errors += 1
-                        # Update by actual chunk size
-                        progress.update(task, advance=len(request_chunks[i]), description=f"[magenta]Fetching requests [ok={total_success}, err={total_errors}]")
+            pool = self._get_pool()
+            with create_progress() as progress:
+                task = progress.add_task("[magenta]Fetching requests", total=len(remaining))
+                for i, blob in enumerate(pool.imap(_worker_fetch_requests, worker_args)):
+                    result = orjson.loads(blob)
+                    for r in result:
+                        detail = RequestDetail(**r)
+                        completed[r['request_number']] = detail
+                        if r['fetch_status'] == 'success':
+                            total_success += 1
+                        else:
+                            total_errors += 1
+                    # Update by actual chunk size
+                    progress.update(task, advance=_chunk_len(len(remaining), chunk_size, i), description=f"[magenta]Fetching requests [ok={total_success}, err={total_errors}]")
 
             elapsed = time.time() - start_time
             logger.info(f"All workers completed in {elapsed:.1f}s")
 
         else:
             # Single-process mode
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
-            connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+            semaphore = asyncio.Semaphore(FETCH_SEMAPHORE_SIZE)
+            connector = _create_connector()
 
             async with aiohttp.ClientSession(connector=connector) as session:
-                batch_size = SAVE_INTERVAL
+                config_dict = asdict(self.config)
+
+                async def fetch_one(req_num: str, tik_num: str):
+                    async with semaphore:
+                        return await _async_fetch_single_request(session, config_dict, req_num, tik_num)
 
                 with create_progress() as progress:
                     task = progress.add_task("[magenta]Fetching requests", total=len(remaining))
-                    for batch_idx in range(0, len(remaining), batch_size):
-                        batch = remaining[batch_idx:batch_idx + batch_size]
-
-                        async def fetch_one(req_num: str, tik_num: str):
-                            async with semaphore:
-                                return await _async_fetch_single_request(session, asdict(self.config), req_num, tik_num)
 
-                        tasks = [fetch_one(req_num, tik_num) for req_num, tik_num in batch]
-                        results = await asyncio.gather(*tasks)
+                    tasks = [asyncio.create_task(fetch_one(req_num, tik_num)) for req_num, tik_num in remaining]
+                    for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                        result = await next_result
+                        detail = RequestDetail(**result)
+                        completed[result['request_number']] = detail
+                        if result['fetch_status'] == 'success':
+                            total_success += 1
+                        else:
+                            total_errors += 1
 
-                        for result in results:
-                            detail = RequestDetail(**result)
-                            completed[result['request_number']] = detail
-                            if result['fetch_status'] == 'success':
-                                total_success += 1
-                            else:
-                                total_errors += 1
-
-                        progress.update(task, advance=len(batch), description=f"[magenta]Fetching requests [ok={total_success}, err={total_errors}]")
+                        progress.update(task, advance=1, description=f"[magenta]Fetching requests [ok={total_success}, err={total_errors}]")
 
                         # Save checkpoint periodically
-                        self.checkpoint.save_requests(list(completed.values()), requests_file)
+                        if done % SAVE_INTERVAL == 0 and self._checkpoint_due():
+                            self.checkpoint.save_requests(completed.values(), requests_file)
 
         # Save final results
         all_requests = list(completed.values())
@@ -1257,7 +1175,9 @@ class ComplotCrawler:
 
     async def _fetch_bakasha_details_authenticated(self, records: list[BuildingRecord], resume: bool = True) -> list[BuildingDetail]:
         """Fetch bakasha details using authenticated API"""
-        tik_numbers = list(set(r.tik_number for r in records))
+        # Unique tiks in record order (a tik has one record per address); unlike
+        # set(), this keeps the fetch order stable from run to run
+        tik_numbers = list(dict.fromkeys(r.tik_number for r in records))
 
         # Load checkpoint if resuming
         completed = {}
@@ -1279,44 +1199,40 @@ class ComplotCrawler:
             logger.info("All details already fetched!")
             return list(completed.values())
 
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+        semaphore = asyncio.Semaphore(FETCH_SEMAPHORE_SIZE)
         start_time = time.time()
         total_success = 0
         total_errors = 0
 
-        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+        connector = _create_connector()
         async with aiohttp.ClientSession(connector=connector) as session:
-            batch_size = SAVE_INTERVAL
-
             with create_progress() as progress:
                 task = progress.add_task("[magenta]Fetching bakasha details", total=len(remaining))
-                for batch_idx in range(0, len(remaining), batch_size):
-                    batch = remaining[batch_idx:batch_idx + batch_size]
 
-                    tasks = [
-                        self._fetch_single_bakasha_detail(session, semaphore, tik, self.israeli_id)
-                        for tik in batch
-                    ]
-                    results = await asyncio.gather(*tasks)
-
-                    for result in results:
-                        completed[result.tik_number] = result
-
-                    success = sum(1 for r in results if r.fetch_status == 'success')
-                    errors = sum(1 for r in results if r.fetch_status == 'error')
-                    total_success += success
-                    total_errors += errors
+                tasks = [
+                    asyncio.create_task(self._fetch_single_bakasha_detail(session, semaphore, tik, self.israeli_id))
+                    for tik in remaining
+                ]
+                batch = []
+                for done, next_result in enumerate(asyncio.as_completed(tasks), 1):
+                    result = await next_result
+                    completed[result.tik_number] = result
+                    batch.append(result)
 
-                    # Log any errors in this batch
-                    for r in results:
-                        if r.fetch_status == 'error':
-                            logger.debug(f"Error fetching request {r.tik_number}: {r.fetch_error}")
+                    if result.fetch_status == 'success':
+                        total_success += 1
+                    elif result.fetch_status == 'error':
+                        total_errors += 1
+                        logger.debug(f"Error fetching request {result.tik_number}: {result.fetch_error}")
 
-                    progress.update(task, advance=len(batch), description=f"[magenta]Fetching bakasha details [ok={total_success}, err={total_errors}]")
+                    progress.update(task, advance=1, description=f"[magenta]Fetching bakasha details [ok={total_success}, err={total_errors}]")
 
                     # Save checkpoint
-                    logger.debug(f"Saving checkpoint with {len(completed)} records")
-                    self.checkpoint.save_details(list(completed.values()))
+                    if done % SAVE_INTERVAL == 0:
+                        self._checkpoint_details(completed, batch)
+                        batch = []
+
+                self._checkpoint_details(completed, batch)
 
         # Save final results
         all_details = list(completed.values())
@@ -1335,128 +1251,117 @@ class ComplotCrawler:
         4. Fetch request details (GetBakashaFile) - detailed permit lifecycle
         5. Export CSV
         """
-        # Initialize logging
-        setup_logging(self.output_dir, verbose=verbose)
+        try:
+            # Initialize logging
+            setup_logging(self.output_dir, verbose=verbose)
 
-        logger.info("#" * 60)
-        logger.info(f"COMPLOT CRAWLER - {self.config.name} ({self.config.name_en})")
-        logger.info("#" * 60)
-        logger.info(f"Site ID: {self.config.site_id}")
-        logger.info(f"City Code: {self.config.city_code}")
-        logger.info(f"API Type: {self.config.api_type}")
-        logger.info(f"Details Blocked: {self.config.details_blocked}")
-        logger.info(f"Output Directory: {self.output_dir}")
-        logger.info(f"Workers: {self.workers}")
-
-        # Handle retry-errors mode: only retry failed details, skip everything else
-        if retry_errors:
-            logger.info("RETRY-ERRORS MODE: Only retrying failed building details")
-            details = await self.retry_failed_details()
-            if details:
-                self.exporter.export_csv(details)
             logger.info("#" * 60)
-            logger.info("RETRY COMPLETE")
+            logger.info(f"COMPLOT CRAWLER - {self.config.name} ({self.config.name_en})")
             logger.info("#" * 60)
-            return
-
-        # Step 1: Discover streets (returns all_streets and new_streets)
-        console.rule("[bold cyan]Phase 1: Discovering Streets")
-        all_streets, new_streets = await self.discover_streets(force=force)
-
-        if streets_only:
-            logger.info("Streets-only mode. Stopping here.")
-            return
-
-        # Step 2: Fetch building records
-        console.rule("[bold green]Phase 2: Fetching Building Records")
-        # If we have new streets and not forcing, do incremental fetch
-        if new_streets and not force:
-            logger.info("=" * 60)
-            logger.info(f"INCREMENTAL MODE: Fetching records for {len(new_streets)} new streets only")
-            logger.info("=" * 60)
-
-            # Load existing records
-            existing_records = []
-            if self.records_file.exists():
-                with open(self.records_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    existing_records = [BuildingRecord(**r) for r in data.get('records', [])]
+            logger.info(f"Site ID: {self.config.site_id}")
+            logger.info(f"City Code: {self.config.city_code}")
+            logger.info(f"API Type: {self.config.api_type}")
+            logger.info(f"Details Blocked: {self.config.details_blocked}")
+            logger.info(f"Output Directory: {self.output_dir}")
+            logger.info(f"Workers: {self.workers}")
+
+            # Handle retry-errors mode: only retry failed details, skip everything else
+            if retry_errors:
+                logger.info("RETRY-ERRORS MODE: Only retrying failed building details")
+                details = await self.retry_failed_details()
+                if details:
+                    self.exporter.export_csv(details)
+                logger.info("#" * 60)
+                logger.info("RETRY COMPLETE")
+                logger.info("#" * 60)
+                return
+
+            # Step 1: Discover streets (returns all_streets and new_streets)
+            console.rule("[bold cyan]Phase 1: Discovering Streets")
+            all_streets, new_streets = await self.discover_streets(force=force)
+
+            if streets_only:
+                logger.info("Streets-only mode. Stopping here.")
+                return
+
+            # Step 2: Fetch building records
+            console.rule("[bold green]Phase 2: Fetching Building Records")
+            # If we have new streets and not forcing, do incremental fetch
+            if new_streets and not force:
+                logger.info("=" * 60)
+                logger.info(f"INCREMENTAL MODE: Fetching records for {len(new_streets)} new streets only")
+                logger.info("=" * 60)
+
+                # Load existing records
+                existing_records = self._load_cached_records() or []
                 logger.info(f"Loaded {len(existing_records)} existing records from cache")
 
-            # Fetch records for new streets only (bypass cache with force=True)
-            new_records = await self.fetch_building_records(new_streets, force=True)
-
-            # Merge records (dedupe by tik_number)
-            seen_tiks = {r.tik_number for r in existing_records}
-            added_count = 0
-            for r in new_records:
-                if r.tik_number not in seen_tiks:
-                    existing_records.append(r)
-                    seen_tiks.add(r.tik_number)
-                    added_count += 1
-
-            records = existing_records
-            logger.info(f"Merged {added_count} new records. Total: {len(records)}")
-
-            # Save merged records
-            output = {
-                "city": self.config.name,
-                "city_en": self.config.name_en,
-                "crawled_at": datetime.now().isoformat(),
-                "total_records": len(records),
-                "records": [asdict(r) for r in records]
-            }
-            with open(self.records_file, 'w', encoding='utf-8') as f:
-                json.dump(output, f, ensure_ascii=False, indent=2)
-        elif not new_streets and self.records_file.exists() and not force:
-            # No new streets and cache exists - just load from cache
-            logger.info("No new streets found. Loading records from cache.")
-            with open(self.records_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                records = [BuildingRecord(**r) for r in data.get('records', [])]
-        else:
-            # Full fetch (no baseline, force, or first run)
-            records = await self.fetch_building_records(all_streets, force=force)
-
-        if skip_details:
-            logger.info("Skipping details fetch.")
-            return
-
-        # Check if municipality blocks detail access
-        if self.config.details_blocked:
-            logger.warning("=" * 60)
-            logger.warning(f"DETAILS BLOCKED: {self.config.name} blocks public access to building details")
-            logger.warning("Only basic building records are available for this municipality")
-            logger.warning("Skipping Phase 3 (Building Details) and Phase 4 (Request Details)")
-            logger.warning("=" * 60)
-            console.print("[yellow]Municipality blocks GetTikFile access - skipping details phases[/yellow]")
-            return
-
-        # Step 3: Fetch building details
-        console.rule("[bold yellow]Phase 3: Fetching Building Details")
-        details = await self.fetch_building_details(records)
-
-        # Step 4: Fetch request details (permit lifecycle)
-        request_details = []
-        if not skip_requests:
-            console.rule("[bold magenta]Phase 4: Fetching Request Details")
-            request_details = await self.fetch_request_details(details, force=force)
-        else:
-            logger.info("Skipping request details fetch.")
+                # Fetch records for new streets only (bypass cache with force=True)
+                new_records = await self.fetch_building_records(new_streets, force=True)
+
+                # Merge records (dedupe by tik_number)
+                seen_tiks = {r.tik_number for r in existing_records}
+                added_count = 0
+                for r in new_records:
+                    if r.tik_number not in seen_tiks:
+                        existing_records.append(r)
+                        seen_tiks.add(r.tik_number)
+                        added_count += 1
+
+                records = existing_records
+                logger.info(f"Merged {added_count} new records. Total: {len(records)}")
+
+                # Save merged records
+                self.exporter.export_records(records)
+            elif not new_streets and not force and (cached_records := self._load_cached_records()) is not None:
+                # No new streets and a compatible cache exists - just load from cache
+                logger.info("No new streets found. Loaded records from cache.")
+                records = cached_records
+            else:
+                # Full fetch (no baseline, force, or first run)
+                records = await self.fetch_building_records(all_streets, force=force)
+
+            if skip_details:
+                logger.info("Skipping details fetch.")
+                return
+
+            # Check if municipality blocks detail access
+            if self.config.details_blocked:
+                logger.warning("=" * 60)
+                logger.warning(f"DETAILS BLOCKED: {self.config.name} blocks public access to building details")
+                logger.warning("Only basic building records are available for this municipality")
+                logger.warning("Skipping Phase 3 (Building Details) and Phase 4 (Request Details)")
+                logger.warning("=" * 60)
+                console.print("[yellow]Municipality blocks GetTikFile access - skipping details phases[/yellow]")
+                return
+
+            # Step 3: Fetch building details
+            console.rule("[bold yellow]Phase 3: Fetching Building Details")
+            details = await self.fetch_building_details(records, force=force)
+
+            # Step 4: Fetch request details (permit lifecycle)
+            request_details = []
+            if not skip_requests:
+                console.rule("[bold magenta]Phase 4: Fetching Request Details")
+                request_details = await self.fetch_request_details(details, force=force)
+            else:
+                logger.info("Skipping request details fetch.")
 
-        # Step 5: Export CSV
-        self.exporter.export_csv(details, request_details)
+            # Step 5: Export CSV
+            self.exporter.export_csv(details, request_details)
 
-        logger.info("#" * 60)
-        logger.info("CRAWL COMPLETE")
-        logger.info("#" * 60)
-        logger.info(f"City: {self.config.name}")
-        logger.info(f"Streets: {len(all_streets)}")
-        logger.info(f"New Streets: {len(new_streets)}")
-        logger.info(f"Building Records: {len(records)}")
-        logger.info(f"Building Details: {len(details)}")
-        logger.info(f"Request Details: {len(request_details)}")
-        logger.info("#" * 60)
+            logger.info("#" * 60)
+            logger.info("CRAWL COMPLETE")
+            logger.info("#" * 60)
+            logger.info(f"City: {self.config.name}")
+            logger.info(f"Streets: {len(all_streets)}")
+            logger.info(f"New Streets: {len(new_streets)}")
+            logger.info(f"Building Records: {len(records)}")
+            logger.info(f"Building Details: {len(details)}")
+            logger.info(f"Request Details: {len(request_details)}")
+            logger.info("#" * 60)
+        finally:
+            self.close()
 
 
 def main():
@@ -1491,8 +1396,10 @@ Examples:
         print("-" * 70)
         print(f"{'Key':15} | {'Name':12} | {'Site ID':8} | {'City Code':10}")
         print("-" * 70)
-        for city in list_cities():
-            print(f"{city['key']:15} | {city['name']:12} | {city['site_id']:8} | {city['city_code']:10}")
+        print("\n".join(
+            f"{city.key:15} | {city.name:12} | {city.site_id:8} | {city.city_code:10}"
+            for city in list_cities()
+        ))
         print("-" * 70)
         print("\nUsage: python main.py <city_key>")
         return
@@ -1508,15 +1415,19 @@ Examples:
         print("\nUse --list-cities to see available cities")
         return
 
-    crawler = ComplotCrawler(config, args.output_dir, israeli_id=args.israeli_id, workers=args.workers)
-    asyncio.run(crawler.run_full_crawl(
-        streets_only=args.streets_only,
-        skip_details=args.skip_details,
-        skip_requests=args.skip_requests,
-        force=args.force,
-        verbose=args.verbose,
-        retry_errors=args.retry_errors
-    ))
+    # Use uvloop when available; worker processes forked from here inherit the policy
+    if uvloop is not None:
+        uvloop.install()
+
+    with ComplotCrawler(config, args.output_dir, israeli_id=args.israeli_id, workers=args.workers) as crawler:
+        asyncio.run(crawler.run_full_crawl(
+            streets_only=args.streets_only,
+            skip_details=args.skip_details,
+            skip_requests=args.skip_requests,
+            force=args.force,
+            verbose=args.verbose,
+            retry_errors=args.retry_errors
+        ))
 
 
 if __name__ == "__main__":
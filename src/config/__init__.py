@@ -1,12 +1,13 @@
 """Configuration module for Complot Crawler."""
 
 from src.config.settings import CrawlerSettings, DEFAULT_SETTINGS
-from src.config.cities import CityConfig, CITIES, get_city_config, list_cities, parse_url_config
+from src.config.cities import CityConfig, CityInfo, CITIES, get_city_config, list_cities, parse_url_config
 
 __all__ = [
     "CrawlerSettings",
     "DEFAULT_SETTINGS",
     "CityConfig",
+    "CityInfo",
     "CITIES",
     "get_city_config",
     "list_cities",
@@ -4,7 +4,8 @@ All municipalities use the same backend (handasi.complot.co.il) with different s
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional
 import re
 from urllib.parse import urlparse, parse_qs
 
@@ -200,25 +201,39 @@ def get_city_config(city_or_url: str) -> CityConfig:
     raise ValueError(f"Unknown city: {city_or_url}. Available cities: {', '.join(CITIES.keys())}")
 
 
-def list_cities() -> list[dict]:
+class CityInfo(NamedTuple):
+    """Summary of a known city configuration"""
+    key: str
+    name: str
+    name_en: str
+    site_id: int
+    city_code: int
+    api_type: str
+    details_blocked: bool
+
+
+@lru_cache(maxsize=1)
+def list_cities() -> tuple[CityInfo, ...]:
     """List all known city configurations"""
-    return [
-        {
-            "key": key,
-            "name": config.name,
-            "name_en": config.name_en,
-            "site_id": config.site_id,
-            "city_code": config.city_code,
-            "api_type": config.api_type,
-            "details_blocked": config.details_blocked
-        }
+    return tuple(
+        CityInfo(
+            key=key,
+            name=config.name,
+            name_en=config.name_en,
+            site_id=config.site_id,
+            city_code=config.city_code,
+            api_type=config.api_type,
+            details_blocked=config.details_blocked,
+        )
         for key, config in CITIES.items()
-    ]
+    )
 
 
 if __name__ == "__main__":
     print("Available cities:")
     print("-" * 80)
-    for city in list_cities():
-        blocked = " [BLOCKED]" if city['details_blocked'] else ""
-        print(f"  {city['key']:15} | {city['name']:15} | site_id={city['site_id']:3} | {city['api_type']:8}{blocked}")
+    print("\n".join(
+        f"  {city.key:15} | {city.name:15} | site_id={city.site_id:3} | {city.api_type:8}"
+        f"{' [BLOCKED]' if city.details_blocked else ''}"
+        for city in list_cities()
+    ))
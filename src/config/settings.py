@@ -17,18 +17,34 @@ class CrawlerSettings:
 
     # Concurrency settings
     max_concurrent: int = 20
+    worker_max_tasks: int = 200  # Recycle a pool worker process after N chunks
+
+    # Connection pool settings
+    keepalive_timeout: int = 120  # Keep idle connections across checkpoint pauses
+    dns_cache_ttl: int = 3600  # Seconds to cache the API host's DNS lookup
 
     # Timeout and retry settings
     request_timeout: int = 30
     max_retries: int = 3
     retry_delay: int = 2  # Base delay for exponential backoff
+    max_backoff: int = 60  # Upper bound for a single backoff sleep
 
     # Checkpoint settings
     save_interval: int = 100  # Save progress every N records
+    checkpoint_interval: int = 30  # Minimum seconds between checkpoint writes
+    checkpoint_max_age_hours: int = 24  # Warn when resuming from older data
+    checkpoint_compact_min: int = 1000  # Minimum logged details before compacting the log
+    html_cache_max_age_days: int = 7  # Refetch cached detail pages older than this
+    response_cache_file: str = "response_cache.sqlite"  # In the output dir; used when aiohttp-client-cache is installed
+    response_cache_ttl: int = 86400  # Seconds a cached search/request response stays valid
 
     # Street discovery settings
     default_street_range: tuple[int, int] = (1, 2000)
     house_number_range: tuple[int, int] = (1, 500)
+    house_number_concurrency: int = 16  # House numbers of one street requested at once
+    max_consecutive_empty: int = 30  # Stop a street after this many empty house numbers in a row
+    empty_cache_file: str = "empty_addresses.sqlite"  # Addresses known to have no records (in the output dir)
+    empty_cache_max_age_days: int = 30  # Re-check a known-empty address after this
 
     # Test house numbers for street validation
     test_house_numbers: tuple[int, ...] = (1, 2, 3, 5, 10, 20, 50)
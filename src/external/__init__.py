@@ -7,12 +7,19 @@ that can supplement the Complot building records with additional details.
 
 from src.external.config import (
     GISSourceConfig,
+    GISSourceInfo,
     TLV_GIS_CONFIG,
     ARCGIS_LAYERS,
     get_gis_config,
     list_gis_sources,
 )
-from src.external.arcgis_fetcher import ArcGISFetcher, fetch_gis_features
+from src.external.http_client import get_session, close_session
+from src.external.arcgis_fetcher import (
+    ArcGISFetcher,
+    fetch_gis_features,
+    fetch_gis_features_all_layers,
+    gis_session,
+)
 from src.external.tlv_gis import (
     TelAvivGISFetcher,
     fetch_tlv_building_permits,
@@ -23,13 +30,19 @@ from src.external.enricher import BuildingEnricher, enrich_building_records
 __all__ = [
     # Config
     "GISSourceConfig",
+    "GISSourceInfo",
     "TLV_GIS_CONFIG",
     "ARCGIS_LAYERS",
     "get_gis_config",
     "list_gis_sources",
+    # HTTP
+    "get_session",
+    "close_session",
     # Fetchers
     "ArcGISFetcher",
     "fetch_gis_features",
+    "fetch_gis_features_all_layers",
+    "gis_session",
     "TelAvivGISFetcher",
     "fetch_tlv_building_permits",
     "search_tlv_permits_by_address",
@@ -0,0 +1,23 @@
+"""
+Address normalization shared by the enricher and the GIS address lookups.
+
+Both sides compare Complot addresses against GIS ones, so they must agree on
+what "the same address" means.
+"""
+
+import string
+import unicodedata
+
+# Quote marks, including Hebrew geresh and gershayim, and bidi marks are
+# dropped; other punctuation except the comma that separates address parts
+# becomes a space
+_DROP_CHARS = "'\"`\u05f3\u05f4\u200e\u200f"
+_NORM_TABLE = str.maketrans({
+    **{char: " " for char in string.punctuation if char not in _DROP_CHARS + ","},
+    **{char: None for char in _DROP_CHARS},
+})
+
+
+def normalize_address(text: str) -> str:
+    """Normalize an address for matching (NFKC, punctuation, case, spacing)."""
+    return " ".join(unicodedata.normalize("NFKC", text).translate(_NORM_TABLE).lower().split())
@@ -6,17 +6,101 @@ endpoints commonly used by Israeli municipal GIS systems.
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from functools import partial
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Union
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, AsyncIterator, Mapping, Sequence, Union
+from urllib.parse import urlencode
 
 import aiohttp
+import orjson
+from yarl import URL
 
 from src.external.config import GISSourceConfig, ArcGISLayerConfig
 from src.models.gis import GISFeature, GISQueryResult
 
 logger = logging.getLogger(__name__)
 
+# Transient HTTP statuses worth retrying (rate limiting and server errors)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Common OID field names, in lookup order (Tel Aviv uses oid_permit)
+_OID_KEYS = ("OBJECTID", "objectid", "OID", "oid", "oid_permit", "FID")
+
+
+def _object_id(attrs: Dict[str, Any]) -> int:
+    """Get a feature's object ID from the first non-empty OID field."""
+    return next((attrs[k] for k in _OID_KEYS if attrs.get(k)), 0)
+
+
+def _to_columns(
+    data: Dict[str, Any],
+    features: List[Dict[str, Any]],
+    return_geometry: bool,
+) -> Dict[str, List[Any]]:
+    """
+    Transpose a query response into one list per attribute field.
+
+    Field order follows the response's "fields" schema when present,
+    otherwise the attribute keys as first seen. Geometries, if requested,
+    go in a "geometry" column aligned with the attribute columns.
+    """
+    attributes = [f.get("attributes", {}) for f in features]
+    names = [f["name"] for f in data.get("fields", ())] or list(
+        dict.fromkeys(name for attrs in attributes for name in attrs)
+    )
+    columns = {name: [attrs.get(name) for attrs in attributes] for name in names}
+    if return_geometry:
+        columns["geometry"] = [f.get("geometry") for f in features]
+    return columns
+
+
+class TokenBucket:
+    """
+    Async token bucket shared by concurrent requests.
+
+    Tokens refill continuously at rate_per_sec up to burst. Each acquire
+    takes one token, waiting in FIFO order when the bucket is empty, so the
+    request rate stays bounded no matter how many tasks are in flight.
+    """
+
+    def __init__(self, rate_per_sec: float, burst: int):
+        self.rate_per_sec = rate_per_sec
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate_per_sec
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate_per_sec)
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
 
 class ArcGISFetcher:
     """
@@ -26,30 +110,167 @@ class ArcGISFetcher:
     spatial queries, and attribute filtering.
     """
 
-    def __init__(self, config: GISSourceConfig):
+    # Shared by every request instead of being rebuilt per call
+    _HEADERS = MappingProxyType({
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        "Accept": "application/json",
+    })
+    _FORM_HEADERS = MappingProxyType({
+        **_HEADERS,
+        "Content-Type": "application/x-www-form-urlencoded",
+    })
+
+    def __init__(
+        self,
+        config: GISSourceConfig,
+        cache_dir: Optional[Path] = None,
+        refresh: bool = False,
+        max_concurrent: Optional[int] = None,
+    ):
         """
         Initialize ArcGIS fetcher.
 
         Args:
             config: GIS source configuration
+            cache_dir: Directory for cached query responses
+                (default: config.cache_dir, None disables caching)
+            refresh: Skip reading cached responses but still write fresh ones
+            max_concurrent: Concurrent page requests (default: config.max_concurrent)
         """
+        if max_concurrent:
+            config = replace(config, max_concurrent=max_concurrent)
         self.config = config
         self.timeout = aiohttp.ClientTimeout(total=config.request_timeout)
+        self.cache_dir = Path(cache_dir) if cache_dir else config.cache_dir
+        self.refresh = refresh
+        self._layers_by_id = {layer.layer_id: layer for layer in config.layers.values()}
+        self._url_cache: Dict[tuple[int, str], str] = {}
+        self._rate_limiter = (
+            TokenBucket(config.rate_per_sec, config.burst) if config.rate_per_sec > 0 else None
+        )
 
     def _build_query_url(self, layer_id: int) -> str:
-        """Build query URL for a layer."""
-        return f"{self.config.base_url}/{layer_id}/query"
+        """Build query URL for a layer (cached per layer)."""
+        key = (layer_id, "query")
+        url = self._url_cache.get(key)
+        if url is None:
+            url = self._url_cache[key] = f"{self.config.base_url}/{layer_id}/query"
+        return url
 
     def _build_layer_info_url(self, layer_id: int) -> str:
-        """Build info URL for a layer."""
-        return f"{self.config.base_url}/{layer_id}"
-
-    def get_headers(self) -> Dict[str, str]:
-        """Get default HTTP headers."""
-        return {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
-            "Accept": "application/json",
-        }
+        """Build info URL for a layer (cached per layer)."""
+        key = (layer_id, "info")
+        url = self._url_cache.get(key)
+        if url is None:
+            url = self._url_cache[key] = f"{self.config.base_url}/{layer_id}"
+        return url
+
+    def _cache_path(self, url: str, query_string: str) -> Optional[Path]:
+        """Get the cache file for a query, or None if caching is disabled."""
+        if not self.cache_dir:
+            return None
+        payload = f"{url}?{query_string}".encode()
+        key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        return Path(self.cache_dir) / key[:2] / f"{key}.json"
+
+    def _read_cache(self, path: Path) -> Optional[Dict]:
+        """Load a cached query response if present and not expired."""
+        try:
+            if self.config.cache_ttl and time.time() - path.stat().st_mtime > self.config.cache_ttl:
+                return None
+            return orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _write_cache(self, path: Path, data: Dict) -> None:
+        """Store a query response in the cache atomically."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(orjson.dumps(data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write GIS cache entry {path}: {e}")
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Get the wait before the next attempt.
+
+        Honors a numeric Retry-After header, otherwise backs off
+        exponentially from config.retry_delay with a little jitter.
+        """
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+        return self.config.retry_delay * (2 ** attempt) + random.random() * 0.25
+
+    async def _request_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        query_string: str,
+        post: bool = False,
+    ) -> Dict:
+        """
+        Send a request and decode its JSON body, retrying transient failures.
+
+        Every attempt takes a token from the fetcher's rate limiter. Rate
+        limiting, 5xx responses, timeouts and connection errors are
+        retried up to config.max_retries times. ArcGIS error payloads come
+        back with HTTP 200 and are returned as-is for the caller to check.
+
+        Args:
+            session: aiohttp session
+            url: Endpoint URL without query string
+            query_string: Pre-encoded query parameters
+            post: Send the parameters as a form body instead of in the URL
+
+        Returns:
+            Decoded response dict
+
+        Raises:
+            aiohttp.ClientResponseError: On a non-retryable or final HTTP error
+            asyncio.TimeoutError, aiohttp.ClientError: When retries run out
+        """
+        for attempt in range(self.config.max_retries + 1):
+            last_attempt = attempt == self.config.max_retries
+            retry_after = None
+
+            # Take the token before building the request: a coroutine created
+            # first would be dropped unawaited if the task is cancelled here
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+
+            try:
+                if post:
+                    request = session.post(
+                        url,
+                        data=query_string.encode(),
+                        headers=self._FORM_HEADERS,
+                        timeout=self.timeout
+                    )
+                else:
+                    request = session.get(
+                        URL(f"{url}?{query_string}", encoded=True),
+                        headers=self._HEADERS,
+                        timeout=self.timeout
+                    )
+                async with request as resp:
+                    if resp.status == 200:
+                        return orjson.loads(await resp.read())
+                    if resp.status not in _RETRY_STATUSES or last_attempt:
+                        resp.raise_for_status()
+                    retry_after = resp.headers.get("Retry-After")
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError):
+                if last_attempt:
+                    raise
+
+            delay = self._retry_delay(attempt, retry_after)
+            logger.debug(f"Retrying {url} in {delay:.1f}s (attempt {attempt + 1})")
+            await asyncio.sleep(delay)
+
+    def get_headers(self) -> Mapping[str, str]:
+        """Get default HTTP headers (read-only, shared by all requests)."""
+        return self._HEADERS
 
     async def fetch_layer_info(
         self,
@@ -67,19 +288,12 @@ class ArcGISFetcher:
             Layer metadata dict or None on error
         """
         url = self._build_layer_info_url(layer_id)
-        params = {"f": "json"}
 
         try:
-            async with session.get(
-                url,
-                params=params,
-                headers=self.get_headers(),
-                timeout=self.timeout
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                logger.warning(f"Layer info request failed: {resp.status}")
-                return None
+            return await self._request_json(session, url, "f=json")
+        except aiohttp.ClientResponseError as e:
+            logger.warning(f"Layer info request failed: {e.status}")
+            return None
         except Exception as e:
             logger.error(f"Error fetching layer info: {e}")
             return None
@@ -99,6 +313,8 @@ class ArcGISFetcher:
         order_by_fields: Optional[str] = None,
         return_count_only: bool = False,
         out_sr: Optional[int] = None,
+        object_ids: Optional[List[int]] = None,
+        columnar: bool = False,
     ) -> GISQueryResult:
         """
         Query a MapServer layer.
@@ -107,7 +323,8 @@ class ArcGISFetcher:
             session: aiohttp session
             layer_id: Layer ID to query
             where: SQL WHERE clause
-            out_fields: Fields to return (* for all)
+            out_fields: Fields to return (* for the layer's default fields,
+                or all fields if it has none)
             return_geometry: Whether to return geometry
             geometry_type: Geometry type for spatial queries
             geometry: Geometry dict for spatial queries
@@ -117,14 +334,20 @@ class ArcGISFetcher:
             order_by_fields: Field(s) to order by
             return_count_only: Only return count, not features
             out_sr: Output spatial reference
+            object_ids: Restrict the query to these object IDs
+            columnar: Fill result.columns (one list per field) instead of
+                building GISFeature objects
 
         Returns:
             GISQueryResult with features and metadata
         """
         url = self._build_query_url(layer_id)
 
-        # Build params
-        if isinstance(out_fields, list):
+        # Build params; "*" narrows to the layer's default fields when it has them
+        layer = self._layers_by_id.get(layer_id)
+        if out_fields == "*" and layer and layer.default_out_fields:
+            out_fields = layer.default_out_fields
+        if isinstance(out_fields, (list, tuple)):
             out_fields = ",".join(out_fields)
 
         params = {
@@ -149,11 +372,17 @@ class ArcGISFetcher:
         if out_sr:
             params["outSR"] = out_sr
 
+        if return_geometry and self.config.geometry_precision is not None:
+            params["geometryPrecision"] = self.config.geometry_precision
+
         if geometry:
             params["geometry"] = str(geometry)
             params["geometryType"] = geometry_type
             params["spatialRel"] = spatial_rel
 
+        if object_ids:
+            params["objectIds"] = ",".join(map(str, object_ids))
+
         result = GISQueryResult(
             layer_id=layer_id,
             source=self.config.name,
@@ -161,63 +390,64 @@ class ArcGISFetcher:
             offset=result_offset,
         )
 
+        # Encode the query once; it doubles as the cache key
+        query_string = urlencode(params, safe=",")
+
+        # Count queries are cheap and used to size pagination, never cache them
+        cache_path = None if return_count_only else self._cache_path(url, query_string)
+
         try:
-            async with session.get(
-                url,
-                params=params,
-                headers=self.get_headers(),
-                timeout=self.timeout
-            ) as resp:
-                if resp.status != 200:
-                    result.success = False
-                    result.error = f"HTTP {resp.status}"
-                    return result
-
-                data = await resp.json()
-
-                # Check for ArcGIS error
-                if "error" in data:
-                    result.success = False
-                    result.error = data["error"].get("message", "Unknown error")
-                    return result
-
-                # Handle count-only response
-                if return_count_only:
-                    result.total_count = data.get("count", 0)
-                    return result
-
-                # Parse features
-                features = data.get("features", [])
-                result.result_count = len(features)
-                result.exceeded_limit = data.get("exceededTransferLimit", False)
-
-                for feature_data in features:
-                    attrs = feature_data.get("attributes", {})
-                    geom = feature_data.get("geometry")
-
-                    # Try common OID field names
-                    object_id = (
-                        attrs.get("OBJECTID") or
-                        attrs.get("objectid") or
-                        attrs.get("OID") or
-                        attrs.get("oid") or
-                        attrs.get("oid_permit") or  # Tel Aviv uses this
-                        attrs.get("FID") or
-                        0
-                    )
+            data = None
+            if cache_path and not self.refresh:
+                data = self._read_cache(cache_path)
+
+            if data is None:
+                data = await self._request_json(
+                    session, url, query_string, post=bool(object_ids)
+                )
+                if cache_path and "error" not in data:
+                    self._write_cache(cache_path, data)
+
+            # Check for ArcGIS error
+            if "error" in data:
+                result.success = False
+                result.error = data["error"].get("message", "Unknown error")
+                return result
 
-                    feature = GISFeature(
-                        object_id=object_id,
-                        attributes=attrs,
-                        geometry=geom,
-                        layer_id=layer_id,
-                        source=self.config.name,
-                        fetched_at=datetime.now().isoformat(),
-                    )
-                    result.features.append(feature)
+            # Handle count-only response
+            if return_count_only:
+                result.total_count = data.get("count", 0)
+                return result
 
+            # Parse features
+            features = data.get("features", [])
+            result.result_count = len(features)
+            result.exceeded_limit = data.get("exceededTransferLimit", False)
+
+            if columnar:
+                result.columns = _to_columns(data, features, return_geometry)
                 return result
 
+            source = self.config.name
+            fetched_at = datetime.now().isoformat()
+            result.features = [
+                GISFeature(
+                    object_id=_object_id(feature_data.get("attributes", {})),
+                    attributes=feature_data.get("attributes", {}),
+                    geometry=feature_data.get("geometry"),
+                    layer_id=layer_id,
+                    source=source,
+                    fetched_at=fetched_at,
+                )
+                for feature_data in features
+            ]
+
+            return result
+
+        except aiohttp.ClientResponseError as e:
+            result.success = False
+            result.error = f"HTTP {e.status}"
+            return result
         except asyncio.TimeoutError:
             result.success = False
             result.error = "Request timeout"
@@ -228,6 +458,222 @@ class ArcGISFetcher:
             logger.error(f"Error querying layer {layer_id}: {e}")
             return result
 
+    async def _fetch_ids(
+        self,
+        session: aiohttp.ClientSession,
+        layer_id: int,
+        where: str = "1=1",
+    ) -> Optional[List[int]]:
+        """
+        Fetch the object IDs of all features matching a query.
+
+        Args:
+            session: aiohttp session
+            layer_id: Layer ID to query
+            where: SQL WHERE clause
+
+        Returns:
+            Sorted list of object IDs, or None if the layer can't list them
+        """
+        url = self._build_query_url(layer_id)
+        query_string = urlencode({"where": where, "returnIdsOnly": "true", "f": "json"})
+
+        try:
+            data = await self._request_json(session, url, query_string)
+        except Exception as e:
+            logger.debug(f"ID query failed for layer {layer_id}: {e}")
+            return None
+
+        if "error" in data or "objectIds" not in data:
+            return None
+
+        return sorted(data["objectIds"] or [])
+
+    async def _plan_windows(
+        self,
+        session: aiohttp.ClientSession,
+        layer_id: int,
+        where: str,
+        batch_size: int,
+        max_features: Optional[int],
+    ) -> tuple[GISQueryResult, List[Dict[str, Any]]]:
+        """
+        Split a query into independent page windows.
+
+        Prefers one ID query followed by objectIds chunks: these are index
+        lookups server-side, unlike deep resultOffset scans. Layers that
+        can't list IDs fall back to count + offset windows.
+
+        Returns:
+            (count result, list of query_layer kwargs per window)
+        """
+        object_ids = await self._fetch_ids(session, layer_id, where)
+
+        if object_ids is not None:
+            if max_features:
+                object_ids = object_ids[:max_features]
+            count_result = GISQueryResult(
+                total_count=len(object_ids),
+                layer_id=layer_id,
+                source=self.config.name,
+                where_clause=where,
+            )
+            windows = [
+                {"object_ids": object_ids[i:i + batch_size]}
+                for i in range(0, len(object_ids), batch_size)
+            ]
+            return count_result, windows
+
+        count_result = await self.query_layer(
+            session, layer_id, where=where, return_count_only=True
+        )
+        if not count_result.success:
+            return count_result, []
+
+        total_count = count_result.total_count
+        if max_features:
+            total_count = min(total_count, max_features)
+        count_result.total_count = total_count
+
+        windows = [
+            {"result_offset": offset, "result_record_count": min(batch_size, total_count - offset)}
+            for offset in range(0, total_count, batch_size)
+        ]
+        return count_result, windows
+
+    async def _iter_windows(
+        self,
+        session: aiohttp.ClientSession,
+        layer_id: int,
+        windows: List[Dict[str, Any]],
+        total_count: int,
+        where: str,
+        out_fields: Union[str, List[str]],
+        return_geometry: bool,
+        progress_callback: Optional[callable],
+        columnar: bool = False,
+    ) -> AsyncIterator[GISQueryResult]:
+        """
+        Fetch page windows concurrently and yield the batches in order.
+
+        At most config.max_concurrent windows are in flight, so memory stays
+        bounded by the pages being fetched rather than the whole result.
+        Iteration stops at the first failed page or a short offset page
+        (ID chunks may legitimately come back short when features were
+        deleted in between). A failed page cancels every later in-flight
+        window as soon as it completes, even before the earlier pages have
+        been consumed, since none of them can be used anymore.
+        """
+        remaining = enumerate(windows, 1)
+        pending: deque[tuple[int, Dict[str, Any], asyncio.Task]] = deque()
+        failed_at: Optional[int] = None
+
+        def on_done(index: int, task: asyncio.Task) -> None:
+            nonlocal failed_at
+            if task.cancelled():
+                return
+            if task.exception() is None and task.result().success:
+                return
+            if failed_at is None or index < failed_at:
+                failed_at = index
+                for later_index, _, later_task in pending:
+                    if later_index > index:
+                        later_task.cancel()
+
+        def schedule() -> None:
+            if failed_at is not None:
+                return
+            index, window = next(remaining, (0, None))
+            if window is not None:
+                task = asyncio.create_task(self.query_layer(
+                    session,
+                    layer_id,
+                    where=where,
+                    out_fields=out_fields,
+                    return_geometry=return_geometry,
+                    columnar=columnar,
+                    **window,
+                ))
+                task.add_done_callback(partial(on_done, index))
+                pending.append((index, window, task))
+
+        for _ in range(self.config.max_concurrent):
+            schedule()
+
+        fetched = 0
+        try:
+            while pending:
+                index, window, task = pending.popleft()
+                schedule()
+
+                try:
+                    batch = await task
+                except Exception as e:
+                    logger.warning(f"Batch {index}/{len(windows)} failed: {e}")
+                    return
+                if not batch.success:
+                    logger.warning(f"Batch {index}/{len(windows)} failed: {batch.error}")
+                    return
+
+                fetched += batch.result_count
+                if progress_callback:
+                    progress_callback(fetched, total_count)
+
+                yield batch
+
+                if batch.result_count < window.get("result_record_count", 0):
+                    return
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+
+    async def iter_all_features(
+        self,
+        session: aiohttp.ClientSession,
+        layer_id: int,
+        where: str = "1=1",
+        out_fields: Union[str, List[str]] = "*",
+        return_geometry: bool = True,
+        batch_size: int = 2000,
+        max_features: Optional[int] = None,
+        progress_callback: Optional[callable] = None,
+    ) -> AsyncIterator[GISFeature]:
+        """
+        Iterate over all features of a layer as pages arrive.
+
+        Same pagination as query_all_features, but features are yielded
+        batch by batch instead of being collected, so callers can process
+        large layers without holding them in memory.
+
+        Args:
+            session: aiohttp session
+            layer_id: Layer ID to query
+            where: SQL WHERE clause
+            out_fields: Fields to return
+            return_geometry: Whether to return geometry
+            batch_size: Records per request
+            max_features: Maximum total features to fetch
+            progress_callback: Called with (fetched_count, total_count)
+
+        Yields:
+            GISFeature objects in result order
+        """
+        count_result, windows = await self._plan_windows(
+            session, layer_id, where, batch_size, max_features
+        )
+        if not count_result.success:
+            logger.warning(f"Failed to query layer {layer_id}: {count_result.error}")
+            return
+
+        logger.info(f"Fetching {count_result.total_count} features from layer {layer_id}")
+
+        async for batch in self._iter_windows(
+            session, layer_id, windows, count_result.total_count,
+            where, out_fields, return_geometry, progress_callback,
+        ):
+            for feature in batch.features:
+                yield feature
+
     async def query_all_features(
         self,
         session: aiohttp.ClientSession,
@@ -238,6 +684,7 @@ class ArcGISFetcher:
         batch_size: int = 2000,
         max_features: Optional[int] = None,
         progress_callback: Optional[callable] = None,
+        columnar: bool = False,
     ) -> GISQueryResult:
         """
         Query all features from a layer with automatic pagination.
@@ -251,67 +698,39 @@ class ArcGISFetcher:
             batch_size: Records per request
             max_features: Maximum total features to fetch
             progress_callback: Called with (fetched_count, total_count)
+            columnar: Return the features as result.columns (one list per
+                field) instead of GISFeature objects
 
         Returns:
             GISQueryResult with all features
         """
-        # First get total count
-        count_result = await self.query_layer(
-            session, layer_id, where=where, return_count_only=True
+        count_result, windows = await self._plan_windows(
+            session, layer_id, where, batch_size, max_features
         )
-
         if not count_result.success:
             return count_result
 
         total_count = count_result.total_count
-        if max_features:
-            total_count = min(total_count, max_features)
-
         logger.info(f"Fetching {total_count} features from layer {layer_id}")
 
         all_features = []
-        offset = 0
-
-        while offset < total_count:
-            # Adjust batch size if we're close to max_features
-            remaining = total_count - offset
-            current_batch_size = min(batch_size, remaining)
-
-            batch_result = await self.query_layer(
-                session,
-                layer_id,
-                where=where,
-                out_fields=out_fields,
-                return_geometry=return_geometry,
-                result_offset=offset,
-                result_record_count=current_batch_size,
-            )
-
-            if not batch_result.success:
-                logger.warning(f"Batch at offset {offset} failed: {batch_result.error}")
-                break
-
-            all_features.extend(batch_result.features)
-            offset += len(batch_result.features)
-
-            if progress_callback:
-                progress_callback(len(all_features), total_count)
-
-            # Stop if we got fewer than requested or reached our limit
-            if len(batch_result.features) < current_batch_size:
-                break
-
-            if max_features and len(all_features) >= max_features:
-                break
-
-            # Small delay to be nice to the server
-            await asyncio.sleep(0.1)
+        all_columns: Dict[str, List[Any]] = {}
+        fetched = 0
+        async for batch in self._iter_windows(
+            session, layer_id, windows, total_count,
+            where, out_fields, return_geometry, progress_callback, columnar,
+        ):
+            all_features.extend(batch.features)
+            for name, values in batch.columns.items():
+                all_columns.setdefault(name, []).extend(values)
+            fetched += batch.result_count
 
         return GISQueryResult(
             features=all_features,
+            columns=all_columns,
             total_count=total_count,
-            result_count=len(all_features),
-            exceeded_limit=len(all_features) < total_count,
+            result_count=fetched,
+            exceeded_limit=fetched < total_count,
             layer_id=layer_id,
             source=self.config.name,
             where_clause=where,
@@ -347,6 +766,85 @@ class ArcGISFetcher:
             session, layer_id, where=where, out_fields=out_fields
         )
 
+    async def query_by_addresses(
+        self,
+        session: aiohttp.ClientSession,
+        layer_id: int,
+        addresses: Sequence[str],
+        address_field: str = "addresses",
+        out_fields: Union[str, List[str]] = "*",
+        exact: bool = False,
+        batch_size: int = 50,
+    ) -> GISQueryResult:
+        """
+        Query features matching any of several addresses.
+
+        Addresses are combined into one WHERE clause per batch (an IN list
+        for exact matches, OR-joined LIKEs otherwise), so N lookups cost
+        roughly N / batch_size requests. Batches run concurrently; one that
+        matches more features than the server returns per page is re-run
+        with pagination (query_all_features) so it is not truncated.
+
+        Args:
+            session: aiohttp session
+            layer_id: Layer ID to query
+            addresses: Addresses to search for
+            address_field: Field containing address
+            out_fields: Fields to return
+            exact: Match whole field values instead of substrings
+            batch_size: Addresses per request (keeps URLs under length limits)
+
+        Returns:
+            GISQueryResult with matching features (deduplicated by object ID)
+        """
+        safe_addresses = [a.replace("'", "''") for a in dict.fromkeys(addresses) if a]
+
+        def build_where(batch: List[str]) -> str:
+            if exact:
+                values = ", ".join(f"'{a}'" for a in batch)
+                return f"{address_field} IN ({values})"
+            return " OR ".join(f"{address_field} LIKE '%{a}%'" for a in batch)
+
+        wheres = [
+            build_where(safe_addresses[i:i + batch_size])
+            for i in range(0, len(safe_addresses), batch_size)
+        ]
+        semaphore = self.create_semaphore(self.config.max_concurrent)
+
+        async def query_batch(where: str) -> GISQueryResult:
+            async with semaphore:
+                batch = await self.query_layer(
+                    session, layer_id, where=where, out_fields=out_fields
+                )
+                if batch.success and batch.exceeded_limit:
+                    batch = await self.query_all_features(
+                        session, layer_id, where=where, out_fields=out_fields
+                    )
+                return batch
+
+        batches = await asyncio.gather(*(query_batch(where) for where in wheres))
+
+        result = GISQueryResult(
+            layer_id=layer_id,
+            source=self.config.name,
+            where_clause=" OR ".join(f"({where})" for where in wheres),
+        )
+        seen = set()
+        for batch in batches:
+            if not batch.success:
+                result.success = False
+                result.error = result.error or batch.error
+                continue
+            result.exceeded_limit = result.exceeded_limit or batch.exceeded_limit
+            for feature in batch.features:
+                if feature.object_id not in seen:
+                    seen.add(feature.object_id)
+                    result.features.append(feature)
+
+        result.result_count = len(result.features)
+        result.total_count = result.result_count
+        return result
+
     async def query_by_bbox(
         self,
         session: aiohttp.ClientSession,
@@ -390,8 +888,20 @@ class ArcGISFetcher:
 
     @staticmethod
     def create_connector(limit: int = 10) -> aiohttp.TCPConnector:
-        """Create a TCP connector with appropriate limits."""
-        return aiohttp.TCPConnector(limit=limit)
+        """
+        Create a TCP connector with appropriate limits.
+
+        All queries for a source go to a single host, so the whole pool is
+        allowed on it and connections/DNS results are kept warm between
+        paginated requests.
+        """
+        return aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
 
     @staticmethod
     def create_semaphore(limit: int = 10) -> asyncio.Semaphore:
@@ -399,12 +909,35 @@ class ArcGISFetcher:
         return asyncio.Semaphore(limit)
 
 
+@asynccontextmanager
+async def gis_session(config: GISSourceConfig) -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Open a session tuned for a GIS source.
+
+    Share it across fetch_gis_features calls (e.g. one per layer) so they
+    reuse the same connection pool instead of each opening their own.
+
+    Args:
+        config: GIS source configuration
+
+    Yields:
+        aiohttp session with pooled connector and default headers
+    """
+    connector = ArcGISFetcher.create_connector(config.max_concurrent)
+
+    async with aiohttp.ClientSession(
+        connector=connector, headers=ArcGISFetcher._HEADERS
+    ) as session:
+        yield session
+
+
 async def fetch_gis_features(
     config: GISSourceConfig,
     layer_id: int,
     where: str = "1=1",
     out_fields: str = "*",
     max_features: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> GISQueryResult:
     """
     Standalone function to fetch GIS features.
@@ -415,14 +948,15 @@ async def fetch_gis_features(
         where: SQL WHERE clause
         out_fields: Fields to return
         max_features: Maximum features to fetch
+        session: Session to reuse, e.g. http_client.get_session()
+            (None = open a new one for this call)
 
     Returns:
         GISQueryResult with features
     """
     fetcher = ArcGISFetcher(config)
-    connector = fetcher.create_connector(config.max_concurrent)
 
-    async with aiohttp.ClientSession(connector=connector) as session:
+    if session is not None:
         return await fetcher.query_all_features(
             session,
             layer_id,
@@ -430,3 +964,56 @@ async def fetch_gis_features(
             out_fields=out_fields,
             max_features=max_features,
         )
+
+    async with gis_session(config) as session:
+        return await fetcher.query_all_features(
+            session,
+            layer_id,
+            where=where,
+            out_fields=out_fields,
+            max_features=max_features,
+        )
+
+
+async def fetch_gis_features_all_layers(
+    config: GISSourceConfig,
+    where: str = "1=1",
+    max_features: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> Dict[str, GISQueryResult]:
+    """
+    Fetch features from every layer of a GIS source concurrently.
+
+    All layers share one fetcher (and so one rate limiter) and one session,
+    so total time is roughly that of the slowest layer rather than the sum.
+
+    Args:
+        config: GIS source configuration
+        where: SQL WHERE clause applied to every layer
+        max_features: Maximum features to fetch per layer
+        session: Session to reuse, e.g. http_client.get_session()
+            (None = open a new one for this call)
+
+    Returns:
+        Dict mapping layer name to its GISQueryResult
+    """
+    fetcher = ArcGISFetcher(config)
+    names = list(config.layers)
+
+    async def fetch_all(session: aiohttp.ClientSession) -> Dict[str, GISQueryResult]:
+        results = await asyncio.gather(*(
+            fetcher.query_all_features(
+                session,
+                config.layers[name].layer_id,
+                where=where,
+                max_features=max_features,
+            )
+            for name in names
+        ))
+        return dict(zip(names, results))
+
+    if session is not None:
+        return await fetch_all(session)
+
+    async with gis_session(config) as session:
+        return await fetch_all(session)
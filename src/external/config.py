@@ -5,10 +5,18 @@ Contains configurations for municipal GIS systems and their ArcGIS REST endpoint
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
 
-@dataclass
+def _empty_mapping() -> Mapping:
+    """Default factory for read-only mapping fields."""
+    return MappingProxyType({})
+
+
+@dataclass(slots=True, frozen=True)
 class ArcGISLayerConfig:
     """Configuration for an ArcGIS MapServer layer."""
 
@@ -20,10 +28,13 @@ class ArcGISLayerConfig:
     geometry_type: str = "esriGeometryPolygon"
 
     # Field mappings for standardization
-    field_mappings: dict = field(default_factory=dict)
+    field_mappings: Mapping[str, str] = field(default_factory=_empty_mapping)
+
+    # Fields requested when a query asks for "*" (empty = all fields)
+    default_out_fields: tuple[str, ...] = ()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GISSourceConfig:
     """Configuration for a municipal GIS data source."""
 
@@ -34,13 +45,23 @@ class GISSourceConfig:
     spatial_reference: int = 2039  # EPSG code (2039 = Israel TM)
 
     # Available layers
-    layers: dict = field(default_factory=dict)
+    layers: Mapping[str, ArcGISLayerConfig] = field(default_factory=_empty_mapping)
 
     # Request configuration
     max_concurrent: int = 10
     request_timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    rate_per_sec: float = 20.0   # Sustained request rate across all tasks (0 = unlimited)
+    burst: int = 10              # Requests allowed back-to-back before throttling
+
+    # Decimal places kept in returned geometry coordinates (None = server default).
+    # Full-precision coordinates dominate JSON payload size for polygon layers.
+    geometry_precision: Optional[int] = None
+
+    # Response cache (None = disabled)
+    cache_dir: Optional[Path] = None
+    cache_ttl: int = 0           # Seconds before a cached response expires (0 = never)
 
 
 # Tel Aviv GIS Layers
@@ -50,7 +71,7 @@ TLV_BUILDING_PERMITS_LAYER = ArcGISLayerConfig(
     name_he="בקשות והיתרי בניה",
     description="Building permit requests and approvals",
     max_record_count=2000,
-    field_mappings={
+    field_mappings=MappingProxyType({
         "request_num": "request_number",
         "permission_date": "permit_date",
         "permission_num": "permit_number",
@@ -60,7 +81,23 @@ TLV_BUILDING_PERMITS_LAYER = ArcGISLayerConfig(
         "yechidot_diyur": "housing_units",
         "building_stage": "permit_stage",
         "addresses": "address",
-    }
+    }),
+    default_out_fields=(
+        "oid_permit",
+        "request_num",
+        "permission_date",
+        "permission_num",
+        "expiry_date",
+        "open_request",
+        "building_num",
+        "yechidot_diyur",
+        "building_stage",
+        "request_stage",
+        "addresses",
+        "sw_tama_38",
+        "sw_tama_38_chadash",
+        "sw_tama_38_tosefet",
+    ),
 )
 
 TLV_CONSTRUCTION_SITES_LAYER = ArcGISLayerConfig(
@@ -111,25 +148,27 @@ TLV_GIS_CONFIG = GISSourceConfig(
     base_url="https://gisn.tel-aviv.gov.il/arcgis/rest/services/IView2/MapServer",
     city_code=5000,  # Tel Aviv CBS code
     spatial_reference=2039,
-    layers={
+    geometry_precision=2,  # Israel TM is in metres, so centimetre precision
+    layers=MappingProxyType({
         "building_permits": TLV_BUILDING_PERMITS_LAYER,
         "construction_sites": TLV_CONSTRUCTION_SITES_LAYER,
         "buildings": TLV_BUILDINGS_LAYER,
         "city_plans": TLV_CITY_PLANS_LAYER,
         "dangerous_buildings": TLV_DANGEROUS_BUILDINGS_LAYER,
         "licensing_zones": TLV_LICENSING_ZONES_LAYER,
-    },
+    }),
     max_concurrent=10,
     request_timeout=30,
 )
 
 
 # Registry of all available GIS sources
-ARCGIS_LAYERS = {
+ARCGIS_LAYERS = MappingProxyType({
     "telaviv": TLV_GIS_CONFIG,
-}
+})
 
 
+@lru_cache(maxsize=32)
 def get_gis_config(city: str) -> Optional[GISSourceConfig]:
     """
     Get GIS configuration for a city.
@@ -143,22 +182,35 @@ def get_gis_config(city: str) -> Optional[GISSourceConfig]:
     return ARCGIS_LAYERS.get(city.lower())
 
 
-def list_gis_sources() -> list[dict]:
+class GISSourceInfo(NamedTuple):
+    """Summary of an available GIS data source."""
+
+    name: str
+    name_he: str
+    city_code: int
+    layers: tuple[str, ...]
+    base_url: str
+
+
+@lru_cache(maxsize=1)
+def list_gis_sources() -> tuple[GISSourceInfo, ...]:
     """List all available GIS data sources."""
-    return [
-        {
-            "name": config.name,
-            "name_he": config.name_he,
-            "city_code": config.city_code,
-            "layers": list(config.layers.keys()),
-            "base_url": config.base_url,
-        }
+    return tuple(
+        GISSourceInfo(
+            name=config.name,
+            name_he=config.name_he,
+            city_code=config.city_code,
+            layers=tuple(config.layers),
+            base_url=config.base_url,
+        )
         for config in ARCGIS_LAYERS.values()
-    ]
+    )
 
 
 if __name__ == "__main__":
     print("Available GIS Sources:")
     print("-" * 60)
-    for source in list_gis_sources():
-        print(f"  {source['name']:15} | {source['name_he']:15} | Layers: {', '.join(source['layers'])}")
+    print("\n".join(
+        f"  {source.name:15} | {source.name_he:15} | Layers: {', '.join(source.layers)}"
+        for source in list_gis_sources()
+    ))
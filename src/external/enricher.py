@@ -6,22 +6,98 @@ Can be run standalone or integrated into the main crawler workflow.
 """
 
 import asyncio
-import json
 import logging
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple, Iterable, Iterator
 
 import aiohttp
+import orjson
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.console import Console
 
+from src.external.addresses import normalize_address as _norm
+from src.external.http_client import get_session, close_session
 from src.external.tlv_gis import TelAvivGISFetcher
 from src.models.gis import GISBuildingPermit, EnrichedBuildingRecord
 
+# Optional: Aho-Corasick automaton for substring matching in C
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 console = Console()
 
+_NON_WORD_RE = re.compile(r"\W")
+_ADDRESS_RE = re.compile(r"^(.+?)\s+(\d+)")
+
+# Input files with these suffixes are read as one JSON record per line
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+# Records enriched between progress bar updates
+_PROGRESS_STEP = 1024
+
+# Records handed to each pool worker per round trip
+_POOL_CHUNKSIZE = 256
+
+
+def _parse_address(address: str) -> Tuple[str, Optional[int]]:
+    """Split an address into (street, house number); the number is None if absent."""
+    match = _ADDRESS_RE.match(address.strip())
+    if match:
+        return " ".join(match.group(1).split()), int(match.group(2))
+    return " ".join(address.split()), None
+
+
+def _word_starts(text: str) -> List[int]:
+    """Get positions in text that start a word (or follow a separator)."""
+    return [0] + [m.end() for m in _NON_WORD_RE.finditer(text) if m.end() < len(text)]
+
+
+def _is_word_start(text: str, position: int) -> bool:
+    """Check whether a position in text starts a word (or follows a separator)."""
+    return position == 0 or _NON_WORD_RE.match(text, position - 1) is not None
+
+
+@dataclass(slots=True)
+class _RecIn:
+    """Input record fields used for enrichment, with normalized match keys."""
+
+    tik_number: str
+    address: str
+    gush: str
+    helka: str
+    street_code: int
+    street_name: str
+    address_norm: str
+    street_norm: str
+
+
+def _normalize_record(record: Dict[str, Any]) -> _RecIn:
+    """Extract a record's fields once, normalizing (and interning) match keys."""
+    address = record.get("address", "")
+    street_name = record.get("street_name", "")
+    return _RecIn(
+        record.get("tik_number", ""),
+        address,
+        record.get("gush", ""),
+        record.get("helka", ""),
+        record.get("street_code", 0),
+        street_name,
+        _norm(address) if address else "",
+        sys.intern(_norm(street_name)) if street_name else "",
+    )
+
 
 class BuildingEnricher:
     """
@@ -31,21 +107,45 @@ class BuildingEnricher:
     housing units, permit stages, and geometry.
     """
 
-    def __init__(self, gis_source: str = "telaviv"):
+    def __init__(
+        self,
+        gis_source: str = "telaviv",
+        cache_dir: Optional[Path] = None,
+        refresh: bool = False,
+        concurrency: Optional[int] = None,
+    ):
         """
         Initialize enricher.
 
         Args:
             gis_source: GIS source to use for enrichment
+            cache_dir: Directory for cached GIS responses and the parsed
+                permits snapshot (None = no cache)
+            refresh: Ignore cached GIS responses and re-fetch them
+            concurrency: Concurrent GIS page requests (default: from config)
         """
         self.gis_source = gis_source
 
         if gis_source == "telaviv":
-            self.fetcher = TelAvivGISFetcher()
+            self.fetcher = TelAvivGISFetcher(
+                cache_dir=cache_dir, refresh=refresh, max_concurrent=concurrency
+            )
         else:
             raise ValueError(f"Unknown GIS source: {gis_source}")
 
         self.permits_cache: Dict[str, List[GISBuildingPermit]] = {}
+
+        # Substring-match indexes over permits_cache (see _build_match_index)
+        self._cache_keys: List[str] = []
+        self._key_permits: List[GISBuildingPermit] = []
+        self._key_index: Dict[str, int] = {}
+        self._max_key_length = 0
+        self._key_heads: Set[str] = set()
+        self._suffixes: List[str] = []
+        self._suffix_owners: List[int] = []
+        self._by_street: Dict[str, Dict[Optional[int], List[int]]] = {}
+        self._automaton = None
+        self._containing: Dict[str, Set[int]] = {}
         self.stats = {
             "total_records": 0,
             "enriched": 0,
@@ -70,6 +170,16 @@ class BuildingEnricher:
         Returns:
             Number of permits loaded
         """
+        snapshot = self._snapshot_path()
+        if snapshot and not self.fetcher.refresh:
+            permits = self._read_snapshot(snapshot, max_features)
+            if permits is not None:
+                for permit in permits:
+                    self._add_permit(permit)
+                self._build_match_index()
+                logger.info(f"Loaded {len(permits)} GIS permits from {snapshot}")
+                return len(permits)
+
         task = None
         if progress:
             task = progress.add_task("[cyan]Loading GIS permits...", total=None)
@@ -78,57 +188,246 @@ class BuildingEnricher:
             if progress and task:
                 progress.update(task, total=total, completed=fetched)
 
-        permits = await self.fetcher.fetch_building_permits(
+        # Index permits as pages stream in, so only the cache is kept in memory
+        loaded = 0
+        async for permit in self.fetcher.iter_building_permits(
             session,
             max_features=max_features,
             progress_callback=update_progress if progress else None,
+        ):
+            loaded += 1
+            self._add_permit(permit)
+
+        if progress and task:
+            progress.update(task, completed=loaded)
+
+        self._build_match_index()
+
+        if snapshot:
+            self._write_snapshot(snapshot, max_features)
+
+        logger.info(f"Loaded {loaded} GIS permits into cache")
+        return loaded
+
+    def _add_permit(self, permit: GISBuildingPermit) -> None:
+        """Add a permit to permits_cache under its normalized address."""
+        if permit.address:
+            # Create multiple keys for partial matching
+            address_lower = sys.intern(_norm(permit.address))
+            if address_lower not in self.permits_cache:
+                self.permits_cache[address_lower] = []
+            self.permits_cache[address_lower].append(permit)
+
+    def _snapshot_path(self) -> Optional[Path]:
+        """Get the parsed-permits snapshot file, or None if caching is disabled."""
+        if not self.fetcher.cache_dir:
+            return None
+        return Path(self.fetcher.cache_dir) / f"permits_{self.gis_source}.json"
+
+    def _read_snapshot(
+        self,
+        path: Path,
+        max_features: Optional[int],
+    ) -> Optional[List[GISBuildingPermit]]:
+        """
+        Load parsed permits saved by a previous run.
+
+        Returns None if the snapshot is missing, unreadable, older than the
+        source's cache_ttl, or was taken with a different max_features.
+        """
+        try:
+            ttl = self.fetcher.config.cache_ttl
+            if ttl and time.time() - path.stat().st_mtime > ttl:
+                return None
+            data = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+        if data.get("max_features") != max_features:
+            return None
+        return [GISBuildingPermit.from_dict(item) for item in data.get("permits", [])]
+
+    def _write_snapshot(self, path: Path, max_features: Optional[int]) -> None:
+        """Save the cached permits so later runs can skip fetching and parsing."""
+        data = {
+            "max_features": max_features,
+            "permits": [
+                permit.to_dict()
+                for permits in self.permits_cache.values()
+                for permit in permits
+            ],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            tmp_path.write_bytes(orjson.dumps(data))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write permits snapshot {path}: {e}")
+
+    def _build_match_index(self) -> None:
+        """
+        Index the cached addresses for matching.
+
+        Each address part (permits may list several, comma separated) is
+        indexed by (street, house number) for exact lookups. For substring
+        matching, every suffix of a cached address that starts at a word boundary
+        goes into a sorted list, so the cached addresses containing a query
+        are found by bisecting for the query as a prefix. With pyahocorasick
+        installed, the cached addresses also go into one automaton so those
+        contained in a record address are found in a single scan of it.
+
+        The cached addresses and their first permits are also kept as two
+        parallel lists, so a match index resolves to the best permit (and
+        its normalized address) without going back through the cache dict.
+        """
+        self._cache_keys = list(self.permits_cache)
+        self._key_permits = [permits[0] for permits in self.permits_cache.values()]
+        self._key_index = {key: index for index, key in enumerate(self._cache_keys)}
+        self._max_key_length = max(map(len, self._cache_keys), default=0)
+        self._key_heads = {key[:2] for key in self._cache_keys}
+        self._containing = {}
+        self._automaton = None
+
+        self._by_street = {}
+        for index, cached_address in enumerate(self._cache_keys):
+            for part in cached_address.split(","):
+                street, number = _parse_address(part)
+                if street:
+                    numbers = self._by_street.setdefault(sys.intern(street), {})
+                    numbers.setdefault(number, []).append(index)
+
+        entries = sorted(
+            (cached_address[start:], index)
+            for index, cached_address in enumerate(self._cache_keys)
+            for start in _word_starts(cached_address)
         )
+        self._suffixes = [suffix for suffix, _ in entries]
+        self._suffix_owners = [index for _, index in entries]
 
-        # Index by address fragments for faster lookup
-        for permit in permits:
-            if permit.address:
-                # Create multiple keys for partial matching
-                address_lower = permit.address.lower()
-                if address_lower not in self.permits_cache:
-                    self.permits_cache[address_lower] = []
-                self.permits_cache[address_lower].append(permit)
+        if ahocorasick is None or not self._cache_keys:
+            return
 
-        if progress and task:
-            progress.update(task, completed=len(permits))
+        automaton = ahocorasick.Automaton()
+        for index, cached_address in enumerate(self._cache_keys):
+            automaton.add_word(cached_address, (index, len(cached_address)))
+        automaton.make_automaton()
+        self._automaton = automaton
 
-        logger.info(f"Loaded {len(permits)} GIS permits into cache")
-        return len(permits)
+    def _exact_indices(self, address: str) -> Set[int]:
+        """
+        Get indices of cached addresses listing the same street and number.
+
+        An address without a house number matches every cached address
+        on that street.
+        """
+        street, number = _parse_address(address)
+        numbers = self._by_street.get(street)
+        if not numbers:
+            return set()
+        if number is not None:
+            return set(numbers.get(number, ()))
+        return {index for indices in numbers.values() for index in indices}
+
+    def _containing_indices(self, query: str) -> Set[int]:
+        """Get indices of cached addresses containing a query at a word start."""
+        indices = self._containing.get(query)
+        if indices is None:
+            indices = set()
+            position = bisect_left(self._suffixes, query)
+            while position < len(self._suffixes) and self._suffixes[position].startswith(query):
+                indices.add(self._suffix_owners[position])
+                position += 1
+            self._containing[query] = indices
+        return indices
+
+    def _contained_indices(self, query: str) -> Set[int]:
+        """Get indices of cached addresses found in a query at a word start."""
+        if self._automaton is not None:
+            return {
+                index
+                for end, (index, length) in self._automaton.iter(query)
+                if end + 1 == length or _is_word_start(query, end + 1 - length)
+            }
+
+        # Skip word starts no cached address begins with (_key_heads holds
+        # every key's first two characters, or the whole key if shorter).
+        # No cached address is longer than _max_key_length, so longer
+        # slices cannot match either.
+        heads = self._key_heads
+        indices = set()
+        for start in _word_starts(query):
+            if query[start:start + 2] not in heads and query[start:start + 1] not in heads:
+                continue
+            stop = min(len(query), start + self._max_key_length)
+            for end in range(start + 1, stop + 1):
+                index = self._key_index.get(query[start:end])
+                if index is not None:
+                    indices.add(index)
+        return indices
 
     def _find_matching_permits(
         self,
         address: str,
         street_name: str = "",
+        first_only: bool = True,
+        normalized: bool = False,
     ) -> List[GISBuildingPermit]:
         """
         Find GIS permits matching an address.
 
+        Cached permit addresses listing the record's street and house number
+        are preferred. Without such a match, a cached address matches when
+        it contains the record address or street name, or is contained in
+        the record address, starting at a word boundary.
+
         Args:
             address: Full address to match
             street_name: Street name for fallback matching
+            first_only: Return just the best match instead of all matches
+            normalized: address and street_name are already normalized (_norm)
 
         Returns:
             List of matching permits (best matches first)
         """
+        if normalized:
+            address_lower, street_lower = address or "", street_name or ""
+        else:
+            address_lower = _norm(address) if address else ""
+            street_lower = _norm(street_name) if street_name else ""
+
+        indices = self._match_indices(address_lower, street_lower)
+        if not indices:
+            return []
+
+        # The best match is the first permit of the earliest loaded address
+        if first_only:
+            return [self._key_permits[min(indices)]]
+
+        # Expand in cache order so the best (earliest loaded) match stays first
         matches = []
-        address_lower = address.lower() if address else ""
-        street_lower = street_name.lower() if street_name else ""
-
-        for cached_address, permits in self.permits_cache.items():
-            # Check for address match
-            if address_lower and address_lower in cached_address:
-                matches.extend(permits)
-            elif address_lower and cached_address in address_lower:
-                matches.extend(permits)
-            # Fall back to street name match
-            elif street_lower and street_lower in cached_address:
-                matches.extend(permits)
-
-        # Remove duplicates while preserving order
+        for index in sorted(indices):
+            matches.extend(self.permits_cache[self._cache_keys[index]])
+
+        return self._unique_permits(matches)
+
+    def _match_indices(self, address_lower: str, street_lower: str) -> Set[int]:
+        """Get indices of cached addresses matching a normalized address/street."""
+        if len(self._cache_keys) != len(self.permits_cache):
+            self._build_match_index()
+
+        indices = self._exact_indices(address_lower) if address_lower else set()
+        if not indices:
+            if address_lower:
+                indices |= self._containing_indices(address_lower)
+                indices |= self._contained_indices(address_lower)
+            if street_lower:
+                indices |= self._containing_indices(street_lower)
+        return indices
+
+    @staticmethod
+    def _unique_permits(matches: List[GISBuildingPermit]) -> List[GISBuildingPermit]:
+        """Remove duplicate permits while preserving order."""
         seen = set()
         unique_matches = []
         for permit in matches:
@@ -138,10 +437,7 @@ class BuildingEnricher:
 
         return unique_matches
 
-    def enrich_record(
-        self,
-        record: Dict[str, Any],
-    ) -> EnrichedBuildingRecord:
+    def enrich_record(self, record: Dict[str, Any]) -> EnrichedBuildingRecord:
         """
         Enrich a single building record with GIS data.
 
@@ -151,41 +447,37 @@ class BuildingEnricher:
         Returns:
             EnrichedBuildingRecord with GIS data
         """
-        tik_number = record.get("tik_number", "")
-        address = record.get("address", "")
-        street_name = record.get("street_name", "")
+        return self._enrich(_normalize_record(record))
 
+    def _enrich(self, rec: _RecIn, enriched_at: Optional[str] = None) -> EnrichedBuildingRecord:
+        """
+        Enrich a preprocessed record (see _normalize_record).
+
+        Batch callers pass one enriched_at timestamp for all their records
+        (None = the current time).
+        """
         enriched = EnrichedBuildingRecord(
-            tik_number=tik_number,
-            address=address,
-            gush=record.get("gush", ""),
-            helka=record.get("helka", ""),
-            street_code=record.get("street_code", 0),
-            street_name=street_name,
+            rec.tik_number,
+            rec.address,
+            rec.gush,
+            rec.helka,
+            rec.street_code,
+            rec.street_name,
         )
 
         # Find matching GIS permits
-        matches = self._find_matching_permits(address, street_name)
-
-        if matches:
-            # Use the best match (first one)
-            best_match = matches[0]
-
-            enriched.permit_number = best_match.permit_number
-            enriched.permit_date = best_match.permit_date
-            enriched.permit_expiry = best_match.permit_expiry
-            enriched.housing_units = best_match.housing_units
-            enriched.permit_stage = best_match.permit_stage
-            enriched.building_code = best_match.building_code
-            enriched.geometry = best_match.geometry
-            enriched.centroid = best_match.centroid
-            enriched.gis_source = self.gis_source
-            enriched.gis_object_id = best_match.object_id
-            enriched.match_method = "address"
-            enriched.match_confidence = 1.0 if address.lower() == best_match.address.lower() else 0.7
-            enriched.enriched = True
-            enriched.enriched_at = datetime.now().isoformat()
-
+        indices = self._match_indices(rec.address_norm, rec.street_norm)
+        if indices:
+            # Use the best match (earliest loaded address)
+            best_index = min(indices)
+            match_confidence = 1.0 if rec.address_norm == self._cache_keys[best_index] else 0.7
+            self._apply_match(
+                enriched,
+                self._key_permits[best_index],
+                "address",
+                match_confidence,
+                enriched_at,
+            )
             self.stats["enriched"] += 1
         else:
             self.stats["not_found"] += 1
@@ -193,19 +485,89 @@ class BuildingEnricher:
         self.stats["total_records"] += 1
         return enriched
 
+    def _apply_match(
+        self,
+        enriched: EnrichedBuildingRecord,
+        best_match: GISBuildingPermit,
+        match_method: str,
+        match_confidence: float,
+        enriched_at: Optional[str] = None,
+    ) -> None:
+        """Copy a matched permit's details onto an enriched record."""
+        enriched.permit_number = best_match.permit_number
+        enriched.permit_date = best_match.permit_date
+        enriched.permit_expiry = best_match.permit_expiry
+        enriched.housing_units = best_match.housing_units
+        enriched.permit_stage = best_match.permit_stage
+        enriched.building_code = best_match.building_code
+        enriched.geometry = best_match.geometry
+        enriched.centroid = best_match.centroid
+        enriched.gis_source = self.gis_source
+        enriched.gis_object_id = best_match.object_id
+        enriched.match_method = match_method
+        enriched.match_confidence = match_confidence
+        enriched.enriched = True
+        enriched.enriched_at = enriched_at or datetime.now().isoformat()
+
+    async def _enrich_remote(
+        self,
+        session: aiohttp.ClientSession,
+        enriched_records: List[EnrichedBuildingRecord],
+    ) -> int:
+        """
+        Look up unmatched records' addresses on the GIS server in one batch.
+
+        Returns:
+            Number of records enriched by the remote lookup
+        """
+        missing = [r for r in enriched_records if not r.enriched and r.address]
+        if not missing:
+            return 0
+
+        found = await self.fetcher.fetch_permits_by_addresses(
+            session, [r.address for r in missing]
+        )
+
+        now_iso = datetime.now().isoformat()
+        matched = 0
+        for enriched in missing:
+            permits = found.get(enriched.address)
+            if not permits:
+                continue
+            best_match = permits[0]
+            confidence = 1.0 if _norm(enriched.address) == _norm(best_match.address) else 0.7
+            self._apply_match(enriched, best_match, "address", confidence, now_iso)
+            matched += 1
+
+        self.stats["enriched"] += matched
+        self.stats["not_found"] -= matched
+        return matched
+
     async def enrich_records(
         self,
         records: List[Dict[str, Any]],
         session: aiohttp.ClientSession,
         progress: Optional[Progress] = None,
+        workers: int = 1,
+        remote_fallback: bool = False,
     ) -> List[EnrichedBuildingRecord]:
         """
         Enrich multiple building records.
 
+        Matching is pure CPU once the permits are loaded, so with workers > 1
+        it is spread over a process pool. Each worker receives the permits
+        cache once (via the pool initializer) and builds its own match index.
+
+        With remote_fallback, addresses that found no match in the loaded
+        permits are then searched on the GIS server, batched into a few
+        concurrent queries.
+
         Args:
             records: List of building record dicts
             session: aiohttp session
             progress: Rich progress bar
+            workers: Number of worker processes for matching (1 = in-process)
+            remote_fallback: Search unmatched addresses on the GIS server
 
         Returns:
             List of EnrichedBuildingRecord
@@ -221,13 +583,82 @@ class BuildingEnricher:
                 total=len(records)
             )
 
-        enriched_records = []
+        # Extract and normalize once up front; street names repeat, so intern them
+        normalized = [_normalize_record(record) for record in records]
+
+        # One enrichment timestamp for the whole batch
+        now_iso = datetime.now().isoformat()
+
+        if workers > 1 and len(normalized) > _POOL_CHUNKSIZE:
+            enriched_records = await asyncio.to_thread(
+                self._enrich_in_pool, normalized, workers, now_iso, progress, task
+            )
+        else:
+            enriched_records = []
+            for count, rec in enumerate(normalized, 1):
+                enriched = self._enrich(rec, now_iso)
+                enriched_records.append(enriched)
+
+                if progress and task is not None and count % _PROGRESS_STEP == 0:
+                    progress.update(task, completed=count)
+
+            if progress and task is not None:
+                progress.update(task, completed=len(enriched_records))
+
+        if remote_fallback:
+            matched = await self._enrich_remote(session, enriched_records)
+            logger.info(f"Remote address lookup matched {matched} more records")
+
+        return enriched_records
+
+    def iter_enriched(
+        self,
+        records: Iterable[Dict[str, Any]],
+    ) -> Iterator[EnrichedBuildingRecord]:
+        """
+        Enrich records lazily, one at a time.
+
+        GIS permits must already be loaded (see load_gis_permits). Only the
+        record being enriched is held in memory, so this suits streaming
+        large inputs.
+
+        Args:
+            records: Iterable of building record dicts
+
+        Yields:
+            EnrichedBuildingRecord per input record
+        """
+        now_iso = datetime.now().isoformat()
         for record in records:
-            enriched = self.enrich_record(record)
-            enriched_records.append(enriched)
+            yield self._enrich(_normalize_record(record), now_iso)
 
-            if progress and task:
-                progress.advance(task)
+    def _enrich_in_pool(
+        self,
+        normalized: List[_RecIn],
+        workers: int,
+        enriched_at: str,
+        progress: Optional[Progress],
+        task: Optional[int],
+    ) -> List[EnrichedBuildingRecord]:
+        """Run enrich_record over a process pool and fold worker stats back in."""
+        enriched_records = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.gis_source, self.permits_cache),
+        ) as executor:
+            for enriched in executor.map(
+                _enrich_one, normalized, repeat(enriched_at), chunksize=_POOL_CHUNKSIZE
+            ):
+                enriched_records.append(enriched)
+                self.stats["enriched" if enriched.enriched else "not_found"] += 1
+                self.stats["total_records"] += 1
+
+                if progress and task is not None and len(enriched_records) % _PROGRESS_STEP == 0:
+                    progress.update(task, completed=len(enriched_records))
+
+        if progress and task is not None:
+            progress.update(task, completed=len(enriched_records))
 
         return enriched_records
 
@@ -243,27 +674,89 @@ class BuildingEnricher:
         }
 
 
+def _iter_input_records(input_file: Path) -> Iterator[Dict[str, Any]]:
+    """Read records from a JSON array file, or line by line from NDJSON."""
+    input_file = Path(input_file)
+    if input_file.suffix not in _NDJSON_SUFFIXES:
+        yield from orjson.loads(input_file.read_bytes())
+        return
+
+    with open(input_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+# Per-process enricher used by pool workers (set by _init_worker)
+_worker_enricher: Optional[BuildingEnricher] = None
+
+
+def _init_worker(
+    gis_source: str,
+    permits_cache: Dict[str, List[GISBuildingPermit]],
+) -> None:
+    """Pool initializer: install the permits cache and build the match index."""
+    global _worker_enricher
+    _worker_enricher = BuildingEnricher(gis_source)
+    _worker_enricher.permits_cache = permits_cache
+    _worker_enricher._build_match_index()
+
+
+def _enrich_one(rec: _RecIn, enriched_at: str) -> EnrichedBuildingRecord:
+    """Pool task: enrich one preprocessed record."""
+    return _worker_enricher._enrich(rec, enriched_at)
+
+
 async def enrich_building_records(
     input_file: Path,
     output_file: Path,
     gis_source: str = "telaviv",
     max_gis_features: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    refresh: bool = False,
+    workers: int = 1,
+    ndjson: bool = False,
+    concurrency: Optional[int] = None,
+    remote_fallback: bool = False,
 ) -> Dict[str, Any]:
     """
     Enrich building records from a JSON file.
 
+    With ndjson, records are streamed: read one at a time (line by line
+    for .ndjson/.jsonl inputs) and written as one JSON object per line,
+    so the enriched records are never held in memory together.
+
     Args:
         input_file: Path to input JSON file with building records
         output_file: Path to output JSON file
         gis_source: GIS source to use
         max_gis_features: Maximum GIS features to load
+        cache_dir: Directory for cached GIS responses (None = no cache)
+        refresh: Ignore cached GIS responses and re-fetch them
+        workers: Number of worker processes for matching (1 = in-process,
+            ignored with ndjson)
+        ndjson: Stream records and write NDJSON output
+        concurrency: Concurrent GIS page requests and connections per host
+            (default: from config / http_client)
+        remote_fallback: Search unmatched addresses on the GIS server
+            (ignored with ndjson)
 
     Returns:
         Enrichment statistics
     """
+    if ndjson:
+        return await _enrich_to_ndjson(
+            input_file,
+            output_file,
+            gis_source=gis_source,
+            max_gis_features=max_gis_features,
+            cache_dir=cache_dir,
+            refresh=refresh,
+            concurrency=concurrency,
+        )
+
     # Load input records
-    with open(input_file) as f:
-        records = json.load(f)
+    records = list(_iter_input_records(input_file))
 
     if not records:
         logger.warning("No records to enrich")
@@ -272,10 +765,11 @@ async def enrich_building_records(
     logger.info(f"Loaded {len(records)} records from {input_file}")
 
     # Create enricher
-    enricher = BuildingEnricher(gis_source)
+    enricher = BuildingEnricher(
+        gis_source, cache_dir=cache_dir, refresh=refresh, concurrency=concurrency
+    )
 
     # Run enrichment
-    connector = aiohttp.TCPConnector(limit=10)
 
     with Progress(
         SpinnerColumn(),
@@ -284,22 +778,77 @@ async def enrich_building_records(
         TaskProgressColumn(),
         console=console,
     ) as progress:
-        async with aiohttp.ClientSession(connector=connector) as session:
-            enriched = await enricher.enrich_records(
-                records, session, progress=progress
-            )
+        session = await get_session(limit_per_host=concurrency)
+        enriched = await enricher.enrich_records(
+            records,
+            session,
+            progress=progress,
+            workers=workers,
+            remote_fallback=remote_fallback,
+        )
 
     # Save output
     output_data = [r.to_dict() for r in enriched]
 
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2, default=str)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(
+            output_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        ))
 
     logger.info(f"Saved {len(enriched)} enriched records to {output_file}")
 
     return enricher.get_stats()
 
 
+async def _enrich_to_ndjson(
+    input_file: Path,
+    output_file: Path,
+    gis_source: str,
+    max_gis_features: Optional[int],
+    cache_dir: Optional[Path],
+    refresh: bool,
+    concurrency: Optional[int],
+) -> Dict[str, Any]:
+    """Stream records from input_file into an NDJSON output_file."""
+    enricher = BuildingEnricher(
+        gis_source, cache_dir=cache_dir, refresh=refresh, concurrency=concurrency
+    )
+
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+    ) as progress:
+        session = await get_session(limit_per_host=concurrency)
+        await enricher.load_gis_permits(
+            session, max_features=max_gis_features, progress=progress
+        )
+
+        task = progress.add_task("[green]Enriching records...", total=None)
+        with open(output_file, 'wb') as f:
+            for count, enriched in enumerate(
+                enricher.iter_enriched(_iter_input_records(input_file)), 1
+            ):
+                f.write(orjson.dumps(enriched.to_dict(), default=str) + b"\n")
+                if count % _PROGRESS_STEP == 0:
+                    progress.update(task, completed=count)
+
+        progress.update(task, completed=enricher.stats["total_records"])
+
+    written = enricher.stats["total_records"]
+    if not written:
+        logger.warning("No records to enrich")
+        return {"error": "No records found"}
+
+    logger.info(f"Saved {written} enriched records to {output_file}")
+
+    return enricher.get_stats()
+
+
 # CLI entry point
 def main():
     import argparse
@@ -330,6 +879,39 @@ def main():
         default=None,
         help="Maximum GIS features to load"
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Cache GIS query responses and parsed permits in this directory"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached GIS responses and permits (fresh ones are still cached)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for address matching (default: 1)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Concurrent GIS page requests / connections per host (default: 10 requests)"
+    )
+    parser.add_argument(
+        "--remote-fallback",
+        action="store_true",
+        help="Search addresses with no local match on the GIS server"
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream records and write NDJSON output (one record per line)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -346,7 +928,8 @@ def main():
 
     # Determine output file
     if args.output is None:
-        args.output = args.input_file.parent / f"{args.input_file.stem}_enriched.json"
+        suffix = ".ndjson" if args.ndjson else ".json"
+        args.output = args.input_file.parent / f"{args.input_file.stem}_enriched{suffix}"
 
     # Run enrichment
     console.print(f"[bold]Enriching records from {args.input_file}[/bold]")
@@ -354,12 +937,24 @@ def main():
     console.print(f"Output: {args.output}")
     console.print()
 
-    stats = asyncio.run(enrich_building_records(
-        args.input_file,
-        args.output,
-        gis_source=args.source,
-        max_gis_features=args.max_gis,
-    ))
+    async def run() -> Dict[str, Any]:
+        try:
+            return await enrich_building_records(
+                args.input_file,
+                args.output,
+                gis_source=args.source,
+                max_gis_features=args.max_gis,
+                cache_dir=args.cache_dir,
+                refresh=args.refresh,
+                workers=args.workers,
+                ndjson=args.ndjson,
+                concurrency=args.concurrency,
+                remote_fallback=args.remote_fallback,
+            )
+        finally:
+            await close_session()
+
+    stats = asyncio.run(run())
 
     console.print()
     console.print("[bold]Enrichment Statistics:[/bold]")
@@ -0,0 +1,74 @@
+"""
+Shared HTTP session for external data sources.
+
+Callers making many standalone fetch calls (e.g. the enricher) pass them
+one pooled aiohttp session from here, so repeated calls keep their TCP/TLS
+connections and DNS results warm instead of each opening (and tearing
+down) their own pool. Whoever calls get_session() closes it with
+close_session().
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+# Connection pool limits for the shared session
+SESSION_LIMIT = 100
+SESSION_LIMIT_PER_HOST = 20
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_session(limit_per_host: Optional[int] = None) -> aiohttp.ClientSession:
+    """
+    Get the shared session, creating it on first use.
+
+    Sessions are bound to an event loop, so a new one is created when
+    called from a different loop (e.g. a later asyncio.run()).
+
+    Args:
+        limit_per_host: Connections per host (default: SESSION_LIMIT_PER_HOST);
+            only applies when the session is created
+
+    Returns:
+        Shared aiohttp session with a pooled connector
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        connector = aiohttp.TCPConnector(
+            limit=max(SESSION_LIMIT, limit_per_host or 0),
+            limit_per_host=limit_per_host or SESSION_LIMIT_PER_HOST,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+        _session_loop = loop
+        logger.debug("Opened shared HTTP session")
+
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (call once at shutdown, in the same loop)."""
+    global _session, _session_loop
+
+    # A session from an earlier, finished loop cannot be closed here; drop it
+    if (
+        _session is not None
+        and not _session.closed
+        and _session_loop is asyncio.get_running_loop()
+    ):
+        await _session.close()
+        logger.debug("Closed shared HTTP session")
+
+    _session = None
+    _session_loop = None
@@ -8,12 +8,15 @@ for building permits and construction data.
 import asyncio
 import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from pathlib import Path
+from typing import Optional, List, Dict, Any, AsyncIterator
 
 import aiohttp
 
 from src.external.config import TLV_GIS_CONFIG, TLV_BUILDING_PERMITS_LAYER
-from src.external.arcgis_fetcher import ArcGISFetcher
+from src.external.addresses import normalize_address
+from src.external.arcgis_fetcher import ArcGISFetcher, gis_session
+from src.external.http_client import get_session, close_session
 from src.models.gis import GISBuildingPermit, GISFeature, GISQueryResult
 
 logger = logging.getLogger(__name__)
@@ -54,10 +57,30 @@ class TelAvivGISFetcher(ArcGISFetcher):
     and other municipal GIS layers with proper parsing of Hebrew field names.
     """
 
-    def __init__(self):
-        """Initialize with Tel Aviv GIS configuration."""
-        super().__init__(TLV_GIS_CONFIG)
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        refresh: bool = False,
+        keep_raw: bool = False,
+        max_concurrent: Optional[int] = None,
+    ):
+        """
+        Initialize with Tel Aviv GIS configuration.
+
+        Args:
+            cache_dir: Directory for cached query responses (None = no cache)
+            refresh: Bypass cached responses but still refresh them
+            keep_raw: Keep each permit's raw attribute dict in raw_attributes
+            max_concurrent: Concurrent page requests (default: from config)
+        """
+        super().__init__(
+            TLV_GIS_CONFIG,
+            cache_dir=cache_dir,
+            refresh=refresh,
+            max_concurrent=max_concurrent,
+        )
         self.permits_layer_id = TLV_BUILDING_PERMITS_LAYER.layer_id
+        self.keep_raw = keep_raw
 
     def _parse_date(self, timestamp: Optional[int]) -> Optional[datetime]:
         """
@@ -111,11 +134,18 @@ class TelAvivGISFetcher(ArcGISFetcher):
             source="telaviv",
             layer_id=self.permits_layer_id,
             fetched_at=feature.fetched_at,
-            raw_attributes=attrs,
+            raw_attributes=attrs if self.keep_raw else None,
         )
 
     def _extract_centroid(self, geometry: Optional[Dict]) -> Optional[tuple]:
-        """Extract centroid from polygon geometry."""
+        """
+        Extract the area-weighted centroid from polygon geometry.
+
+        Applies the shoelace formula over every ring. ArcGIS winds outer
+        rings clockwise and holes counter-clockwise, so holes subtract and
+        multi-part polygons add up without special handling. Falls back to
+        the vertex mean of the first ring when the polygon has no area.
+        """
         if not geometry:
             return None
 
@@ -123,16 +153,27 @@ class TelAvivGISFetcher(ArcGISFetcher):
         if not rings or not rings[0]:
             return None
 
-        # Calculate centroid from first ring
+        # Work relative to the first vertex to keep the products small
+        ox, oy = rings[0][0][0], rings[0][0][1]
+        area2 = cx = cy = 0.0
+        for ring in rings:
+            for p0, p1 in zip(ring, ring[1:] + ring[:1]):
+                x0, y0 = p0[0] - ox, p0[1] - oy
+                x1, y1 = p1[0] - ox, p1[1] - oy
+                cross = x0 * y1 - x1 * y0
+                area2 += cross
+                cx += (x0 + x1) * cross
+                cy += (y0 + y1) * cross
+
+        if area2:
+            return (ox + cx / (3 * area2), oy + cy / (3 * area2))
+
+        # Degenerate ring: vertex mean (transpose once, sum in C)
         ring = rings[0]
-        x_sum = sum(pt[0] for pt in ring)
-        y_sum = sum(pt[1] for pt in ring)
+        xs, ys, *_ = zip(*ring)
         n = len(ring)
 
-        if n == 0:
-            return None
-
-        return (x_sum / n, y_sum / n)
+        return (sum(xs) / n, sum(ys) / n)
 
     async def fetch_building_permits(
         self,
@@ -176,6 +217,38 @@ class TelAvivGISFetcher(ArcGISFetcher):
 
         return permits
 
+    async def iter_building_permits(
+        self,
+        session: aiohttp.ClientSession,
+        where: str = "1=1",
+        max_features: Optional[int] = None,
+        out_fields: Optional[List[str]] = None,
+        progress_callback: Optional[callable] = None,
+    ) -> AsyncIterator[GISBuildingPermit]:
+        """
+        Iterate over building permits as result pages arrive.
+
+        Args:
+            session: aiohttp session
+            where: SQL WHERE clause for filtering
+            max_features: Maximum permits to fetch
+            out_fields: Fields to return (None = default permit fields)
+            progress_callback: Called with (fetched, total) counts
+
+        Yields:
+            GISBuildingPermit records
+        """
+        async for feature in self.iter_all_features(
+            session,
+            self.permits_layer_id,
+            where=where,
+            out_fields=out_fields or TLV_PERMIT_FIELDS,
+            return_geometry=True,
+            max_features=max_features,
+            progress_callback=progress_callback,
+        ):
+            yield self._parse_permit(feature)
+
     async def fetch_permits_by_address(
         self,
         session: aiohttp.ClientSession,
@@ -205,6 +278,51 @@ class TelAvivGISFetcher(ArcGISFetcher):
 
         return [self._parse_permit(f) for f in result.features]
 
+    async def fetch_permits_by_addresses(
+        self,
+        session: aiohttp.ClientSession,
+        addresses: List[str],
+    ) -> Dict[str, List[GISBuildingPermit]]:
+        """
+        Fetch building permits for many addresses at once.
+
+        Lookups are batched into a few concurrent OR-LIKE queries (see
+        query_by_addresses) instead of one request per address.
+
+        Args:
+            session: aiohttp session
+            addresses: Addresses to search for (partial match)
+
+        Returns:
+            Dict mapping each address to the permits whose address contains
+            it (compared normalized, see addresses.normalize_address);
+            addresses without matches map to []
+        """
+        matches: Dict[str, List[GISBuildingPermit]] = {a: [] for a in addresses if a}
+        if not matches:
+            return {}
+
+        result = await self.query_by_addresses(
+            session,
+            self.permits_layer_id,
+            list(matches),
+            address_field="addresses",
+            out_fields=TLV_PERMIT_FIELDS,
+        )
+
+        if not result.success:
+            logger.warning(f"Address batch search failed: {result.error}")
+
+        permits = [self._parse_permit(f) for f in result.features]
+        normalized = [(normalize_address(address), found) for address, found in matches.items()]
+        for permit in permits:
+            permit_address = normalize_address(permit.address or "")
+            for address_norm, found in normalized:
+                if address_norm in permit_address:
+                    found.append(permit)
+
+        return matches
+
     async def fetch_permits_by_street(
         self,
         session: aiohttp.ClientSession,
@@ -360,6 +478,7 @@ class TelAvivGISFetcher(ArcGISFetcher):
 async def fetch_tlv_building_permits(
     where: str = "1=1",
     max_features: Optional[int] = None,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> List[GISBuildingPermit]:
     """
     Standalone function to fetch Tel Aviv building permits.
@@ -367,35 +486,46 @@ async def fetch_tlv_building_permits(
     Args:
         where: SQL WHERE clause
         max_features: Maximum permits to fetch
+        session: Session to reuse, e.g. http_client.get_session()
+            (None = open a new one for this call)
 
     Returns:
         List of GISBuildingPermit records
     """
     fetcher = TelAvivGISFetcher()
-    connector = fetcher.create_connector(fetcher.config.max_concurrent)
 
-    async with aiohttp.ClientSession(connector=connector) as session:
+    if session is not None:
         return await fetcher.fetch_building_permits(
-            session,
-            where=where,
-            max_features=max_features,
+            session, where=where, max_features=max_features
+        )
+
+    async with gis_session(fetcher.config) as session:
+        return await fetcher.fetch_building_permits(
+            session, where=where, max_features=max_features
         )
 
 
-async def search_tlv_permits_by_address(address: str) -> List[GISBuildingPermit]:
+async def search_tlv_permits_by_address(
+    address: str,
+    session: Optional[aiohttp.ClientSession] = None,
+) -> List[GISBuildingPermit]:
     """
     Search Tel Aviv building permits by address.
 
     Args:
         address: Address to search for
+        session: Session to reuse, e.g. http_client.get_session()
+            (None = open a new one for this call)
 
     Returns:
         List of matching GISBuildingPermit records
     """
     fetcher = TelAvivGISFetcher()
-    connector = fetcher.create_connector(fetcher.config.max_concurrent)
 
-    async with aiohttp.ClientSession(connector=connector) as session:
+    if session is not None:
+        return await fetcher.fetch_permits_by_address(session, address)
+
+    async with gis_session(fetcher.config) as session:
         return await fetcher.fetch_permits_by_address(session, address)
 
 
@@ -405,9 +535,9 @@ if __name__ == "__main__":
 
     async def main():
         fetcher = TelAvivGISFetcher()
-        connector = fetcher.create_connector()
+        session = await get_session()
 
-        async with aiohttp.ClientSession(connector=connector) as session:
+        try:
             # Get stats first
             print("Fetching Tel Aviv GIS stats...")
             stats = await fetcher.get_layer_stats(session)
@@ -435,5 +565,7 @@ if __name__ == "__main__":
 
                 for permit in results[:5]:
                     print(f"  - {permit.address}: {permit.permit_date}")
+        finally:
+            await close_session()
 
     asyncio.run(main())
@@ -1,6 +1,7 @@
 """Async HTTP fetchers for Complot API."""
 
-from src.fetchers.base import build_url, BaseFetcher
+from src.fetchers.admission import AdmissionController
+from src.fetchers.base import build_url, backoff_delay, throttle_delay, search_url_template, BaseFetcher
 from src.fetchers.street_fetcher import StreetFetcher, async_test_street, async_discover_range
 from src.fetchers.record_fetcher import RecordFetcher, async_fetch_records_for_street
 from src.fetchers.building_fetcher import BuildingFetcher, async_fetch_building_detail
@@ -9,7 +10,11 @@ from src.fetchers.request_fetcher import RequestFetcher, async_fetch_request_det
 __all__ = [
     # Base
     "build_url",
+    "backoff_delay",
+    "throttle_delay",
+    "search_url_template",
     "BaseFetcher",
+    "AdmissionController",
     # Street discovery
     "StreetFetcher",
     "async_test_street",
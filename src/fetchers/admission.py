@@ -0,0 +1,91 @@
+"""
+Adaptive concurrency limit for fetch batches.
+
+asyncio.Semaphore's counter cannot be safely changed while tasks hold or
+wait on it, so a limit that backs off when the server pushes back (429 /
+503) and ramps up again on sustained success is kept as an explicit
+in-flight counter guarded by an asyncio.Condition instead.
+"""
+
+import asyncio
+from typing import Optional
+
+# Statuses telling us the server wants fewer concurrent requests
+THROTTLE_STATUSES = frozenset((429, 503))
+
+# Fraction of the limit kept after a throttled response
+BACKOFF_FACTOR = 0.8
+
+# Consecutive successful responses before the limit grows by one
+RAMP_UP_AFTER = 50
+
+
+class AdmissionController:
+    """
+    A resizable limit on concurrent fetches.
+
+    Use like a semaphore (``async with controller: ...``) and report
+    response statuses with record() to let the limit adapt.
+    """
+
+    def __init__(self, limit: int, min_limit: int = 1, max_limit: Optional[int] = None):
+        """
+        Initialize admission controller.
+
+        Args:
+            limit: Initial number of concurrent fetches
+            min_limit: The limit never shrinks below this
+            max_limit: The limit never grows above this (default: limit)
+        """
+        self._active = 0
+        self._limit = limit
+        self._min_limit = min_limit
+        self._max_limit = max_limit or limit
+        self._successes = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of fetches admitted at once."""
+        return self._limit
+
+    async def acquire(self) -> None:
+        """Wait until a fetch may start."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Mark a fetch as finished, admitting a waiting one."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def resize(self, limit: int) -> None:
+        """Change the limit; fetches already running are not interrupted."""
+        async with self._cond:
+            self._limit = max(self._min_limit, min(self._max_limit, limit))
+            self._cond.notify_all()
+
+    async def record(self, status: int) -> None:
+        """
+        Adapt the limit to a response status.
+
+        A throttled response shrinks the limit by BACKOFF_FACTOR; every
+        RAMP_UP_AFTER successes in a row grow it back by one.
+        """
+        if status in THROTTLE_STATUSES:
+            self._successes = 0
+            await self.resize(int(self._limit * BACKOFF_FACTOR))
+        elif status == 200:
+            self._successes += 1
+            if self._successes >= RAMP_UP_AFTER and self._limit < self._max_limit:
+                self._successes = 0
+                await self.resize(self._limit + 1)
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.release()
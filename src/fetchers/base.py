@@ -5,10 +5,19 @@ Provides common URL building and HTTP request patterns.
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+import codecs
+import random
+import socket
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
 import aiohttp
 
+try:
+    from aiohttp_client_cache import CachedSession, SQLiteBackend
+except ImportError:
+    CachedSession = SQLiteBackend = None
+
 from src.config import CityConfig, DEFAULT_SETTINGS
 
 
@@ -17,7 +26,50 @@ API_BASE = DEFAULT_SETTINGS.api_base
 REQUEST_TIMEOUT = DEFAULT_SETTINGS.request_timeout
 MAX_RETRIES = DEFAULT_SETTINGS.max_retries
 RETRY_DELAY = DEFAULT_SETTINGS.retry_delay
+MAX_BACKOFF = DEFAULT_SETTINGS.max_backoff
 MAX_CONCURRENT = DEFAULT_SETTINGS.max_concurrent
+KEEPALIVE_TIMEOUT = DEFAULT_SETTINGS.keepalive_timeout
+DNS_CACHE_TTL = DEFAULT_SETTINGS.dns_cache_ttl
+RESPONSE_CACHE_TTL = DEFAULT_SETTINGS.response_cache_ttl
+
+# Responses are HTML and compress well; aiohttp decodes them transparently
+ACCEPT_ENCODING = "gzip, deflate"
+
+# Search pages are read in chunks of this size (see read_search_page)
+SEARCH_READ_CHUNK = 4096
+
+# Markers of a search page: its results table, the start of a script, the
+# "found" line of a page with results, and the "not found" / "cannot
+# display" messages of a page without results. Pages are probed for them in
+# the response's encoding before being decoded (see _page_markers).
+_PAGE_MARKERS = ("results-table", "<script", "נמצאו", ("לא אותרו", "לא ניתן"))
+
+# Ways a request can fail that a fetch loop skips past; anything else is a
+# bug and propagates instead of being swallowed
+REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError)
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff delay before retrying after failed attempt `attempt` (0-based).
+
+    The delay is drawn from [RETRY_DELAY, 3 * RETRY_DELAY * 2**attempt] and
+    capped at MAX_BACKOFF. The wide spread keeps many tasks that failed
+    together (e.g. on a server hiccup) from all retrying in lockstep.
+    """
+    return min(MAX_BACKOFF, random.uniform(RETRY_DELAY, RETRY_DELAY * (2 ** attempt) * 3))
+
+
+def throttle_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Delay before retrying a request the server throttled (429 / 503).
+
+    Honors a numeric Retry-After header (capped at MAX_BACKOFF), otherwise
+    the same as backoff_delay(attempt).
+    """
+    if retry_after and retry_after.isdigit():
+        return min(MAX_BACKOFF, float(retry_after))
+    return backoff_delay(attempt)
 
 
 def build_url(program: str, **params) -> str:
@@ -35,6 +87,124 @@ def build_url(program: str, **params) -> str:
     return f"{API_BASE}?appname=cixpa&prgname={program}&{param_str}"
 
 
+def search_url_template(api_type: str, site_id: int, city_code: int, street_code: int) -> str:
+    """
+    Address search URL for a street with only the house number left to fill in.
+
+    Only the house number varies between a street's searches, so the rest of
+    the URL is built once; use the result's .format(h=house_num).
+    """
+    if api_type == "tikim":
+        return build_url(
+            "GetTikimByAddress",
+            siteid=site_id,
+            c=city_code,
+            s=street_code,
+            h="{h}",
+            l="true",
+            arguments="siteid,c,s,h,l"
+        )
+    return build_url(
+        "GetBakashotByAddress",
+        siteid=site_id,
+        grp=0,
+        t=1,
+        c=city_code,
+        s=street_code,
+        h="{h}",
+        l="true",
+        arguments="siteId,grp,t,c,s,h,l"
+    )
+
+
+def _response_encoding(resp: aiohttp.ClientResponse) -> str:
+    """
+    Encoding of a response whose body is read by hand.
+
+    Like resp.get_encoding() for the declared charset, falling back to UTF-8
+    as aiohttp's default charset resolver does (get_encoding() itself needs
+    a body read through resp.read()).
+    """
+    if resp.charset:
+        try:
+            return codecs.lookup(resp.charset).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+@lru_cache(maxsize=None)
+def _page_markers(encoding: str) -> Optional[Tuple]:
+    """
+    _PAGE_MARKERS encoded as they appear in a raw page of the given encoding.
+
+    Returns None when the markers cannot be written in that encoding, or
+    the encoding is not ASCII compatible (e.g. UTF-16), in which case pages
+    are only probed after decoding.
+    """
+    table, script, found, no_results = _PAGE_MARKERS
+    if table.encode(encoding) != table.encode("ascii"):
+        return None
+    try:
+        return (
+            table.encode(encoding),
+            script.encode(encoding),
+            found.encode(encoding),
+            tuple(marker.encode(encoding) for marker in no_results),
+        )
+    except UnicodeEncodeError:
+        return None
+
+
+def _is_empty(page, markers: Tuple) -> bool:
+    """Check whether a (partial) page says it has no results before any results table or script."""
+    table, script, _, no_results = markers
+    return table not in page and script not in page and any(marker in page for marker in no_results)
+
+
+async def read_search_page(resp: aiohttp.ClientResponse, found_only: bool = False) -> Optional[str]:
+    """
+    Read an address search page, skipping pages without results.
+
+    The body is read in chunks; once a "not found" message shows up before
+    any results table (and before any script that could contain the text),
+    the rest is drained without being kept or decoded, so the connection
+    can still be reused. Pages are only decoded once the raw bytes show
+    they are worth parsing. (On a response-caching session the body has
+    already been downloaded in full; see BaseFetcher.create_session.)
+
+    The markers are looked for in the response's own encoding; for an
+    encoding that cannot represent them the page is read in full and
+    checked after decoding.
+
+    Args:
+        resp: Response to a search URL
+        found_only: Also skip pages that do not say results were found
+
+    Returns:
+        The page HTML, or None if it has no results table
+    """
+    encoding = _response_encoding(resp)
+    markers = _page_markers(encoding)
+    if markers is None:
+        page = (await resp.read()).decode(encoding, errors="replace")
+        markers = _PAGE_MARKERS
+        empty = _is_empty(page, markers)
+    else:
+        page = bytearray()
+        empty = False
+        async for chunk in resp.content.iter_chunked(SEARCH_READ_CHUNK):
+            if empty:
+                continue
+            page += chunk
+            empty = _is_empty(page, markers)
+
+    table, _, found, _ = markers
+    if empty or table not in page or (found_only and found not in page):
+        return None
+    return page if isinstance(page, str) else page.decode(encoding, errors="replace")
+
+
 class BaseFetcher:
     """Base class for async HTTP fetchers."""
 
@@ -56,14 +226,14 @@ class BaseFetcher:
         """Get default HTTP headers."""
         return {
             "Referer": self.config.base_url,
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
 
     async def fetch_with_retry(
         self,
         session: aiohttp.ClientSession,
-        url: str,
-        retry: int = 0
+        url: str
     ) -> Optional[str]:
         """
         Fetch URL with exponential backoff retry.
@@ -71,39 +241,144 @@ class BaseFetcher:
         Args:
             session: aiohttp session
             url: URL to fetch
-            retry: Current retry count
 
         Returns:
             Response text or None on failure
         """
-        try:
-            async with session.get(
-                url,
-                headers=self.get_headers(),
-                timeout=self.timeout
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.text()
-                return None
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(
+                    url,
+                    headers=self.get_headers(),
+                    timeout=self.timeout
+                ) as resp:
+                    if resp.status == 200:
+                        return await resp.text()
+                    return None
 
-        except asyncio.TimeoutError:
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                return await self.fetch_with_retry(session, url, retry + 1)
-            return None
-
-        except Exception:
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                return await self.fetch_with_retry(session, url, retry + 1)
-            return None
+            except Exception:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                return None
 
     @staticmethod
     def create_connector() -> aiohttp.TCPConnector:
-        """Create a TCP connector with appropriate limits."""
-        return aiohttp.TCPConnector(limit=MAX_CONCURRENT)
+        """Create a TCP connector with appropriate limits and long-lived keep-alive."""
+        return aiohttp.TCPConnector(
+            limit=MAX_CONCURRENT,
+            limit_per_host=MAX_CONCURRENT,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            # Connect over IPv4 only: no AAAA lookups or happy-eyeballs racing per connection
+            family=socket.AF_INET,
+            happy_eyeballs_delay=None,
+            enable_cleanup_closed=True,
+        )
+
+    @staticmethod
+    def create_session(
+        connector: aiohttp.TCPConnector,
+        cache_path: Optional[str] = None,
+        **kwargs
+    ) -> aiohttp.ClientSession:
+        """
+        Create a session over the given connector.
+
+        Given a cache_path and with aiohttp-client-cache installed, successful
+        GET responses are cached in that SQLite file (keyed on the full URL)
+        for RESPONSE_CACHE_TTL seconds, so re-running a crawl replays
+        unchanged searches locally. Callers pass no path to fetch fresh
+        (e.g. on --force).
+
+        A cached session reads every response body in full before handing
+        it over, so read_search_page can no longer stop downloading a page
+        without results early; it still skips decoding it.
+
+        Args:
+            connector: Connector for the session
+            cache_path: Response cache database (default: no cache)
+            **kwargs: Further ClientSession arguments (e.g. cookie_jar)
+        """
+        if CachedSession is None or cache_path is None:
+            return aiohttp.ClientSession(connector=connector, **kwargs)
+        cache = SQLiteBackend(
+            cache_path,
+            expire_after=RESPONSE_CACHE_TTL,
+            allowed_codes=(200,),
+        )
+        return CachedSession(cache=cache, connector=connector, **kwargs)
 
     @staticmethod
     def create_semaphore(limit: int = None) -> asyncio.Semaphore:
         """Create a semaphore for concurrency control."""
         return asyncio.Semaphore(limit or MAX_CONCURRENT)
+
+
+# Per-process sessions shared by worker batches (request and street
+# discovery, building details), so keep-alive connections (and TLS
+# sessions) outlive each batch. Holds the loop they are bound to, the lock
+# guarding creation and the sessions by key.
+_shared: Dict[str, Any] = {}
+
+
+async def shared_session(
+    key: Hashable,
+    factory: Callable[[], aiohttp.ClientSession]
+) -> aiohttp.ClientSession:
+    """
+    Get this process's shared session for a key, creating it on first use.
+
+    Sessions and locks are bound to an event loop, so all of them are
+    recreated when called from a different loop.
+
+    Args:
+        key: What the session is for; each key gets its own session
+        factory: Creates the session when there is none (or it was closed)
+
+    Returns:
+        Shared aiohttp session
+    """
+    loop = asyncio.get_running_loop()
+    if _shared.get("loop") is not loop:
+        _shared.clear()
+        _shared.update(loop=loop, lock=asyncio.Lock(), sessions={})
+
+    async with _shared["lock"]:
+        session = _shared["sessions"].get(key)
+        if session is None or session.closed:
+            session = _shared["sessions"][key] = factory()
+
+    return session
+
+
+async def get_shared_session(cache_path: Optional[str] = None) -> aiohttp.ClientSession:
+    """
+    Get this process's shared API session, creating it on first use.
+
+    These APIs set no cookies we need, so the session skips cookie
+    processing entirely.
+
+    Args:
+        cache_path: Response cache database (see BaseFetcher.create_session);
+            each cache path gets its own session
+
+    Returns:
+        Shared aiohttp session
+    """
+    return await shared_session(
+        ("api", cache_path),
+        lambda: BaseFetcher.create_session(
+            BaseFetcher.create_connector(), cache_path, cookie_jar=aiohttp.DummyCookieJar()
+        ),
+    )
+
+
+async def aclose_shared_sessions() -> None:
+    """Close every shared session (call in the loop that opened them)."""
+    if _shared.get("loop") is asyncio.get_running_loop():
+        for session in _shared["sessions"].values():
+            if not session.closed:
+                await session.close()
+
+    _shared.clear()
@@ -6,26 +6,42 @@ Fetches detailed building information from GetTikFile API.
 
 import asyncio
 from datetime import datetime
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 import aiohttp
 
 from src.config import CityConfig
 from src.fetchers.base import (
-    BaseFetcher, build_url,
-    REQUEST_TIMEOUT, MAX_RETRIES, RETRY_DELAY, MAX_CONCURRENT
+    BaseFetcher, build_url, backoff_delay, shared_session,
+    REQUEST_TIMEOUT, MAX_RETRIES, MAX_CONCURRENT, ACCEPT_ENCODING
 )
 from src.parsers.building_parser import parse_building_detail
+from src.storage.html_cache import HtmlCache
+
+
+@lru_cache(maxsize=None)
+def tik_url_template(site_id) -> str:
+    """
+    GetTikFile URL for a site with only the tik number left to fill in.
+
+    Only the tik number varies between detail requests, so the rest of the
+    URL is built once; use tik_url_template(site_id).format(tik=tik_number).
+    """
+    return build_url("GetTikFile", siteid=site_id, t="{tik}", arguments="siteid,t")
 
 
 class BuildingFetcher(BaseFetcher):
     """Fetcher for building detail information."""
 
+    def __init__(self, config: CityConfig):
+        super().__init__(config)
+        self._url_template = tik_url_template(config.site_id)
+
     async def fetch_detail(
         self,
         session: aiohttp.ClientSession,
-        tik_number: str,
-        retry: int = 0
+        tik_number: str
     ) -> Dict:
         """
         Fetch details for a single building.
@@ -33,41 +49,36 @@ class BuildingFetcher(BaseFetcher):
         Args:
             session: aiohttp session
             tik_number: Building file number
-            retry: Current retry count
 
         Returns:
             Building detail dict
         """
-        url = build_url(
-            "GetTikFile",
-            siteid=self.config.site_id,
-            t=tik_number,
-            arguments="siteid,t"
-        )
-
-        try:
-            async with session.get(
-                url,
-                headers=self.get_headers(),
-                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-            ) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    return parse_building_detail(html, tik_number)
-                else:
-                    return self._error_result(tik_number, f"HTTP {resp.status}")
-
-        except asyncio.TimeoutError:
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                return await self.fetch_detail(session, tik_number, retry + 1)
-            return self._error_result(tik_number, "Timeout")
-
-        except Exception as e:
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                return await self.fetch_detail(session, tik_number, retry + 1)
-            return self._error_result(tik_number, str(e))
+        url = self._url_template.format(tik=tik_number)
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(
+                    url,
+                    headers=self.get_headers(),
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                ) as resp:
+                    if resp.status == 200:
+                        html = await resp.text()
+                        return parse_building_detail(html, tik_number)
+                    else:
+                        return self._error_result(tik_number, f"HTTP {resp.status}")
+
+            except asyncio.TimeoutError:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                return self._error_result(tik_number, "Timeout")
+
+            except Exception as e:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                return self._error_result(tik_number, str(e))
 
     async def fetch_all_details(
         self,
@@ -107,126 +118,205 @@ class BuildingFetcher(BaseFetcher):
 
     def _error_result(self, tik_number: str, error: str) -> Dict:
         """Create an error result dict."""
-        return {
-            "tik_number": tik_number,
-            "address": "",
-            "neighborhood": "",
-            "addresses": [],
-            "gush_helka": [],
-            "plans": [],
-            "requests": [],
-            "stakeholders": [],
-            "documents": [],
-            "fetch_status": "error",
-            "fetch_error": error,
-            "fetched_at": datetime.now().isoformat()
-        }
-
-
-# Standalone function for multiprocessing workers
+        return error_detail(tik_number, error)
+
+
+def error_detail(tik_number: str, error: str) -> Dict:
+    """Create a failed building detail dict (same shape as parse_building_detail)."""
+    return {
+        "tik_number": tik_number,
+        "address": "",
+        "neighborhood": "",
+        "addresses": [],
+        "gush_helka": [],
+        "plans": [],
+        "requests": [],
+        "stakeholders": [],
+        "documents": [],
+        "fetch_status": "error",
+        "fetch_error": error,
+        "fetched_at": datetime.now().isoformat()
+    }
 
-async def async_fetch_building_detail(
+
+# Standalone functions for multiprocessing workers
+
+async def _fetch_raw_detail(
     session: aiohttp.ClientSession,
     config_dict: dict,
     tik_number: str,
-    retry: int = 0
-) -> dict:
+    html_cache: Optional[HtmlCache] = None
+) -> Tuple[Union[str, bytes, dict], Optional[Mapping[str, str]]]:
     """
-    Fetch building detail (standalone function for workers).
+    Fetch a building detail page without parsing it.
 
-    Args:
-        session: aiohttp session
-        config_dict: City config as dictionary
-        tik_number: Building file number
-        retry: Current retry count
+    The cache is neither read nor revalidated against when the config's
+    'force' key is set; pages are only added to it by _parse_page, once
+    they parsed successfully.
 
     Returns:
-        Building detail dict
+        (page, response_headers): the page HTML (from html_cache when present
+        there) or an error dict if it could not be fetched, and the headers
+        of a freshly downloaded page (None otherwise)
     """
-    url = build_url(
-        "GetTikFile",
-        siteid=config_dict['site_id'],
-        t=tik_number,
-        arguments="siteid,t"
-    )
+    use_cache = html_cache is not None and not config_dict.get('force')
+    if use_cache:
+        html = html_cache.get(tik_number)
+        if html is not None:
+            return html, None
+
+    url = tik_url_template(config_dict['site_id']).format(tik=tik_number)
 
     headers = {
         "Referer": config_dict['base_url'],
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+        "Accept-Encoding": ACCEPT_ENCODING,
     }
+    if use_cache:
+        # An expired cached page is revalidated instead of re-downloaded
+        headers.update(html_cache.conditional_headers(tik_number))
 
-    try:
-        async with session.get(
-            url,
-            headers=headers,
-            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-        ) as resp:
-            if resp.status == 200:
-                html = await resp.text()
-                return parse_building_detail(html, tik_number)
-            else:
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as resp:
+                if resp.status == 200:
+                    return await resp.text(), resp.headers
+                elif resp.status == 304 and use_cache:
+                    # Unchanged since it was cached; reuse the cached page
+                    html = html_cache.refresh(tik_number)
+                    if html is not None:
+                        return html, None
                 return {
                     "tik_number": tik_number,
                     "fetch_status": "error",
                     "fetch_error": f"HTTP {resp.status}",
                     "fetched_at": datetime.now().isoformat()
-                }
-
-    except asyncio.TimeoutError:
-        if retry < MAX_RETRIES:
-            await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-            return await async_fetch_building_detail(session, config_dict, tik_number, retry + 1)
-        return {
-            "tik_number": tik_number,
-            "fetch_status": "error",
-            "fetch_error": "Timeout",
-            "fetched_at": datetime.now().isoformat()
-        }
+                }, None
+
+        except asyncio.TimeoutError:
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            return {
+                "tik_number": tik_number,
+                "fetch_status": "error",
+                "fetch_error": "Timeout",
+                "fetched_at": datetime.now().isoformat()
+            }, None
 
+        except Exception as e:
+            if attempt < MAX_RETRIES:
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+            return {
+                "tik_number": tik_number,
+                "fetch_status": "error",
+                "fetch_error": str(e),
+                "fetched_at": datetime.now().isoformat()
+            }, None
+
+
+def _parse_page(
+    page: Union[str, bytes, dict],
+    tik_number: str,
+    html_cache: Optional[HtmlCache] = None,
+    response_headers: Optional[Mapping[str, str]] = None
+) -> dict:
+    """
+    Parse a page from _fetch_raw_detail (error dicts pass through).
+
+    A freshly downloaded page (one with response_headers) is added to
+    html_cache only if it parsed successfully, so a "No data available"
+    page is fetched again next time instead of being replayed.
+    """
+    if isinstance(page, dict):
+        return page
+    try:
+        detail = parse_building_detail(page, tik_number)
     except Exception as e:
-        if retry < MAX_RETRIES:
-            await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-            return await async_fetch_building_detail(session, config_dict, tik_number, retry + 1)
-        return {
-            "tik_number": tik_number,
-            "fetch_status": "error",
-            "fetch_error": str(e),
-            "fetched_at": datetime.now().isoformat()
-        }
+        return error_detail(tik_number, str(e))
+    if html_cache is not None and response_headers is not None and detail['fetch_status'] == 'success':
+        html_cache.put(tik_number, page, response_headers)
+    return detail
 
 
-async def async_fetch_details_batch(
+async def async_fetch_building_detail(
+    session: aiohttp.ClientSession,
     config_dict: dict,
-    tik_numbers: List[str]
-) -> List[dict]:
+    tik_number: str,
+    html_cache: Optional[HtmlCache] = None
+) -> dict:
     """
-    Fetch building details for a batch (standalone function for workers).
+    Fetch building detail (standalone function for workers).
 
     Args:
+        session: aiohttp session
         config_dict: City config as dictionary
-        tik_numbers: List of building file numbers
+        tik_number: Building file number
+        html_cache: Optional cache of fetched pages; a recent cached page is
+            parsed instead of fetched (unless config_dict['force'] is set), and
+            fetched pages that parse successfully are added to it
 
     Returns:
-        List of building detail dicts
+        Building detail dict
     """
-    details = []
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    page, response_headers = await _fetch_raw_detail(session, config_dict, tik_number, html_cache)
+    return _parse_page(page, tik_number, html_cache, response_headers)
 
-    async def fetch_with_semaphore(session, tik):
-        async with semaphore:
-            return await async_fetch_building_detail(session, config_dict, tik)
 
-    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [fetch_with_semaphore(session, tik) for tik in tik_numbers]
+async def get_details_session() -> aiohttp.ClientSession:
+    """Get this process's shared details session (see base.shared_session)."""
+    return await shared_session(
+        "details", lambda: aiohttp.ClientSession(connector=BaseFetcher.create_connector())
+    )
+
 
-        batch_size = 100
-        for i in range(0, len(tasks), batch_size):
-            batch = tasks[i:i + batch_size]
-            results = await asyncio.gather(*batch, return_exceptions=True)
+async def async_fetch_details_batch(
+    config_dict: dict,
+    tik_numbers: List[str],
+    session: Optional[aiohttp.ClientSession] = None,
+    html_cache: Optional[HtmlCache] = None
+) -> List[dict]:
+    """
+    Fetch building details for a batch (standalone function for workers).
 
-            for result in results:
-                if isinstance(result, dict):
-                    details.append(result)
+    Args:
+        config_dict: City config as dictionary
+        tik_numbers: List of building file numbers
+        session: aiohttp session (default: the per-process shared session)
+        html_cache: Optional cache of fetched pages (see async_fetch_building_detail)
 
-    return details
+    Returns:
+        List of building detail dicts
+    """
+    # Fetch each tik once, in first-seen order
+    tik_numbers = list(dict.fromkeys(tik_numbers))
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, tik in enumerate(tik_numbers):
+        queue.put_nowait((index, tik))
+    parses: List[Optional[asyncio.Future]] = [None] * len(tik_numbers)
+
+    if session is None:
+        session = await get_details_session()
+
+    async def consumer():
+        # Each consumer takes the next tik as soon as its last request is done,
+        # so MAX_CONCURRENT requests stay in flight until the queue runs dry
+        while True:
+            try:
+                index, tik = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            page, response_headers = await _fetch_raw_detail(session, config_dict, tik, html_cache)
+            # Parse in a thread (lxml releases the GIL) while this consumer
+            # moves on to its next request
+            parses[index] = asyncio.ensure_future(
+                asyncio.to_thread(_parse_page, page, tik, html_cache, response_headers)
+            )
+
+    await asyncio.gather(*(consumer() for _ in range(min(MAX_CONCURRENT, len(tik_numbers)))))
+    return list(await asyncio.gather(*parses))
@@ -0,0 +1,82 @@
+"""
+Persistent cache of addresses known to have no building records.
+
+Most house numbers of most streets have no results, and every run used to
+ask for all of them again. Empty (city, street, house number) lookups are
+recorded in SQLite so later runs can skip the request entirely; entries
+expire after EMPTY_CACHE_MAX_AGE_DAYS so new buildings are still found.
+
+The database lives in the city's output directory (see the
+'empty_cache_path' key of a worker config dict). Both functions block on
+SQLite, so async callers run them with asyncio.to_thread().
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+from src.config import DEFAULT_SETTINGS
+
+EMPTY_CACHE_MAX_AGE_DAYS = DEFAULT_SETTINGS.empty_cache_max_age_days
+
+# One connection per database and process: a connection inherited across
+# fork is unusable. Connections are used from to_thread() worker threads,
+# so each is guarded by its own lock.
+_connections: Dict[str, Tuple[int, sqlite3.Connection, threading.Lock]] = {}
+
+
+def _connect(path: str) -> Tuple[sqlite3.Connection, threading.Lock]:
+    """Get this process's connection to a cache database, creating it on first use."""
+    entry = _connections.get(path)
+    if entry is None or entry[0] != os.getpid():
+        # Several worker processes write at once; wait for each other's locks
+        conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS empty_addresses ("
+            " city TEXT NOT NULL, street INTEGER NOT NULL, house INTEGER NOT NULL,"
+            " seen_at REAL NOT NULL,"
+            " PRIMARY KEY (city, street, house))"
+        )
+        entry = (os.getpid(), conn, threading.Lock())
+        _connections[path] = entry
+    return entry[1], entry[2]
+
+
+def known_empty_houses(path: str, city: str, street: int) -> FrozenSet[int]:
+    """Load the house numbers of a street that recently returned no results."""
+    cutoff = time.time() - EMPTY_CACHE_MAX_AGE_DAYS * 86400
+    conn, lock = _connect(path)
+    with lock:
+        rows = conn.execute(
+            "SELECT house FROM empty_addresses WHERE city = ? AND street = ? AND seen_at >= ?",
+            (city, street, cutoff),
+        ).fetchall()
+    return frozenset(row[0] for row in rows)
+
+
+def update_street(path: str, city: str, street: int, empty: Iterable[int], found: Iterable[int]) -> None:
+    """
+    Record the outcome of a street's house numbers in one transaction.
+
+    Args:
+        path: Cache database path
+        city: City key ("site_id/city_code")
+        street: Street code
+        empty: House numbers that returned no results
+        found: House numbers that returned results (forgotten if cached)
+    """
+    now = time.time()
+    conn, lock = _connect(path)
+    with lock, conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO empty_addresses (city, street, house, seen_at) VALUES (?, ?, ?, ?)",
+            [(city, street, house, now) for house in empty],
+        )
+        conn.executemany(
+            "DELETE FROM empty_addresses WHERE city = ? AND street = ? AND house = ?",
+            [(city, street, house) for house in found],
+        )
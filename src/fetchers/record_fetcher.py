@@ -1,21 +1,77 @@
 """
 Building record fetcher.
 
-Fetches building records by address search.
+Fetches building records by address search. Result pages are parsed
+straight into an lxml tree: BeautifulSoup's pure-Python 'html.parser' cost
+more than the request itself, and most of these pages hold no results.
 """
 
 import asyncio
 import re
-from typing import List, Dict
+from collections import deque
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Dict, Tuple
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
 
-from src.config import CityConfig
+from src.config import CityConfig, DEFAULT_SETTINGS
 from src.fetchers.base import (
-    BaseFetcher, build_url,
-    REQUEST_TIMEOUT, MAX_CONCURRENT
+    BaseFetcher, read_search_page, search_url_template,
+    REQUEST_TIMEOUT, REQUEST_ERRORS, MAX_CONCURRENT
 )
+from src.fetchers.empty_cache import known_empty_houses, update_street
+from src.parsers.base import page_text, parse_html, text_of
+from src.parsers.search_parser import CITY_CELLS, RESULT_ROWS, ROW_LINKS
+
+# Compiled once; these run on every link of every results row
+_TIK_RE = re.compile(r'getBuilding\((\d+)\)')
+_DIGITS_RE = re.compile(r'\d+')
+
+# House numbers of one street requested at once
+HOUSE_NUMBER_CONCURRENCY = DEFAULT_SETTINGS.house_number_concurrency
+
+# A street is done after this many empty house numbers in a row
+MAX_CONSECUTIVE_EMPTY = DEFAULT_SETTINGS.max_consecutive_empty
+
+# Trailing result columns that can hold the gush/helka numbers
+GUSH_HELKA_COLUMNS = 5
+
+# Result of a house number request that failed: neither a hit nor a miss
+_FAILED = object()
+
+
+async def _fetch_in_order(
+    fetch: Callable[[int], Awaitable[Any]],
+    house_numbers: Iterable[int],
+    concurrency: int
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Run fetch(house_num) for each house number, up to `concurrency` at a time.
+
+    Results are yielded as (house_num, result) in house-number order, so
+    callers see the same sequence as a serial loop while the next requests
+    are already in flight. Closing the generator early (e.g. on a run of
+    empty results) cancels the requests still pending.
+    """
+    house_numbers = iter(house_numbers)
+    pending = deque()
+    try:
+        for house_num in house_numbers:
+            pending.append((house_num, asyncio.ensure_future(fetch(house_num))))
+            if len(pending) >= concurrency:
+                break
+
+        while pending:
+            house_num, task = pending.popleft()
+            result = await task
+            next_num = next(house_numbers, None)
+            if next_num is not None:
+                pending.append((next_num, asyncio.ensure_future(fetch(next_num))))
+            yield house_num, result
+    finally:
+        for _, task in pending:
+            task.cancel()
 
 
 class RecordFetcher(BaseFetcher):
@@ -25,7 +81,8 @@ class RecordFetcher(BaseFetcher):
         self,
         session: aiohttp.ClientSession,
         street: Dict,
-        max_house_number: int = 500
+        max_house_number: int = 500,
+        concurrency: int = HOUSE_NUMBER_CONCURRENCY
     ) -> List[Dict]:
         """
         Fetch all building records for a street.
@@ -34,60 +91,98 @@ class RecordFetcher(BaseFetcher):
             session: aiohttp session
             street: Street dict with 'code' and 'name'
             max_house_number: Maximum house number to try
+            concurrency: House numbers requested at once
 
         Returns:
-            List of building record dicts
+            List of building record dicts, in house-number order
         """
-        records = []
+        return [
+            record async for record in
+            self.iter_records_for_street(session, street, max_house_number, concurrency)
+        ]
+
+    async def iter_records_for_street(
+        self,
+        session: aiohttp.ClientSession,
+        street: Dict,
+        max_house_number: int = 500,
+        concurrency: int = HOUSE_NUMBER_CONCURRENCY
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield a street's building records as their pages are parsed.
+
+        Lets callers stream records (e.g. to disk) without holding a whole
+        street in memory. A caller that stops early should aclose() the
+        generator so requests still in flight are cancelled.
+
+        Args:
+            session: aiohttp session
+            street: Street dict with 'code' and 'name'
+            max_house_number: Maximum house number to try
+            concurrency: House numbers requested at once
+
+        Yields:
+            Building record dicts, in house-number order
+        """
+        consecutive_empty = 0
+        url_template = self._search_url_template(street['code'])
+
+        async def fetch(house_num: int):
+            url = url_template.format(h=house_num)
+            return await self._fetch_house_number(session, url, street, house_num)
+
+        async with aclosing(_fetch_in_order(fetch, range(1, max_house_number), concurrency)) as results:
+            async for _, page_records in results:
+                if page_records is _FAILED:
+                    continue
+
+                if not page_records:
+                    consecutive_empty += 1
+                    if consecutive_empty >= MAX_CONSECUTIVE_EMPTY:
+                        break  # Early exit - no more results expected
+                    continue
+
+                consecutive_empty = 0
+                for record in page_records:
+                    yield record
+
+    async def _fetch_house_number(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        street: Dict,
+        house_num: int
+    ) -> Any:
+        """Fetch the building records at one address ([] if none, _FAILED on error)."""
         street_code = street['code']
-        street_name = street['name']
-
-        for house_num in range(1, max_house_number):
-            url = self._build_search_url(street_code, house_num)
-
-            try:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-
-                    html = await resp.text()
-                    page_records = self._parse_records(
-                        html, street_code, street_name, house_num
-                    )
-                    records.extend(page_records)
-
-            except Exception:
-                continue
 
-        return records
+        try:
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+            ) as resp:
+                if resp.status != 200:
+                    return _FAILED
+
+                html = await read_search_page(resp)
+                if html is None:
+                    return []
+                return self._parse_records(
+                    html, street_code, street['name'], house_num
+                )
+
+        except REQUEST_ERRORS:
+            return _FAILED
 
     def _build_search_url(self, street_code: int, house_num: int) -> str:
         """Build URL for address search."""
-        if self.config.api_type == "tikim":
-            return build_url(
-                "GetTikimByAddress",
-                siteid=self.config.site_id,
-                c=self.config.city_code,
-                s=street_code,
-                h=house_num,
-                l="true",
-                arguments="siteid,c,s,h,l"
-            )
-        else:
-            return build_url(
-                "GetBakashotByAddress",
-                siteid=self.config.site_id,
-                grp=0,
-                t=1,
-                c=self.config.city_code,
-                s=street_code,
-                h=house_num,
-                l="true",
-                arguments="siteId,grp,t,c,s,h,l"
-            )
+        return self._search_url_template(street_code).format(h=house_num)
+
+    def _search_url_template(self, street_code: int) -> str:
+        """Build the address search URL for a street, leaving the house number as {h}."""
+        return search_url_template(
+            self.config.api_type, self.config.site_id, self.config.city_code, street_code
+        )
 
     def _parse_records(
         self,
@@ -98,16 +193,18 @@ class RecordFetcher(BaseFetcher):
     ) -> List[Dict]:
         """Parse building records from search results."""
         records = []
-        soup = BeautifulSoup(html, 'html.parser')
-
-        if "לא אותרו" in soup.get_text() or "לא ניתן" in soup.get_text():
+        # Most addresses have no results; a page without a results table
+        # yields no records whatever it says, so it is not worth parsing
+        if "results-table" not in html:
             return records
 
-        table = soup.find("table", {"id": "results-table"})
-        if not table:
+        doc = parse_html(html)
+
+        text = page_text(doc)
+        if "לא אותרו" in text or "לא ניתן" in text:
             return records
 
-        for row in table.select("tbody tr"):
+        for row in RESULT_ROWS(doc):
             record = self._parse_row(row, street_code, street_name, house_num)
             if record:
                 records.append(record)
@@ -116,13 +213,13 @@ class RecordFetcher(BaseFetcher):
 
     def _parse_row(
         self,
-        row,
+        row: etree._Element,
         street_code: int,
         street_name: str,
         house_num: int
     ) -> Dict:
         """Parse a single table row into a record."""
-        cells = row.find_all("td")
+        cells = list(row.iter('td'))
         if len(cells) < 3:
             return None
 
@@ -131,10 +228,10 @@ class RecordFetcher(BaseFetcher):
         if not tik:
             return None
 
-        # Get address
+        # Get address; lxml finds the candidate cells without a Python scan
         address = ""
-        for cell in cells:
-            text = cell.get_text(strip=True)
+        for cell in CITY_CELLS(row, city=self.config.name):
+            text = text_of(cell)
             if self.config.name in text:
                 address = text
                 break
@@ -153,23 +250,24 @@ class RecordFetcher(BaseFetcher):
             "house_number": house_num
         }
 
-    def _extract_tik_number(self, row) -> str:
+    def _extract_tik_number(self, row: etree._Element) -> str:
         """Extract tik number from a table row."""
+        links = ROW_LINKS(row)
+
         # Look for getBuilding link first
-        for link in row.find_all("a", href=True):
-            href = str(link.get("href", ""))
+        for link in links:
+            href = link.get("href")
             if "getBuilding" in href:
-                match = re.search(r'getBuilding\((\d+)\)', href)
+                match = _TIK_RE.search(href)
                 if match:
                     return match.group(1)
 
         # Try first link as fallback
-        link = row.find("a", href=True)
-        if link:
-            text = link.get_text(strip=True)
+        if links:
+            text = text_of(links[0])
             if text.isdigit():
                 return text
-            match = re.search(r'\d+', text)
+            match = _DIGITS_RE.search(text)
             if match:
                 return match.group()
 
@@ -181,10 +279,14 @@ class RecordFetcher(BaseFetcher):
         helka = ""
         numeric_cells = []
 
-        for cell in reversed(cells):
-            text = cell.get_text(strip=True)
+        # Gush and helka are among the last columns; only the two trailing
+        # numbers are used, so stop reading cells once both are found
+        for cell in reversed(cells[-GUSH_HELKA_COLUMNS:]):
+            text = text_of(cell)
             if text.isdigit() and len(text) <= 6:
                 numeric_cells.append(text)
+                if len(numeric_cells) == 2:
+                    break
             elif numeric_cells:
                 break
 
@@ -200,146 +302,181 @@ class RecordFetcher(BaseFetcher):
 async def async_fetch_records_for_street(
     session: aiohttp.ClientSession,
     config_dict: dict,
-    street: dict
+    street: dict,
+    concurrency: int = HOUSE_NUMBER_CONCURRENCY
 ) -> List[dict]:
     """
     Fetch all building records for a street (standalone function for workers).
 
+    Addresses recorded as empty in the config's 'empty_cache_path' database
+    are not requested again unless its 'force' key is set; the outcome of
+    every address requested is written back once the street is done.
+
     Args:
         session: aiohttp session
         config_dict: City config as dictionary
         street: Street dict with 'code' and 'name'
+        concurrency: House numbers requested at once
 
     Returns:
-        List of building record dicts
+        List of building record dicts, in house-number order
     """
     records = []
+    consecutive_empty = 0
+    city = f"{config_dict['site_id']}/{config_dict['city_code']}"
+    street_code = street['code']
+    url_template = search_url_template(
+        config_dict['api_type'], config_dict['site_id'], config_dict['city_code'], street_code
+    )
+
+    cache_path = config_dict.get('empty_cache_path')
+    known_empty = frozenset()
+    if cache_path and not config_dict.get('force'):
+        known_empty = await asyncio.to_thread(known_empty_houses, cache_path, city, street_code)
+    empty, found = [], []
+
+    async def fetch(house_num: int):
+        # Addresses that were empty on a recent run are not requested again
+        if house_num in known_empty:
+            return None
+        url = url_template.format(h=house_num)
+        page_records = await _async_fetch_house_number(session, url, config_dict, street, house_num)
+        if page_records is None:
+            empty.append(house_num)
+        elif page_records is not _FAILED:
+            found.append(house_num)
+        return page_records
+
+    async with aclosing(_fetch_in_order(fetch, range(1, 500), concurrency)) as results:
+        async for _, page_records in results:
+            if page_records is _FAILED:
+                continue
+
+            if page_records is None:
+                consecutive_empty += 1
+                if consecutive_empty >= MAX_CONSECUTIVE_EMPTY:
+                    break  # Early exit - no more results expected
+                continue
+
+            # Found results - reset counter
+            consecutive_empty = 0
+            records.extend(page_records)
+
+    if cache_path and (empty or found):
+        await asyncio.to_thread(update_street, cache_path, city, street_code, empty, found)
+
+    return records
+
+
+async def _async_fetch_house_number(
+    session: aiohttp.ClientSession,
+    url: str,
+    config_dict: dict,
+    street: dict,
+    house_num: int
+) -> Any:
+    """
+    Fetch the building records at one address.
+
+    Returns:
+        The page's records (possibly []), None if the page has no results,
+        or _FAILED if the request failed
+    """
     street_code = street['code']
     street_name = street['name']
     city_name = config_dict['name']
-    consecutive_empty = 0
-    max_consecutive_empty = 30  # Stop after 30 consecutive empty results
-
-    for house_num in range(1, 500):
-        if config_dict['api_type'] == "tikim":
-            url = build_url(
-                "GetTikimByAddress",
-                siteid=config_dict['site_id'],
-                c=config_dict['city_code'],
-                s=street_code,
-                h=house_num,
-                l="true",
-                arguments="siteid,c,s,h,l"
-            )
-        else:
-            url = build_url(
-                "GetBakashotByAddress",
-                siteid=config_dict['site_id'],
-                grp=0,
-                t=1,
-                c=config_dict['city_code'],
-                s=street_code,
-                h=house_num,
-                l="true",
-                arguments="siteId,grp,t,c,s,h,l"
-            )
 
-        try:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-            ) as resp:
-                if resp.status != 200:
+    try:
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        ) as resp:
+            if resp.status != 200:
+                return _FAILED
+
+            # Most house numbers have no results; a page without a results
+            # table is empty whatever it says, so it is not worth parsing
+            html = await read_search_page(resp)
+            if html is None:
+                return None
+
+            doc = parse_html(html)
+
+            text = page_text(doc)
+            if "לא אותרו" in text or "לא ניתן" in text:
+                return None
+
+            # No results table and an empty one are both "no results"
+            rows = RESULT_ROWS(doc)
+            if not rows:
+                return None
+
+            records = []
+            for row in rows:
+                cells = list(row.iter('td'))
+                if len(cells) < 3:
                     continue
 
-                html = await resp.text()
-                soup = BeautifulSoup(html, 'html.parser')
+                # Extract tik number
+                tik = None
+                links = ROW_LINKS(row)
+                for link in links:
+                    href = link.get("href")
+                    if "getBuilding" in href:
+                        match = _TIK_RE.search(href)
+                        if match:
+                            tik = match.group(1)
+                            break
 
-                if "לא אותרו" in soup.get_text() or "לא ניתן" in soup.get_text():
-                    consecutive_empty += 1
-                    if consecutive_empty >= max_consecutive_empty:
-                        break  # Early exit - no more results expected
-                    continue
+                if not tik and links:
+                    text = text_of(links[0])
+                    if text.isdigit():
+                        tik = text
+                    else:
+                        match = _DIGITS_RE.search(text)
+                        if match:
+                            tik = match.group()
 
-                table = soup.find("table", {"id": "results-table"})
-                if not table:
-                    consecutive_empty += 1
-                    if consecutive_empty >= max_consecutive_empty:
-                        break
+                if not tik:
                     continue
 
-                rows = table.select("tbody tr")
-                if not rows:
-                    consecutive_empty += 1
-                    if consecutive_empty >= max_consecutive_empty:
+                # Get address; lxml finds the candidate cells without a Python scan
+                address = ""
+                for cell in CITY_CELLS(row, city=city_name):
+                    text = text_of(cell)
+                    if city_name in text:
+                        address = text
                         break
-                    continue
 
-                # Found results - reset counter
-                consecutive_empty = 0
-                for row in rows:
-                    cells = row.find_all("td")
-                    if len(cells) < 3:
-                        continue
-
-                    # Extract tik number
-                    tik = None
-                    for link in row.find_all("a", href=True):
-                        href = str(link.get("href", ""))
-                        if "getBuilding" in href:
-                            match = re.search(r'getBuilding\((\d+)\)', href)
-                            if match:
-                                tik = match.group(1)
-                                break
-
-                    if not tik:
-                        link = row.find("a", href=True)
-                        if link:
-                            text = link.get_text(strip=True)
-                            if text.isdigit():
-                                tik = text
-                            else:
-                                match = re.search(r'\d+', text)
-                                if match:
-                                    tik = match.group()
-
-                    if not tik:
-                        continue
-
-                    # Get address
-                    address = ""
-                    for cell in cells:
-                        text = cell.get_text(strip=True)
-                        if city_name in text:
-                            address = text
+                # Get gush/helka
+                gush = ""
+                helka = ""
+                numeric_cells = []
+                for cell in reversed(cells[-GUSH_HELKA_COLUMNS:]):
+                    text = text_of(cell)
+                    if text.isdigit() and len(text) <= 6:
+                        numeric_cells.append(text)
+                        if len(numeric_cells) == 2:
                             break
+                    elif numeric_cells:
+                        break
+                if len(numeric_cells) >= 2:
+                    helka = numeric_cells[0]
+                    gush = numeric_cells[1]
+
+                records.append({
+                    "tik_number": tik,
+                    "address": address,
+                    "gush": gush,
+                    "helka": helka,
+                    "migrash": "",
+                    "street_code": street_code,
+                    "street_name": street_name,
+                    "house_number": house_num
+                })
 
-                    # Get gush/helka
-                    gush = ""
-                    helka = ""
-                    numeric_cells = []
-                    for cell in reversed(cells):
-                        text = cell.get_text(strip=True)
-                        if text.isdigit() and len(text) <= 6:
-                            numeric_cells.append(text)
-                        elif numeric_cells:
-                            break
-                    if len(numeric_cells) >= 2:
-                        helka = numeric_cells[0]
-                        gush = numeric_cells[1]
-
-                    records.append({
-                        "tik_number": tik,
-                        "address": address,
-                        "gush": gush,
-                        "helka": helka,
-                        "migrash": "",
-                        "street_code": street_code,
-                        "street_name": street_name,
-                        "house_number": house_num
-                    })
-
-        except Exception:
-            continue
+            return records
+
+    except REQUEST_ERRORS:
+        return _FAILED
 
-    return records
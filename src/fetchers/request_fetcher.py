@@ -6,14 +6,15 @@ Fetches detailed permit request information from GetBakashaFile API.
 
 import asyncio
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import aiohttp
 
 from src.config import CityConfig
+from src.fetchers.admission import AdmissionController
 from src.fetchers.base import (
-    BaseFetcher, build_url,
-    REQUEST_TIMEOUT, MAX_RETRIES, RETRY_DELAY, MAX_CONCURRENT
+    BaseFetcher, build_url, backoff_delay, get_shared_session, throttle_delay,
+    REQUEST_TIMEOUT, MAX_RETRIES, MAX_CONCURRENT
 )
 from src.parsers.request_parser import parse_request_detail
 
@@ -26,16 +27,18 @@ class RequestFetcher(BaseFetcher):
         session: aiohttp.ClientSession,
         request_number: str,
         tik_number: str = "",
-        retry: int = 0
+        admission: Optional[AdmissionController] = None
     ) -> Dict:
         """
         Fetch details for a single permit request.
 
         Args:
-            session: aiohttp session
+            session: aiohttp session; pass one from create_session() so
+                repeated requests can be served from the response cache
             request_number: Permit request number
             tik_number: Associated building file number
-            retry: Current retry count
+            admission: Controller to report response statuses to, so the
+                batch's concurrency adapts to server throttling
 
         Returns:
             Request detail dict
@@ -47,35 +50,38 @@ class RequestFetcher(BaseFetcher):
             arguments="siteid,b"
         )
 
-        try:
-            async with session.get(
-                url,
-                headers=self.get_headers(),
-                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-            ) as resp:
-                if resp.status == 200:
-                    html = await resp.text()
-                    return parse_request_detail(html, request_number, tik_number)
-                else:
-                    return self._error_result(request_number, tik_number, f"HTTP {resp.status}")
-
-        except asyncio.TimeoutError:
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                return await self.fetch_request(session, request_number, tik_number, retry + 1)
-            return self._error_result(request_number, tik_number, "Timeout")
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(
+                    url,
+                    headers=self.get_headers(),
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                ) as resp:
+                    if admission is not None:
+                        await admission.record(resp.status)
+                    if resp.status == 200:
+                        html = await resp.text()
+                        return parse_request_detail(html, request_number, tik_number)
+                    else:
+                        return self._error_result(request_number, tik_number, f"HTTP {resp.status}")
+
+            except asyncio.TimeoutError:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                return self._error_result(request_number, tik_number, "Timeout")
 
-        except Exception as e:
-            if retry < MAX_RETRIES:
-                await asyncio.sleep(RETRY_DELAY * (2 ** retry))
-                return await self.fetch_request(session, request_number, tik_number, retry + 1)
-            return self._error_result(request_number, tik_number, str(e))
+            except Exception as e:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                return self._error_result(request_number, tik_number, str(e))
 
     async def fetch_all_requests(
         self,
         session: aiohttp.ClientSession,
         request_items: List[Tuple[str, str]],
-        semaphore: asyncio.Semaphore = None
+        admission: Optional[AdmissionController] = None
     ) -> List[Dict]:
         """
         Fetch details for multiple requests.
@@ -83,19 +89,20 @@ class RequestFetcher(BaseFetcher):
         Args:
             session: aiohttp session
             request_items: List of (request_number, tik_number) tuples
-            semaphore: Optional semaphore for concurrency control
+            admission: Optional concurrency controller (default: an
+                adaptive one starting at MAX_CONCURRENT)
 
         Returns:
             List of request detail dicts
         """
-        if semaphore is None:
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+        if admission is None:
+            admission = AdmissionController(MAX_CONCURRENT)
 
-        async def fetch_with_semaphore(req_num: str, tik_num: str):
-            async with semaphore:
-                return await self.fetch_request(session, req_num, tik_num)
+        async def fetch_admitted(req_num: str, tik_num: str):
+            async with admission:
+                return await self.fetch_request(session, req_num, tik_num, admission)
 
-        tasks = [fetch_with_semaphore(req_num, tik_num) for req_num, tik_num in request_items]
+        tasks = [fetch_admitted(req_num, tik_num) for req_num, tik_num in request_items]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         details = []
@@ -138,7 +145,8 @@ async def async_fetch_request_detail(
     session: aiohttp.ClientSession,
     config_dict: dict,
     request_number: str,
-    tik_number: str = ""
+    tik_number: str = "",
+    admission: Optional[AdmissionController] = None
 ) -> dict:
     """
     Fetch request detail (standalone function for workers).
@@ -148,6 +156,7 @@ async def async_fetch_request_detail(
         config_dict: City config as dictionary
         request_number: Permit request number
         tik_number: Associated building file number
+        admission: Controller to report response statuses to
 
     Returns:
         Request detail dict
@@ -165,10 +174,16 @@ async def async_fetch_request_detail(
                 url,
                 timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
             ) as resp:
-                if resp.status != 200:
-                    continue
-                html = await resp.text()
-                return parse_request_detail(html, request_number, tik_number)
+                if admission is not None:
+                    await admission.record(resp.status)
+                if resp.status == 200:
+                    html = await resp.text()
+                    return parse_request_detail(html, request_number, tik_number)
+                retry_after = resp.headers.get("Retry-After")
+
+            # Back off before retrying, longer if the server asked us to
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(throttle_delay(attempt, retry_after))
 
         except Exception as e:
             if attempt == MAX_RETRIES - 1:
@@ -184,7 +199,7 @@ async def async_fetch_request_detail(
                     "housing_units": "", "stakeholders": [], "events": [],
                     "requirements": [], "meetings": [], "documents": [], "gush_helka": []
                 }
-            await asyncio.sleep(RETRY_DELAY)
+            await asyncio.sleep(backoff_delay(attempt))
 
     return {
         "request_number": request_number,
@@ -202,7 +217,8 @@ async def async_fetch_request_detail(
 
 async def async_fetch_requests_batch(
     config_dict: dict,
-    request_items: List[Tuple[str, str]]
+    request_items: List[Tuple[str, str]],
+    session: Optional[aiohttp.ClientSession] = None
 ) -> List[dict]:
     """
     Fetch request details for a batch (standalone function for workers).
@@ -210,28 +226,31 @@ async def async_fetch_requests_batch(
     Args:
         config_dict: City config as dictionary
         request_items: List of (request_number, tik_number) tuples
+        session: Session to use (default: this process's shared session,
+            which stays open for later batches)
 
     Returns:
         List of request detail dicts
     """
     results = []
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    # Backs off when the server throttles us, ramps up again once it stops
+    admission = AdmissionController(MAX_CONCURRENT)
+    if session is None:
+        session = await get_shared_session(config_dict.get('response_cache_path'))
 
-    async def fetch_with_semaphore(session, req_num, tik_num):
-        async with semaphore:
-            return await async_fetch_request_detail(session, config_dict, req_num, tik_num)
+    async def fetch_admitted(req_num, tik_num):
+        async with admission:
+            return await async_fetch_request_detail(session, config_dict, req_num, tik_num, admission)
 
-    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [fetch_with_semaphore(session, req_num, tik_num) for req_num, tik_num in request_items]
+    tasks = [fetch_admitted(req_num, tik_num) for req_num, tik_num in request_items]
 
-        batch_size = 100
-        for i in range(0, len(tasks), batch_size):
-            batch = tasks[i:i + batch_size]
-            batch_results = await asyncio.gather(*batch, return_exceptions=True)
+    batch_size = 100
+    for i in range(0, len(tasks), batch_size):
+        batch = tasks[i:i + batch_size]
+        batch_results = await asyncio.gather(*batch, return_exceptions=True)
 
-            for result in batch_results:
-                if isinstance(result, dict):
-                    results.append(result)
+        for result in batch_results:
+            if isinstance(result, dict):
+                results.append(result)
 
     return results
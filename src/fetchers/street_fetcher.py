@@ -1,20 +1,54 @@
 """
 Street discovery fetcher.
 
-Discovers valid street codes by testing address queries.
+Discovers valid street codes by testing address queries. Result pages are
+parsed straight into an lxml tree (see record_fetcher).
 """
 
 import asyncio
 from typing import Optional, List, Dict
 
 import aiohttp
-from bs4 import BeautifulSoup
 
 from src.config import CityConfig
+from src.fetchers.admission import THROTTLE_STATUSES, AdmissionController
 from src.fetchers.base import (
-    BaseFetcher, build_url,
-    REQUEST_TIMEOUT, MAX_CONCURRENT
+    BaseFetcher, get_shared_session, read_search_page, search_url_template, throttle_delay,
+    REQUEST_TIMEOUT, REQUEST_ERRORS, MAX_CONCURRENT, MAX_RETRIES
 )
+from src.parsers.base import page_text, parse_html, text_of
+from src.parsers.search_parser import CITY_CELLS, RESULT_ROWS
+
+
+async def _fetch_found_page(
+    session: aiohttp.ClientSession,
+    url: str,
+    admission: Optional[AdmissionController] = None
+) -> Optional[str]:
+    """
+    Fetch a search page, returning it only if it reports results.
+
+    Response statuses are reported to admission so discovery's concurrency
+    adapts; a throttled (429 / 503) request is retried after a backoff
+    rather than taken to mean the address has no results.
+
+    Raises:
+        Any of REQUEST_ERRORS
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+        ) as resp:
+            if admission is not None:
+                await admission.record(resp.status)
+            if resp.status == 200:
+                return await read_search_page(resp, found_only=True)
+            if resp.status not in THROTTLE_STATUSES or attempt == MAX_RETRIES:
+                return None
+            retry_after = resp.headers.get("Retry-After")
+        await asyncio.sleep(throttle_delay(attempt, retry_after))
+    return None
 
 
 class StreetFetcher(BaseFetcher):
@@ -26,7 +60,8 @@ class StreetFetcher(BaseFetcher):
     async def test_street(
         self,
         session: aiohttp.ClientSession,
-        street_code: int
+        street_code: int,
+        admission: Optional[AdmissionController] = None
     ) -> Optional[Dict]:
         """
         Test if a street code is valid.
@@ -34,77 +69,58 @@ class StreetFetcher(BaseFetcher):
         Args:
             session: aiohttp session
             street_code: Street code to test
+            admission: Controller to report response statuses to
 
         Returns:
             Dict with 'code' and 'name' if valid, None otherwise
         """
+        url_template = self._search_url_template(street_code)
         for h in self.TEST_HOUSE_NUMBERS:
-            url = self._build_search_url(street_code, h)
+            url = url_template.format(h=h)
 
             try:
-                async with session.get(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-                ) as resp:
-                    if resp.status != 200:
-                        continue
-
-                    html = await resp.text()
-                    street_name = self._extract_street_name(html)
-                    if street_name:
-                        return {"code": street_code, "name": street_name}
-
-            except Exception:
+                html = await _fetch_found_page(session, url, admission)
+            except REQUEST_ERRORS:
+                continue
+            if html is None:
                 continue
 
+            street_name = self._extract_street_name(html)
+            if street_name:
+                return {"code": street_code, "name": street_name}
+
         return None
 
     def _build_search_url(self, street_code: int, house_num: int) -> str:
         """Build URL for address search."""
-        if self.config.api_type == "tikim":
-            return build_url(
-                "GetTikimByAddress",
-                siteid=self.config.site_id,
-                c=self.config.city_code,
-                s=street_code,
-                h=house_num,
-                l="true",
-                arguments="siteid,c,s,h,l"
-            )
-        else:  # bakashot
-            return build_url(
-                "GetBakashotByAddress",
-                siteid=self.config.site_id,
-                grp=0,
-                t=1,
-                c=self.config.city_code,
-                s=street_code,
-                h=house_num,
-                l="true",
-                arguments="siteId,grp,t,c,s,h,l"
-            )
+        return self._search_url_template(street_code).format(h=house_num)
+
+    def _search_url_template(self, street_code: int) -> str:
+        """Build the address search URL for a street, leaving the house number as {h}."""
+        return search_url_template(
+            self.config.api_type, self.config.site_id, self.config.city_code, street_code
+        )
 
     def _extract_street_name(self, html: str) -> Optional[str]:
         """Extract street name from search results."""
-        soup = BeautifulSoup(html, 'html.parser')
-        text = soup.get_text()
+        # Only pages reporting results with a results table can name the street
+        if "נמצאו" not in html or "results-table" not in html:
+            return None
+
+        doc = parse_html(html)
+        text = page_text(doc)
 
         if "נמצאו" not in text:
             return None
         if "תיקי בניין" not in text and "בקשות" not in text:
             return None
 
-        table = soup.find("table", {"id": "results-table"})
-        if not table:
-            return None
-
-        rows = table.select("tbody tr")
+        rows = RESULT_ROWS(doc)
         if not rows:
             return None
 
-        cells = rows[0].find_all("td")
-        for cell in cells:
-            cell_text = cell.get_text(strip=True)
+        for cell in CITY_CELLS(rows[0], city=self.config.name):
+            cell_text = text_of(cell)
             if self.config.name in cell_text:
                 # Extract street name by removing city and house number
                 parts = cell_text.replace(self.config.name, '').strip().rsplit(' ', 1)
@@ -119,7 +135,7 @@ class StreetFetcher(BaseFetcher):
         session: aiohttp.ClientSession,
         start: int,
         end: int,
-        semaphore: asyncio.Semaphore = None
+        admission: Optional[AdmissionController] = None
     ) -> List[Dict]:
         """
         Discover all valid streets in a range.
@@ -128,21 +144,21 @@ class StreetFetcher(BaseFetcher):
             session: aiohttp session
             start: Start of street code range
             end: End of street code range
-            semaphore: Optional semaphore for concurrency control
+            admission: Optional concurrency controller (default: MAX_CONCURRENT)
 
         Returns:
             List of valid street dicts with 'code' and 'name'
         """
-        if semaphore is None:
-            semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+        if admission is None:
+            admission = AdmissionController(MAX_CONCURRENT)
 
         streets = []
 
-        async def test_with_semaphore(street_code: int):
-            async with semaphore:
-                return await self.test_street(session, street_code)
+        async def test_admitted(street_code: int):
+            async with admission:
+                return await self.test_street(session, street_code, admission)
 
-        tasks = [test_with_semaphore(s) for s in range(start, end + 1)]
+        tasks = [test_admitted(s) for s in range(start, end + 1)]
 
         # Process in batches
         batch_size = 100
@@ -162,7 +178,8 @@ class StreetFetcher(BaseFetcher):
 async def async_test_street(
     session: aiohttp.ClientSession,
     config_dict: dict,
-    street_code: int
+    street_code: int,
+    admission: Optional[AdmissionController] = None
 ) -> Optional[dict]:
     """
     Test if a street code is valid (standalone function for workers).
@@ -171,6 +188,7 @@ async def async_test_street(
         session: aiohttp session
         config_dict: City config as dictionary
         street_code: Street code to test
+        admission: Controller to report response statuses to
 
     Returns:
         Dict with 'code' and 'name' if valid, None otherwise
@@ -178,65 +196,43 @@ async def async_test_street(
     house_numbers = [1, 2, 3, 5, 10, 20, 50]
     city_name = config_dict['name']
 
+    url_template = search_url_template(
+        config_dict['api_type'], config_dict['site_id'], config_dict['city_code'], street_code
+    )
+
     for h in house_numbers:
-        if config_dict['api_type'] == "tikim":
-            url = build_url(
-                "GetTikimByAddress",
-                siteid=config_dict['site_id'],
-                c=config_dict['city_code'],
-                s=street_code,
-                h=h,
-                l="true",
-                arguments="siteid,c,s,h,l"
-            )
-        else:
-            url = build_url(
-                "GetBakashotByAddress",
-                siteid=config_dict['site_id'],
-                grp=0,
-                t=1,
-                c=config_dict['city_code'],
-                s=street_code,
-                h=h,
-                l="true",
-                arguments="siteId,grp,t,c,s,h,l"
-            )
+        url = url_template.format(h=h)
 
         try:
-            async with session.get(
-                url,
-                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-            ) as resp:
-                if resp.status != 200:
-                    continue
-
-                html = await resp.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                text = soup.get_text()
-
-                if "נמצאו" in text and ("תיקי בניין" in text or "בקשות" in text):
-                    table = soup.find("table", {"id": "results-table"})
-                    if table:
-                        rows = table.select("tbody tr")
-                        if rows:
-                            cells = rows[0].find_all("td")
-                            for cell in cells:
-                                cell_text = cell.get_text(strip=True)
-                                if city_name in cell_text:
-                                    parts = cell_text.replace(city_name, '').strip().rsplit(' ', 1)
-                                    street_name = parts[0].strip() if parts else cell_text
-                                    if street_name and len(street_name) > 1:
-                                        return {"code": street_code, "name": street_name}
-        except Exception:
+            # Only pages reporting results with a results table can name the street
+            html = await _fetch_found_page(session, url, admission)
+        except REQUEST_ERRORS:
+            continue
+        if html is None:
             continue
 
+        doc = parse_html(html)
+        text = page_text(doc)
+
+        if "נמצאו" in text and ("תיקי בניין" in text or "בקשות" in text):
+            rows = RESULT_ROWS(doc)
+            if rows:
+                for cell in CITY_CELLS(rows[0], city=city_name):
+                    cell_text = text_of(cell)
+                    if city_name in cell_text:
+                        parts = cell_text.replace(city_name, '').strip().rsplit(' ', 1)
+                        street_name = parts[0].strip() if parts else cell_text
+                        if street_name and len(street_name) > 1:
+                            return {"code": street_code, "name": street_name}
+
     return None
 
 
 async def async_discover_range(
     config_dict: dict,
     start: int,
-    end: int
+    end: int,
+    session: Optional[aiohttp.ClientSession] = None
 ) -> List[dict]:
     """
     Discover streets in a range (standalone function for workers).
@@ -245,28 +241,30 @@ async def async_discover_range(
         config_dict: City config as dictionary
         start: Start of street code range
         end: End of street code range
+        session: Session to use (default: this process's shared session,
+            which stays open for later ranges)
 
     Returns:
         List of valid street dicts
     """
     streets = []
-    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    admission = AdmissionController(MAX_CONCURRENT)
+    if session is None:
+        session = await get_shared_session(config_dict.get('response_cache_path'))
 
-    async def test_with_semaphore(session, street_code):
-        async with semaphore:
-            return await async_test_street(session, config_dict, street_code)
+    async def test_admitted(street_code):
+        async with admission:
+            return await async_test_street(session, config_dict, street_code, admission)
 
-    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT)
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [test_with_semaphore(session, s) for s in range(start, end + 1)]
+    tasks = [test_admitted(s) for s in range(start, end + 1)]
 
-        batch_size = 100
-        for i in range(0, len(tasks), batch_size):
-            batch = tasks[i:i + batch_size]
-            results = await asyncio.gather(*batch, return_exceptions=True)
+    batch_size = 100
+    for i in range(0, len(tasks), batch_size):
+        batch = tasks[i:i + batch_size]
+        results = await asyncio.gather(*batch, return_exceptions=True)
 
-            for result in results:
-                if isinstance(result, dict) and result:
-                    streets.append(result)
+        for result in results:
+            if isinstance(result, dict) and result:
+                streets.append(result)
 
     return streets
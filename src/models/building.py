@@ -8,7 +8,7 @@ and building details (from GetTikFile API).
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingRecord:
     """
     A building file record from search results.
@@ -27,7 +27,7 @@ class BuildingRecord:
     house_number: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildingDetail:
     """
     Detailed building file information.
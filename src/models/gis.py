@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Optional, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class GISBuildingPermit:
     """
     Building permit record from municipal GIS.
@@ -50,7 +50,7 @@ class GISBuildingPermit:
     source: str = ""
     layer_id: int = 0
     fetched_at: str = ""
-    raw_attributes: dict = field(default_factory=dict)
+    raw_attributes: Optional[dict] = None  # Only kept when requested (keep_raw)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -75,13 +75,26 @@ class GISBuildingPermit:
             "fetched_at": self.fetched_at,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "GISBuildingPermit":
+        """Rebuild a permit from to_dict() output (raw_attributes are not kept)."""
+        data = dict(data)
+        for key in ("permit_date", "permit_expiry", "request_open_date"):
+            if data.get(key):
+                data[key] = datetime.fromisoformat(data[key])
+        if data.get("centroid") is not None:
+            data["centroid"] = tuple(data["centroid"])
+        return cls(**data)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class GISFeature:
     """
     Generic GIS feature from ArcGIS MapServer.
 
-    Used for layers that don't have specialized models.
+    Used for layers that don't have specialized models. Slotted and frozen
+    since query_layer creates one per returned feature and nothing updates
+    them afterwards.
     """
 
     object_id: int
@@ -124,6 +137,7 @@ class GISQueryResult:
     """
 
     features: list = field(default_factory=list)
+    columns: dict = field(default_factory=dict)  # Field name -> values (columnar queries)
     total_count: int = 0
     exceeded_limit: bool = False
 
@@ -1,13 +1,20 @@
 """HTML parsers for Complot API responses."""
 
-from src.parsers.base import BaseParser
+from src.parsers.base import BaseParser, HTML_PARSER, page_text, parse_html, text_of
 from src.parsers.building_parser import BuildingDetailParser
 from src.parsers.request_parser import RequestDetailParser
-from src.parsers.search_parser import SearchResultParser
+from src.parsers.search_parser import CITY_CELLS, RESULT_ROWS, ROW_LINKS, SearchResultParser
 
 __all__ = [
     "BaseParser",
+    "HTML_PARSER",
+    "page_text",
+    "parse_html",
+    "text_of",
     "BuildingDetailParser",
     "RequestDetailParser",
     "SearchResultParser",
+    "RESULT_ROWS",
+    "ROW_LINKS",
+    "CITY_CELLS",
 ]
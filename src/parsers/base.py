@@ -4,8 +4,54 @@ Base parser utilities for HTML parsing.
 Provides common helper methods used across all parsers.
 """
 
-from typing import Optional
-from bs4 import BeautifulSoup, Tag
+from typing import Optional, Union
+from bs4 import BeautifulSoup, Tag, UnicodeDammit
+from lxml import etree, html as lxml_html
+
+# BeautifulSoup tree builder: lxml's C parser is several times faster than
+# the pure-Python 'html.parser' and supports the same select()/find() API
+HTML_PARSER = 'lxml'
+
+# Text nodes that BeautifulSoup's get_text() would return (no script/style)
+_TEXT_NODES = etree.XPath('.//text()[not(parent::script or parent::style)]')
+_NON_TEXT_TAGS = frozenset(('script', 'style'))
+
+
+def parse_html(html: Union[str, bytes]) -> lxml_html.HtmlElement:
+    """
+    Parse an HTML page straight into an lxml tree (no BeautifulSoup wrapper).
+
+    Bytes are decoded as UTF-8, falling back to BeautifulSoup's encoding
+    detection, so pages parse the same as they would through bs4.
+    """
+    if isinstance(html, bytes):
+        try:
+            html = html.decode('utf-8')
+        except UnicodeDecodeError:
+            html = UnicodeDammit(html, is_html=True).unicode_markup or ""
+    if not html.strip():
+        html = "<html></html>"
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # str input with an XML encoding declaration: hand lxml UTF-8 bytes
+        parser = lxml_html.HTMLParser(encoding='utf-8')
+        return lxml_html.document_fromstring(html.encode('utf-8'), parser=parser)
+
+
+def page_text(doc: etree._Element) -> str:
+    """Get a page's text the way get_text() does (no script/style contents)."""
+    return "".join(_TEXT_NODES(doc))
+
+
+def text_of(element: Optional[etree._Element], default: str = "") -> str:
+    """Get an element's text the way get_text(strip=True) does."""
+    if element is None:
+        return default
+    # Most table cells hold just text; skip the XPath walk for those
+    if len(element) == 0 and element.tag not in _NON_TEXT_TAGS:
+        return (element.text or "").strip()
+    return "".join(text.strip() for text in _TEXT_NODES(element))
 
 
 class BaseParser:
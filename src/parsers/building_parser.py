@@ -2,20 +2,58 @@
 Building detail HTML parser.
 
 Parses HTML responses from GetTikFile API to extract building information.
+Pages are parsed straight into an lxml tree; BeautifulSoup's per-node
+Python wrappers cost more than the parse itself on these table-heavy pages.
 """
 
 from datetime import datetime
-from typing import Union
-from bs4 import BeautifulSoup
+from typing import Dict, Union
+
+from lxml import etree
 
 from src.models import BuildingDetail
-from src.parsers.base import BaseParser
+from src.parsers.base import BaseParser, page_text, parse_html, text_of
+
+# Compiled once at import; calling doc.xpath(str) recompiles on every call
+_HEADER_DESC = 'contains(concat(" ", normalize-space(@class), " "), " top-navbar-info-desc ")'
+# Header value: the next header field in document order (not only among
+# siblings) after the first header label containing $label
+HEADER_VALUE = etree.XPath(
+    f'(//*[@id="result-title-div-id"]//*[{_HEADER_DESC}][contains(., $label)])[1]'
+    f'/following::*[{_HEADER_DESC}][ancestor::*[@id="result-title-div-id"]][1]'
+)
+# Second cell of the first two-cell row whose first cell contains $label
+INFO_VALUE = etree.XPath('(.//tr[td[2]][contains(td[1], $label)])[1]/td[2]')
+TBODY_ROWS = etree.XPath('.//tbody//tr')
+
+# Ids of the page sections the parsers read
+SECTION_IDS = frozenset((
+    'info-main', 'addresses', 'table-gushim-helkot', 'table-requests',
+    'table-taba', 'baaley-inyan', 'table-archive',
+))
+# Matching ids in Python is much faster than an XPath @id="..." or ... test
+_ID_ELEMENTS = etree.XPath('//*[@id]')
+
+
+def find_sections(doc: etree._Element) -> Dict[str, etree._Element]:
+    """
+    Resolve every section container in one tree walk.
+
+    Returns a dict of section id -> first element with that id, like
+    get_element_by_id (which walks the whole tree per lookup).
+    """
+    sections = {}
+    for element in _ID_ELEMENTS(doc):
+        section_id = element.get('id')
+        if section_id in SECTION_IDS:
+            sections.setdefault(section_id, element)
+    return sections
 
 
 class BuildingDetailParser(BaseParser):
     """Parser for building detail HTML responses (GetTikFile API)."""
 
-    def parse(self, html: str, tik_number: str) -> BuildingDetail:
+    def parse(self, html: Union[str, bytes], tik_number: str) -> BuildingDetail:
         """
         Parse building detail HTML and return a BuildingDetail object.
 
@@ -26,36 +64,37 @@ class BuildingDetailParser(BaseParser):
         Returns:
             BuildingDetail with parsed data and fetch status
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = parse_html(html)
         detail = BuildingDetail(tik_number=tik_number)
         detail.fetched_at = datetime.now().isoformat()
 
         # Check for error responses
-        if self.has_no_data(soup):
+        if self.page_has_no_data(doc):
             detail.fetch_status = "error"
             detail.fetch_error = "No data available"
             return detail
 
         # Extract all sections
-        detail.address = self._extract_address(soup)
-        detail.neighborhood = self._extract_neighborhood(soup)
-        detail.addresses = self._extract_addresses(soup)
-        detail.gush_helka = self._extract_gush_helka(soup)
-        detail.requests = self._extract_requests(soup)
-        detail.plans = self._extract_plans(soup)
-        detail.stakeholders = self._extract_stakeholders(soup)
-        detail.documents = self._extract_documents(soup)
+        sections = find_sections(doc)
+        detail.address = self._extract_address(doc)
+        detail.neighborhood = self._extract_neighborhood(sections)
+        detail.addresses = self._extract_addresses(sections)
+        detail.gush_helka = self._extract_gush_helka(sections)
+        detail.requests = self._extract_requests(sections)
+        detail.plans = self._extract_plans(sections)
+        detail.stakeholders = self._extract_stakeholders(sections)
+        detail.documents = self._extract_documents(sections)
 
         detail.fetch_status = "success"
         return detail
 
-    def parse_to_dict(self, html: str, tik_number: str) -> dict:
+    def parse_to_dict(self, html: Union[str, bytes], tik_number: str) -> dict:
         """
         Parse building detail HTML and return a dictionary.
 
         This is used by multiprocessing workers that need picklable results.
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        doc = parse_html(html)
         detail = {
             "tik_number": tik_number,
             "address": "",
@@ -72,120 +111,143 @@ class BuildingDetailParser(BaseParser):
         }
 
         # Check for error responses
-        if self.has_no_data(soup):
+        if self.page_has_no_data(doc):
             detail["fetch_status"] = "error"
             detail["fetch_error"] = "No data available"
             return detail
 
         # Extract all sections
-        detail["address"] = self._extract_address(soup)
-        detail["neighborhood"] = self._extract_neighborhood(soup)
-        detail["addresses"] = self._extract_addresses(soup)
-        detail["gush_helka"] = self._extract_gush_helka(soup)
-        detail["requests"] = self._extract_requests(soup)
-        detail["plans"] = self._extract_plans(soup)
+        sections = find_sections(doc)
+        detail["address"] = self._extract_address(doc)
+        detail["neighborhood"] = self._extract_neighborhood(sections)
+        detail["addresses"] = self._extract_addresses(sections)
+        detail["gush_helka"] = self._extract_gush_helka(sections)
+        detail["requests"] = self._extract_requests(sections)
+        detail["plans"] = self._extract_plans(sections)
 
         detail["fetch_status"] = "success"
         return detail
 
-    def _extract_address(self, soup: BeautifulSoup) -> str:
+    @staticmethod
+    def page_has_no_data(doc: etree._Element) -> bool:
+        """Check if the page indicates no data available."""
+        text = page_text(doc)
+        return (
+            'לא ניתן להציג את המידע המבוקש' in text or
+            'לא אותרו תוצאות' in text
+        )
+
+    @staticmethod
+    def _table_rows(sections: Dict[str, etree._Element], section_id: str) -> list:
+        """Get the tbody rows under a section (like select('#id tbody tr'))."""
+        table = sections.get(section_id)
+        if table is None:
+            return []
+        return TBODY_ROWS(table)
+
+    @staticmethod
+    def _cell_texts(row: etree._Element) -> list:
+        """Get the stripped text of each cell in a row."""
+        return [text_of(cell) for cell in row.iter('td')]
+
+    def _extract_address(self, doc: etree._Element) -> str:
         """Extract main address from header."""
-        return self.extract_header_field(soup, 'כתובת')
+        values = HEADER_VALUE(doc, label='כתובת')
+        return text_of(values[0]) if values else ""
 
-    def _extract_neighborhood(self, soup: BeautifulSoup) -> str:
+    def _extract_neighborhood(self, sections: Dict[str, etree._Element]) -> str:
         """Extract neighborhood from info table."""
-        return self.extract_info_table_value(soup, '#info-main', 'שכונה')
+        table = sections.get('info-main')
+        if table is not None:
+            values = INFO_VALUE(table, label='שכונה')
+            if values:
+                return text_of(values[0])
+        return ""
 
-    def _extract_addresses(self, soup: BeautifulSoup) -> list:
+    def _extract_addresses(self, sections: Dict[str, etree._Element]) -> list:
         """Extract all addresses from addresses table."""
         addresses = []
-        addresses_div = soup.select_one('#addresses')
-        if addresses_div:
-            for row in addresses_div.select('tbody tr'):
-                addr = row.get_text(strip=True)
-                if addr:
-                    addresses.append(addr)
+        for row in self._table_rows(sections, 'addresses'):
+            addr = text_of(row)
+            if addr:
+                addresses.append(addr)
         return addresses
 
-    def _extract_gush_helka(self, soup: BeautifulSoup) -> list:
+    def _extract_gush_helka(self, sections: Dict[str, etree._Element]) -> list:
         """Extract parcel (gush/helka) information."""
         parcels = []
-        rows = self.extract_table_rows(soup, '#table-gushim-helkot')
-        for row in rows:
-            cells = row.select('td')
+        for row in self._table_rows(sections, 'table-gushim-helkot'):
+            cells = self._cell_texts(row)
             if len(cells) >= 5:
                 gush_info = {
-                    'gush': self.get_cell_text(cells, 1),
-                    'helka': self.get_cell_text(cells, 2),
-                    'migrash': self.get_cell_text(cells, 3),
-                    'plan_number': self.get_cell_text(cells, 4)
+                    'gush': cells[1],
+                    'helka': cells[2],
+                    'migrash': cells[3],
+                    'plan_number': cells[4]
                 }
                 if gush_info['gush']:
                     parcels.append(gush_info)
         return parcels
 
-    def _extract_requests(self, soup: BeautifulSoup) -> list:
+    def _extract_requests(self, sections: Dict[str, etree._Element]) -> list:
         """Extract permit requests from requests table."""
         requests = []
-        rows = self.extract_table_rows(soup, '#table-requests')
-        for row in rows:
-            cells = row.select('td')
+        for row in self._table_rows(sections, 'table-requests'):
+            cells = self._cell_texts(row)
             if len(cells) >= 7:
                 request_info = {
-                    'request_number': self.get_cell_text(cells, 1),
-                    'submission_date': self.get_cell_text(cells, 2),
-                    'last_event': self.get_cell_text(cells, 3),
-                    'applicant_name': self.get_cell_text(cells, 4),
-                    'permit_number': self.get_cell_text(cells, 5),
-                    'permit_date': self.get_cell_text(cells, 6)
+                    'request_number': cells[1],
+                    'submission_date': cells[2],
+                    'last_event': cells[3],
+                    'applicant_name': cells[4],
+                    'permit_number': cells[5],
+                    'permit_date': cells[6]
                 }
                 if request_info['request_number']:
                     requests.append(request_info)
         return requests
 
-    def _extract_plans(self, soup: BeautifulSoup) -> list:
+    def _extract_plans(self, sections: Dict[str, etree._Element]) -> list:
         """Extract urban plans from plans table."""
         plans = []
-        rows = self.extract_table_rows(soup, '#table-taba')
-        for row in rows:
-            if 'לא אותרו' in row.get_text():
+        for row in self._table_rows(sections, 'table-taba'):
+            if 'לא אותרו' in page_text(row):
                 continue
-            cells = row.select('td')
+            cells = self._cell_texts(row)
             if len(cells) >= 5:
                 plan_info = {
-                    'plan_number': self.get_cell_text(cells, 1),
-                    'plan_name': self.get_cell_text(cells, 2),
-                    'status': self.get_cell_text(cells, 3),
-                    'status_date': self.get_cell_text(cells, 4)
+                    'plan_number': cells[1],
+                    'plan_name': cells[2],
+                    'status': cells[3],
+                    'status_date': cells[4]
                 }
                 if plan_info['plan_number']:
                     plans.append(plan_info)
         return plans
 
-    def _extract_stakeholders(self, soup: BeautifulSoup) -> list:
+    def _extract_stakeholders(self, sections: Dict[str, etree._Element]) -> list:
         """Extract stakeholders list."""
         stakeholders = []
-        stakeholders_div = soup.select_one('#baaley-inyan')
-        if stakeholders_div:
-            for row in stakeholders_div.select('tr'):
-                text = row.get_text(strip=True)
+        stakeholders_div = sections.get('baaley-inyan')
+        if stakeholders_div is not None:
+            for row in stakeholders_div.iter('tr'):
+                text = text_of(row)
                 if text and 'לא נמצאו נתונים' not in text:
                     stakeholders.append(text)
         return stakeholders
 
-    def _extract_documents(self, soup: BeautifulSoup) -> list:
+    def _extract_documents(self, sections: Dict[str, etree._Element]) -> list:
         """Extract archive documents."""
         documents = []
-        rows = self.extract_table_rows(soup, '#table-archive')
-        for row in rows:
-            if 'לא נמצאו מסמכים' in row.get_text():
+        for row in self._table_rows(sections, 'table-archive'):
+            if 'לא נמצאו מסמכים' in page_text(row):
                 continue
-            cells = row.select('td')
+            cells = self._cell_texts(row)
             if len(cells) >= 3:
                 doc_info = {
-                    'name': self.get_cell_text(cells, 0),
-                    'subject': self.get_cell_text(cells, 1),
-                    'date': self.get_cell_text(cells, 2)
+                    'name': cells[0],
+                    'subject': cells[1],
+                    'date': cells[2]
                 }
                 if doc_info['name']:
                     documents.append(doc_info)
@@ -193,7 +255,7 @@ class BuildingDetailParser(BaseParser):
 
 
 # Standalone function for backward compatibility with multiprocessing workers
-def parse_building_detail(html: str, tik_number: str) -> dict:
+def parse_building_detail(html: Union[str, bytes], tik_number: str) -> dict:
     """
     Parse building detail HTML (standalone function for workers).
 
@@ -8,9 +8,17 @@ to extract building records and street information.
 import re
 from typing import Optional
 from bs4 import BeautifulSoup
+from lxml import etree
 
 from src.parsers.base import BaseParser
 
+# Compiled lxml queries for the search results table, for callers working on
+# an lxml tree (see parse_html) rather than BeautifulSoup
+RESULT_ROWS = etree.XPath('(//table[@id="results-table"])[1]//tbody//tr')
+ROW_LINKS = etree.XPath('.//a[@href]')
+# Cells of a row mentioning $city (the address cells)
+CITY_CELLS = etree.XPath('.//td[contains(., $city)]')
+
 
 class SearchResultParser(BaseParser):
     """Parser for search result HTML responses."""
@@ -1,9 +1,12 @@
 """Storage modules for Complot Crawler."""
 
-from src.storage.checkpoint import CheckpointManager
+from src.storage.checkpoint import CheckpointManager, compute_config_hash
 from src.storage.exporter import DataExporter
+from src.storage.html_cache import HtmlCache
 
 __all__ = [
     "CheckpointManager",
     "DataExporter",
+    "HtmlCache",
+    "compute_config_hash",
 ]
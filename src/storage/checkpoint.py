@@ -4,23 +4,43 @@ Checkpoint management for crawler resumability.
 Handles saving and loading of crawl progress to enable resuming interrupted crawls.
 """
 
-import json
+import hashlib
+import os
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, BinaryIO, Collection, Dict, Iterable, List, Optional, TypeVar
 
+import orjson
+
+from src.config import DEFAULT_SETTINGS
 from src.utils.logging import get_logger
 
 logger = get_logger()
 
 T = TypeVar('T')
 
+CHECKPOINT_MAX_AGE_HOURS = DEFAULT_SETTINGS.checkpoint_max_age_hours
+
+# Timestamp keys used by the different checkpoint/output files
+_TIMESTAMP_KEYS = ("checkpoint_at", "crawled_at", "fetched_at")
+
+
+def compute_config_hash(config: Any) -> str:
+    """
+    Compute a short, stable hash of a city configuration dataclass.
+
+    Stored in checkpoint and output files so data written under a different
+    configuration (site ID, API type, base URL, ...) is not silently resumed.
+    """
+    payload = orjson.dumps(asdict(config), option=orjson.OPT_SORT_KEYS)
+    return hashlib.sha256(payload).hexdigest()[:16]
+
 
 class CheckpointManager:
     """Manages checkpoint files for crawler resumability."""
 
-    def __init__(self, output_dir: Path, city_name: str, city_name_en: str):
+    def __init__(self, output_dir: Path, city_name: str, city_name_en: str, config_hash: str = ""):
         """
         Initialize checkpoint manager.
 
@@ -28,37 +48,127 @@ class CheckpointManager:
             output_dir: Directory for checkpoint files
             city_name: Hebrew city name (for metadata)
             city_name_en: English city name (for metadata)
+            config_hash: Hash of the city config (see compute_config_hash)
         """
         self.output_dir = output_dir
         self.city_name = city_name
         self.city_name_en = city_name_en
+        self.config_hash = config_hash
 
         # Standard checkpoint file paths
         self.records_checkpoint = output_dir / "checkpoint.json"
         self.details_checkpoint = output_dir / "details_checkpoint.json"
+        self.details_log = output_dir / "details_checkpoint.jsonl"
         self.requests_checkpoint = output_dir / "requests_checkpoint.json"
 
+        # Append handle for the details log and the number of details in it
+        self._details_log_file: Optional[BinaryIO] = None
+        self._details_logged = 0
+
     def save_records(self, records: List[Any]) -> None:
         """Save building records checkpoint."""
         output = {
             "city": self.city_name,
+            "config_hash": self.config_hash,
             "checkpoint_at": datetime.now().isoformat(),
             "total_records": len(records),
             "records": [asdict(r) if hasattr(r, '__dataclass_fields__') else r for r in records]
         }
         self._write_json(self.records_checkpoint, output)
 
-    def save_details(self, details: List[Any]) -> None:
-        """Save building details checkpoint."""
+    def save_details(self, details: Collection[Any]) -> None:
+        """
+        Save a full building details snapshot.
+
+        The snapshot supersedes everything appended with append_details(),
+        so the details log is truncated afterwards (compaction).
+        """
         checkpoint = {
             "city": self.city_name,
+            "config_hash": self.config_hash,
             "checkpoint_at": datetime.now().isoformat(),
             "total": len(details),
             "details": [asdict(d) if hasattr(d, '__dataclass_fields__') else d for d in details]
         }
         self._write_json(self.details_checkpoint, checkpoint)
 
-    def save_requests(self, requests: List[Any], file_path: Optional[Path] = None) -> None:
+        self.close()
+        self.details_log.unlink(missing_ok=True)
+        self._details_logged = 0
+
+    def append_details(self, details: Iterable[Any]) -> int:
+        """
+        Append a batch of building details to the checkpoint log.
+
+        Only the new details are written, one JSON line each, so a checkpoint
+        costs O(batch) instead of rewriting every detail fetched so far. On
+        load the log is replayed over the last snapshot (last write wins).
+
+        Returns:
+            Number of details logged since the last snapshot, so the caller
+            can decide when to compact the log with save_details()
+        """
+        lines = [
+            orjson.dumps(asdict(d) if hasattr(d, '__dataclass_fields__') else d)
+            for d in details
+        ]
+        if not lines:
+            return self._details_logged
+
+        if self._details_log_file is None:
+            self._open_details_log()
+        self._details_log_file.write(b"\n".join(lines) + b"\n")
+        self._details_log_file.flush()
+        self._details_logged += len(lines)
+        return self._details_logged
+
+    def close(self) -> None:
+        """Close the details log, if it is open."""
+        if self._details_log_file is not None:
+            self._details_log_file.close()
+            self._details_log_file = None
+
+    def _open_details_log(self) -> None:
+        """Open the details log for appending, starting a new one if it is missing or stale."""
+        lines = self._read_details_log()
+        if lines is not None:
+            self._details_log_file = open(self.details_log, 'ab+')
+            self._details_logged = len(lines)
+            self._details_log_file.seek(-1, os.SEEK_END)
+            if self._details_log_file.read(1) != b"\n":
+                # Finish a line cut short by an interrupted write
+                self._details_log_file.write(b"\n")
+            return
+
+        self._details_log_file = open(self.details_log, 'wb')
+        self._details_log_file.write(orjson.dumps({
+            "city": self.city_name,
+            "config_hash": self.config_hash,
+            "checkpoint_at": datetime.now().isoformat(),
+        }) + b"\n")
+        self._details_logged = 0
+
+    def _read_details_log(self) -> Optional[List[bytes]]:
+        """
+        Read the detail lines of the details log.
+
+        Returns:
+            One JSON line per logged detail, or None if the log is missing or
+            its header line was written under a different configuration
+        """
+        if not self.details_log.exists():
+            return None
+
+        header, _, body = self.details_log.read_bytes().partition(b"\n")
+        try:
+            saved_hash = orjson.loads(header).get("config_hash")
+        except orjson.JSONDecodeError:
+            return None
+        if saved_hash and self.config_hash and saved_hash != self.config_hash:
+            return None
+        return body.splitlines()
+
+    def save_requests(self, requests: Collection[Any], file_path: Optional[Path] = None) -> None:
         """Save request details checkpoint."""
         path = file_path or self.requests_checkpoint
         success_count = sum(1 for r in requests if getattr(r, 'fetch_status', None) == 'success')
@@ -67,6 +177,7 @@ class CheckpointManager:
         output = {
             "city": self.city_name,
             "city_en": self.city_name_en,
+            "config_hash": self.config_hash,
             "fetched_at": datetime.now().isoformat(),
             "total_records": len(requests),
             "success_count": success_count,
@@ -83,18 +194,30 @@ class CheckpointManager:
             Dictionary with 'details' key containing list of detail dicts,
             or empty dict if no checkpoint exists
         """
-        if not self.details_checkpoint.exists():
-            return {}
+        data = {}
+        if self.details_checkpoint.exists():
+            try:
+                snapshot = self._read_json(self.details_checkpoint)
+                if 'details' in snapshot and self.is_compatible(snapshot, self.details_checkpoint):
+                    data = snapshot
+            except Exception as e:
+                logger.warning(f"Failed to load checkpoint: {e}")
 
-        try:
-            data = self._read_json(self.details_checkpoint)
-            if 'details' in data:
-                logger.info(f"Loaded {len(data['details'])} records from checkpoint")
-                return data
-        except Exception as e:
-            logger.warning(f"Failed to load checkpoint: {e}")
+        # Replay details appended since the snapshot; last write wins
+        lines = self._read_details_log()
+        if lines:
+            details = {d['tik_number']: d for d in data.get('details', [])}
+            for line in lines:
+                try:
+                    d = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # Line cut short by an interrupted write
+                details[d['tik_number']] = d
+            data = {**data, 'details': list(details.values())}
 
-        return {}
+        if data:
+            logger.info(f"Loaded {len(data['details'])} records from checkpoint")
+        return data
 
     def load_requests_checkpoint(self, file_path: Optional[Path] = None) -> Dict[str, Any]:
         """
@@ -110,7 +233,7 @@ class CheckpointManager:
 
         try:
             data = self._read_json(path)
-            if 'records' in data:
+            if 'records' in data and self.is_compatible(data, path):
                 logger.info(f"Loaded {len(data['records'])} request details from cache")
                 return data
         except Exception as e:
@@ -118,12 +241,67 @@ class CheckpointManager:
 
         return {}
 
+    def load_data_file(self, path: Path) -> Dict[str, Any]:
+        """
+        Load a previously exported data file (e.g. building_records.json).
+
+        Returns:
+            The file contents, or empty dict if the file is missing, unreadable
+            or was written under a different city configuration
+        """
+        if not path.exists():
+            return {}
+
+        try:
+            data = self._read_json(path)
+            if self.is_compatible(data, path):
+                return data
+        except Exception as e:
+            logger.warning(f"Failed to load {path.name}: {e}")
+
+        return {}
+
+    def is_compatible(self, data: Dict[str, Any], path: Path) -> bool:
+        """
+        Check that saved data can be resumed under the current configuration.
+
+        Files whose config_hash differs from the current one are rejected so
+        the caller starts fresh. Files older than CHECKPOINT_MAX_AGE_HOURS are
+        still used, but a warning suggests re-fetching with --force. Files
+        written before config hashes were recorded are accepted as-is.
+        """
+        saved_hash = data.get("config_hash")
+        if saved_hash and self.config_hash and saved_hash != self.config_hash:
+            logger.warning(f"{path.name} was written with a different city configuration; ignoring it")
+            return False
+
+        saved_at = next((data[k] for k in _TIMESTAMP_KEYS if data.get(k)), None)
+        if saved_at:
+            try:
+                age_hours = (datetime.now() - datetime.fromisoformat(saved_at)).total_seconds() / 3600
+            except ValueError:
+                age_hours = 0
+            if age_hours > CHECKPOINT_MAX_AGE_HOURS:
+                logger.warning(
+                    f"{path.name} is {age_hours:.0f}h old; resuming from it. "
+                    f"Use --force to re-fetch fresh data"
+                )
+
+        return True
+
     def _write_json(self, path: Path, data: Dict) -> None:
-        """Write data to JSON file."""
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """
+        Write data to JSON file atomically.
+
+        The data is written to a temporary file next to the target and then
+        renamed over it, so an interrupted write never leaves a truncated
+        checkpoint behind.
+        """
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, path)
 
     def _read_json(self, path: Path) -> Dict:
         """Read data from JSON file."""
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
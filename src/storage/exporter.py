@@ -5,21 +5,29 @@ Handles exporting crawled data to CSV and JSON formats.
 """
 
 import csv
-import json
-from dataclasses import asdict
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+import orjson
 
 from src.utils.logging import get_logger
 
 logger = get_logger()
 
 
+def _fetch_status(record: Any) -> Optional[str]:
+    """Get fetch_status from a dataclass instance or a raw dict."""
+    if isinstance(record, dict):
+        return record.get('fetch_status')
+    return getattr(record, 'fetch_status', None)
+
+
 class DataExporter:
     """Exports crawled data to various formats."""
 
-    def __init__(self, output_dir: Path, city_name: str, city_name_en: str):
+    def __init__(self, output_dir: Path, city_name: str, city_name_en: str, config_hash: str = ""):
         """
         Initialize data exporter.
 
@@ -27,10 +35,12 @@ class DataExporter:
             output_dir: Directory for output files
             city_name: Hebrew city name (for metadata)
             city_name_en: English city name (for metadata)
+            config_hash: Hash of the city config, stored so reloads can be validated
         """
         self.output_dir = output_dir
         self.city_name = city_name
         self.city_name_en = city_name_en
+        self.config_hash = config_hash
 
     def export_streets(self, streets: List[Dict], new_streets: List[Dict] = None,
                        previous_total: int = 0) -> Path:
@@ -53,54 +63,41 @@ class DataExporter:
 
     def export_records(self, records: List[Any]) -> Path:
         """Export building records to JSON."""
-        output = {
+        header = {
             "city": self.city_name,
             "city_en": self.city_name_en,
+            "config_hash": self.config_hash,
             "crawled_at": datetime.now().isoformat(),
-            "total_records": len(records),
-            "records": [asdict(r) if hasattr(r, '__dataclass_fields__') else r for r in records]
         }
 
         records_file = self.output_dir / "building_records.json"
-        self._write_json(records_file, output)
+        self._write_records_json(records_file, header, records)
         return records_file
 
-    def export_details(self, details: List[Any]) -> Path:
-        """Export building details to JSON."""
-        success_count = sum(1 for d in details if getattr(d, 'fetch_status', None) == 'success')
-        error_count = sum(1 for d in details if getattr(d, 'fetch_status', None) == 'error')
-
-        output = {
+    def export_details(self, details: Iterable[Any]) -> Path:
+        """Export building details (BuildingDetail objects or plain dicts) to JSON."""
+        header = {
             "city": self.city_name,
             "city_en": self.city_name_en,
+            "config_hash": self.config_hash,
             "fetched_at": datetime.now().isoformat(),
-            "total_records": len(details),
-            "success_count": success_count,
-            "error_count": error_count,
-            "records": [asdict(d) if hasattr(d, '__dataclass_fields__') else d for d in details]
         }
 
         details_file = self.output_dir / "building_details.json"
-        self._write_json(details_file, output)
+        self._write_records_json(details_file, header, details, with_status_counts=True)
         return details_file
 
-    def export_requests(self, requests: List[Any]) -> Path:
+    def export_requests(self, requests: Iterable[Any]) -> Path:
         """Export request details to JSON."""
-        success_count = sum(1 for r in requests if getattr(r, 'fetch_status', None) == 'success')
-        error_count = sum(1 for r in requests if getattr(r, 'fetch_status', None) == 'error')
-
-        output = {
+        header = {
             "city": self.city_name,
             "city_en": self.city_name_en,
+            "config_hash": self.config_hash,
             "fetched_at": datetime.now().isoformat(),
-            "total_records": len(requests),
-            "success_count": success_count,
-            "error_count": error_count,
-            "records": [asdict(r) if hasattr(r, '__dataclass_fields__') else r for r in requests]
         }
 
         requests_file = self.output_dir / "request_details.json"
-        self._write_json(requests_file, output)
+        self._write_records_json(requests_file, header, requests, with_status_counts=True)
         return requests_file
 
     def export_csv(self, details: List[Any], request_details: Optional[List[Any]] = None) -> List[Path]:
@@ -239,7 +236,37 @@ class DataExporter:
 
         return exported
 
+    def _write_records_json(self, path: Path, header: Dict, records: Iterable[Any],
+                            with_status_counts: bool = False) -> None:
+        """
+        Stream records (dataclasses or dicts) to a JSON file, one per line.
+
+        The file holds the header fields, a "records" array and then the
+        totals, which are counted while writing. Records are serialized one
+        at a time, so no full copy of the data set is built in memory. The
+        file is written to a temporary path and renamed into place.
+        """
+        total = success = errors = 0
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            # Reopen the header object to append the records array to it
+            f.write(orjson.dumps(header)[:-1] + b',"records":[')
+            for record in records:
+                f.write(b",\n" if total else b"\n")
+                f.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS))
+                total += 1
+                if with_status_counts:
+                    status = _fetch_status(record)
+                    success += status == 'success'
+                    errors += status == 'error'
+
+            totals = {"total_records": total}
+            if with_status_counts:
+                totals.update(success_count=success, error_count=errors)
+            f.write(b"\n]," + orjson.dumps(totals)[1:] + b"\n")
+        os.replace(tmp_path, path)
+
     def _write_json(self, path: Path, data: Dict) -> None:
-        """Write data to JSON file."""
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """Write data to JSON file (UTF-8, Hebrew text left unescaped)."""
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
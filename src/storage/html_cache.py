@@ -0,0 +1,128 @@
+"""
+On-disk cache of raw HTML pages.
+
+Checkpoints store parsed results; this stores the pages they were parsed
+from, gzip-compressed, so a rerun (or a reparse after a parser change) can
+skip the network for anything fetched recently. Pages past their max age
+are revalidated with a conditional request when the server sent an ETag or
+Last-Modified header, so an unchanged page is never downloaded twice.
+"""
+
+import gzip
+import os
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Union
+
+import orjson
+
+from src.config import DEFAULT_SETTINGS
+
+HTML_CACHE_MAX_AGE_DAYS = DEFAULT_SETTINGS.html_cache_max_age_days
+
+# Response validator header -> conditional request header that sends it back
+VALIDATOR_HEADERS = {
+    "ETag": "If-None-Match",
+    "Last-Modified": "If-Modified-Since",
+}
+
+
+class HtmlCache:
+    """
+    Gzipped HTML pages keyed by id (e.g. tik number), one file per page.
+
+    Holds only a directory path, so it pickles cheaply into worker processes.
+    """
+
+    def __init__(self, cache_dir: Path, max_age_days: float = HTML_CACHE_MAX_AGE_DAYS):
+        """
+        Initialize HTML cache.
+
+        Args:
+            cache_dir: Directory for cached pages (created if missing)
+            max_age_days: Pages older than this are treated as missing
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_age = max_age_days * 86400
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def path(self, key: str) -> Path:
+        """Get the cache file path for a page."""
+        return self.cache_dir / f"{key}.html.gz"
+
+    def validators_path(self, key: str) -> Path:
+        """Get the path of the response validators stored for a page."""
+        return self.cache_dir / f"{key}.validators.json"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get a cached page.
+
+        Returns:
+            The page bytes, or None if it is not cached, expired or unreadable
+        """
+        path = self.path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                return None
+            return gzip.decompress(path.read_bytes())
+        except (OSError, EOFError):
+            return None
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """
+        Get the headers for revalidating a cached page.
+
+        Returns:
+            If-None-Match / If-Modified-Since headers echoing the validators
+            the page was served with, or {} if there is nothing to revalidate
+        """
+        if not self.path(key).exists():
+            return {}
+        try:
+            validators = orjson.loads(self.validators_path(key).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return {VALIDATOR_HEADERS[k]: v for k, v in validators.items() if k in VALIDATOR_HEADERS}
+
+    def refresh(self, key: str) -> Optional[bytes]:
+        """
+        Mark a cached page as current again after the server answered 304.
+
+        Returns:
+            The page bytes regardless of age, or None if it is unreadable
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+            return gzip.decompress(path.read_bytes())
+        except (OSError, EOFError):
+            return None
+
+    def put(self, key: str, html: Union[str, bytes], response_headers: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Cache a page, replacing any earlier copy atomically.
+
+        Args:
+            key: Page id
+            html: Page HTML
+            response_headers: Headers the page was served with; its ETag and
+                Last-Modified are kept for conditional requests
+        """
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+
+        path = self.path(key)
+        tmp_path = path.with_suffix('.tmp')
+        # Level 1: most of the size reduction for a fraction of the CPU
+        tmp_path.write_bytes(gzip.compress(html, compresslevel=1))
+        os.replace(tmp_path, path)
+
+        validators = {
+            k: response_headers[k] for k in VALIDATOR_HEADERS
+            if response_headers is not None and k in response_headers
+        }
+        if validators:
+            self.validators_path(key).write_bytes(orjson.dumps(validators))
+        else:
+            self.validators_path(key).unlink(missing_ok=True)